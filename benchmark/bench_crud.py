@@ -0,0 +1,369 @@
+# --------------------------------------------------------------------------
+# crud._base의 generic CRUD 함수와 응답 schema 검증의 호출당 비용을 재는
+# microbenchmark 모듈입니다.
+#
+# 각 case는 warmup 뒤 --repeat번의 round를 돌며, round마다 --number번 호출한 평균을
+# 호출당 시간(µs)으로 기록하고 round들의 min/median/mean/stdev/p95를 요약합니다.
+# CRUD case는 API와 같이 호출마다 새 AsyncSession을 쓰므로 session 생성 비용과
+# 설정된 DB(.env / POSTGRES_*)까지의 왕복이 포함되며, schema case는 DB 없이
+# 메모리 안에서만 실행됩니다. 벤치마크용으로 넣은 행은 끝나면 삭제합니다.
+#
+# 결과는 benchmark/baselines/bench_crud.json의 baseline과 median 기준으로 비교하며,
+# --threshold(기본 25%)보다 느려진 case가 있으면 exit code 1로 끝나 CI에서 막을 수 있습니다.
+# baseline은 실행 환경에 따라 달라지므로 CI 장비에서 --save-baseline으로 갱신합니다.
+#
+# 실행: python -m benchmark.bench_crud [--filter schema] [--threshold 0.25] [--save-baseline]
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+import uuid
+
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.crud._base import (
+    create_object,
+    delete_object,
+    get_object,
+    get_objects,
+    update_object,
+)
+from src.db.database import engine
+from src.db.models import ItineraryRequest, Listing, User
+from src.schemas.requests import ListingCreate, ListingUpdate
+from src.schemas.responses import ItineraryRequestSchema, ListingSchema, UserSchema
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "bench_crud.json"
+
+
+class Case:
+    """
+    하나의 측정 대상입니다.
+
+    call은 한 번의 호출이며, prepare가 있으면 매 호출 전에 측정 구간 밖에서 실행해
+    그 결과를 call의 인자로 넘깁니다. (예: delete할 행을 미리 넣어 두기)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        call: Callable[..., Any],
+        prepare: Optional[Callable[[], Awaitable[Any]]] = None,
+        is_async: bool = True,
+    ):
+        self.name = name
+        self.call = call
+        self.prepare = prepare
+        self.is_async = is_async
+
+    async def run_round(self, number: int) -> float:
+        """number번 호출한 시간의 합(ns)을 반환합니다."""
+        if not self.is_async:
+            started = time.perf_counter_ns()
+            for _ in range(number):
+                self.call()
+            return time.perf_counter_ns() - started
+
+        total = 0
+        for _ in range(number):
+            args = () if self.prepare is None else (await self.prepare(),)
+            started = time.perf_counter_ns()
+            await self.call(*args)
+            total += time.perf_counter_ns() - started
+        return total
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    p95 = ordered[min(int(round(0.95 * (len(ordered) - 1))), len(ordered) - 1)]
+    return {
+        "min_us": round(ordered[0], 3),
+        "median_us": round(statistics.median(ordered), 3),
+        "mean_us": round(statistics.fmean(ordered), 3),
+        "stdev_us": round(statistics.stdev(ordered), 3) if len(ordered) > 1 else 0.0,
+        "p95_us": round(p95, 3),
+    }
+
+
+async def measure(case: Case, warmup: int, repeat: int, number: int) -> Dict:
+    for _ in range(warmup):
+        await case.run_round(number)
+    samples = [await case.run_round(number) / number / 1000 for _ in range(repeat)]
+    return {"rounds": repeat, "number": number, **summarize(samples)}
+
+
+def listing_row(seller_id: uuid.UUID, now: datetime) -> Dict[str, Any]:
+    return {
+        "seller_id": seller_id,
+        "created_at": now,
+        "is_closed": False,
+        "detail": "서울 고궁 투어 가이드",
+        "seller_info": "K-Buddy 가이드",
+        "promotion_start": now,
+        "promotion_end": now + timedelta(days=7),
+        "amount": 10000,
+    }
+
+
+def itinerary_request_row(listing_id: uuid.UUID) -> Dict[str, Any]:
+    return {
+        "id": uuid.uuid4(),
+        "listing_id": listing_id,
+        "order_id": uuid.uuid4(),
+        "request_user_id": uuid.uuid4(),
+        "first_name": "Gildong",
+        "last_name": "Hong",
+        "birthday": date(1990, 1, 1),
+        "person_under": 1,
+        "person_over": 2,
+        "contact_method": "email",
+        "contact": "bench@example.com",
+        "travel_start": date(2025, 5, 1),
+        "travel_end": date(2025, 5, 5),
+        "travel_purpose": "Vacation",
+        "travel_pri": ["Activities", "Cuisine"],
+        "transport_pri": ["Public"],
+        "travel_restrict": None,
+        "travel_addi": None,
+    }
+
+
+def user_row() -> Dict[str, Any]:
+    return {
+        "id": uuid.uuid4(),
+        "email": f"bench-{uuid.uuid4().hex[:12]}@example.com",
+        "password": "$2b$12$" + "a" * 53,
+        "nickname": f"bench{uuid.uuid4().hex[:8]}",
+        "create_at": datetime.utcnow(),
+        "bio": "bench user",
+        "point": 0,
+        "profile_img": None,
+        "first_name": "Gildong",
+        "last_name": "Hong",
+    }
+
+
+def schema_cases() -> List[Case]:
+    seller_id = uuid.uuid4()
+    listing = {"id": uuid.uuid4(), **listing_row(seller_id, datetime.utcnow())}
+    itinerary_request = itinerary_request_row(listing["id"])
+    user = user_row()
+
+    cases = []
+    for schema, model, row in (
+        (ListingSchema, Listing, listing),
+        (ItineraryRequestSchema, ItineraryRequest, itinerary_request),
+        (UserSchema, User, user),
+    ):
+        orm_obj = model(**row)
+        cases += [
+            Case(
+                f"schema.{schema.__name__}.from_dict",
+                lambda schema=schema, row=row: schema.model_validate(row),
+                is_async=False,
+            ),
+            Case(
+                f"schema.{schema.__name__}.from_orm_dict",
+                lambda schema=schema, obj=orm_obj: schema.model_validate(obj.__dict__),
+                is_async=False,
+            ),
+            Case(
+                f"schema.{schema.__name__}.from_attributes",
+                lambda schema=schema, obj=orm_obj: schema.model_validate(obj),
+                is_async=False,
+            ),
+        ]
+    return cases
+
+
+def crud_cases(seller_id: uuid.UUID, listing_id: uuid.UUID) -> List[Case]:
+    async def new_listing() -> uuid.UUID:
+        row = {"id": uuid.uuid4(), **listing_row(seller_id, datetime.utcnow())}
+        async with engine.begin() as conn:
+            await conn.execute(insert(Listing), row)
+        return row["id"]
+
+    async def call_get_object() -> None:
+        async with AsyncSession(bind=engine) as db:
+            await get_object(db, Listing, listing_id, ListingSchema)
+
+    async def call_get_objects() -> None:
+        async with AsyncSession(bind=engine) as db:
+            await get_objects(
+                db,
+                Listing,
+                ListingSchema,
+                condition=Listing.seller_id == seller_id,
+                limit=20,
+            )
+
+    async def call_create_object() -> None:
+        async with AsyncSession(bind=engine) as db:
+            await create_object(
+                db,
+                Listing,
+                ListingCreate(**listing_row(seller_id, datetime.utcnow())),
+                ListingSchema,
+            )
+
+    async def call_update_object() -> None:
+        now = datetime.utcnow()
+        async with AsyncSession(bind=engine) as db:
+            await update_object(
+                db,
+                Listing,
+                listing_id,
+                ListingUpdate(
+                    is_closed=False,
+                    detail="수정된 서울 고궁 투어 가이드",
+                    seller_info="K-Buddy 가이드",
+                    promotion_start=now,
+                    promotion_end=now + timedelta(days=7),
+                    amount=12000,
+                ),
+                ListingSchema,
+            )
+
+    async def call_delete_object(model_id: uuid.UUID) -> None:
+        async with AsyncSession(bind=engine) as db:
+            await delete_object(db, Listing, model_id)
+
+    return [
+        Case("crud.get_object", call_get_object),
+        Case("crud.get_objects[20]", call_get_objects),
+        Case("crud.create_object", call_create_object),
+        Case("crud.update_object", call_update_object),
+        Case("crud.delete_object", call_delete_object, prepare=new_listing),
+    ]
+
+
+def compare(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float
+) -> List[str]:
+    """baseline보다 median이 threshold 비율을 넘게 느려진 case 이름을 반환합니다."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        ratio = result["median_us"] / base["median_us"]
+        result["baseline_median_us"] = base["median_us"]
+        result["change"] = round(ratio - 1, 4)
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Dict]:
+    results: Dict[str, Dict] = {}
+
+    def selected(cases: List[Case]) -> List[Case]:
+        return [case for case in cases if not args.filter or args.filter in case.name]
+
+    for case in selected(schema_cases()):
+        results[case.name] = await measure(
+            case, args.warmup, args.repeat, args.number * 10
+        )
+
+    seller_id = uuid.uuid4()
+    listing = {"id": uuid.uuid4(), **listing_row(seller_id, datetime.utcnow())}
+    cases = selected(crud_cases(seller_id, listing["id"]))
+    if not cases:
+        return results
+
+    # get_objects가 한 페이지(20건)를 읽을 수 있도록 같은 판매자의 판매글을 채워 둡니다.
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(Listing),
+            [listing]
+            + [
+                {"id": uuid.uuid4(), **listing_row(seller_id, datetime.utcnow())}
+                for _ in range(19)
+            ],
+        )
+    try:
+        for case in cases:
+            results[case.name] = await measure(
+                case, args.warmup, args.repeat, args.number
+            )
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(delete(Listing).where(Listing.seller_id == seller_id))
+        await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--warmup", type=int, default=2, help="warmup rounds")
+    parser.add_argument("--repeat", type=int, default=15, help="measured rounds")
+    parser.add_argument(
+        "--number",
+        type=int,
+        default=20,
+        help="calls per round (schema cases use 10x)",
+    )
+    parser.add_argument("--filter", type=str, default=None)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--output", type=str, default=None)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        saved = {}
+        if args.baseline.exists():
+            saved = json.loads(args.baseline.read_text())
+        saved.update(
+            {
+                "python": platform.python_version(),
+                "platform": platform.platform(terse=True),
+                "cases": {
+                    **saved.get("cases", {}),
+                    **{
+                        name: {"median_us": result["median_us"]}
+                        for name, result in results.items()
+                    },
+                },
+            }
+        )
+        args.baseline.write_text(json.dumps(saved, indent=2, sort_keys=True) + "\n")
+        regressions = []
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["cases"]
+        regressions = compare(results, baseline, args.threshold)
+    else:
+        regressions = []
+
+    report = {
+        "threshold": args.threshold,
+        "regressions": regressions,
+        "cases": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# --------------------------------------------------------------------------
+# 로그인 burst 상황에서 /ping 응답 지연을 측정하는 벤치마크 모듈입니다.
+#
+# 로그인 50건의 bcrypt 검증을 동시에 실행하면서 /ping 을 주기적으로 호출하고,
+# 검증을 이벤트 루프에서 직접 수행할 때(inline)와 password_hasher의
+# thread pool에서 수행할 때(pool)의 /ping p50/p99 지연을 비교합니다.
+#
+# 실행: python -m benchmark.bench_password_hashing [--logins 50]
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from httpx import AsyncClient
+
+from src import create_app
+from src.core.settings import settings
+from src.utils.authentication import (
+    get_password_hash,
+    password_hasher,
+    verify_password,
+)
+
+PING_URL = "/kbuddy/api/v1/ping"
+PING_INTERVAL = 0.01
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    index = min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+async def inline_login(hashed: str) -> bool:
+    # 기존 동작: async handler 안에서 bcrypt를 동기로 호출
+    return verify_password("password123", hashed)
+
+
+async def pooled_login(hashed: str) -> bool:
+    return await password_hasher.verify("password123", hashed)
+
+
+async def run_scenario(client: AsyncClient, login, hashed: str, logins: int) -> dict:
+    latencies: list[float] = []
+    burst_end: list[float] = []
+
+    async def pinger():
+        # 예정된 호출 시각 기준으로 지연을 측정해 루프가 멈춘 시간까지 반영합니다.
+        scheduled = time.perf_counter()
+        while not burst_end or scheduled < burst_end[0]:
+            await client.get(PING_URL)
+            latencies.append((time.perf_counter() - scheduled) * 1000)
+            scheduled += PING_INTERVAL
+            await asyncio.sleep(max(scheduled - time.perf_counter(), 0))
+
+    ping_task = asyncio.create_task(pinger())
+    await asyncio.sleep(PING_INTERVAL)
+    started = time.perf_counter()
+    await asyncio.gather(*(login(hashed) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    burst_end.append(time.perf_counter())
+    await ping_task
+
+    return {
+        "logins": logins,
+        "login_burst_seconds": round(elapsed, 3),
+        "ping_samples": len(latencies),
+        "ping_p50_ms": round(statistics.median(latencies), 3),
+        "ping_p99_ms": round(percentile(latencies, 0.99), 3),
+        "ping_max_ms": round(max(latencies), 3),
+    }
+
+
+async def main(logins: int) -> None:
+    app = create_app(settings)
+    hashed = get_password_hash("password123")
+
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        result = {
+            "thread_pool_size": password_hasher.max_workers,
+            "inline": await run_scenario(client, inline_login, hashed, logins),
+            "pool": await run_scenario(client, pooled_login, hashed, logins),
+        }
+    password_hasher.shutdown()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins))
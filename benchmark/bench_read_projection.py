@@ -0,0 +1,118 @@
+# --------------------------------------------------------------------------
+# 목록 조회를 ORM 객체로 읽을 때와 column projection으로 읽을 때를 비교하는
+# 벤치마크 모듈입니다.
+#
+# 설정된 DB의 Listing 테이블에 벤치마크용 판매글을 넣고, get_page를 projection
+# 여부만 바꿔 100/1000건 페이지로 반복 호출하면서 호출당 지연(p50/mean),
+# 프로세스 CPU 시간과 tracemalloc으로 측정한 최대 할당량(peak)을 비교합니다.
+# 넣은 판매글은 측정이 끝나면 삭제합니다.
+#
+# 실행: python -m benchmark.bench_read_projection [--pages 100 1000] [--rounds 50]
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import tracemalloc
+import uuid
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.crud._base import get_page
+from src.db.database import engine
+from src.db.models import Listing
+from src.schemas.responses import ListingSchema
+
+
+async def seed(seller_id: uuid.UUID, count: int) -> None:
+    now = datetime.utcnow()
+    rows = [
+        {
+            "seller_id": seller_id,
+            "created_at": now,
+            "is_closed": False,
+            "detail": "서울 고궁 투어 가이드 " * 10,
+            "seller_info": "K-Buddy 가이드",
+            "promotion_start": now,
+            "promotion_end": now + timedelta(days=7),
+            "amount": 10000 + i,
+        }
+        for i in range(count)
+    ]
+    async with engine.begin() as conn:
+        await conn.execute(insert(Listing), rows)
+
+
+async def read_page(seller_id: uuid.UUID, limit: int, projection: bool) -> int:
+    # 요청마다 새 session을 쓰는 API와 같이 매번 빈 identity map에서 시작합니다.
+    async with AsyncSession(bind=engine) as db:
+        page = await get_page(
+            db=db,
+            model=Listing,
+            response_model=ListingSchema,
+            condition=Listing.seller_id == seller_id,
+            limit=limit,
+            projection=projection,
+        )
+    return len(page.items)
+
+
+async def measure(seller_id: uuid.UUID, limit: int, projection: bool, rounds: int):
+    await read_page(seller_id, limit, projection)
+
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await read_page(seller_id, limit, projection)
+        samples.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    await read_page(seller_id, limit, projection)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.process_time()
+    for _ in range(rounds):
+        await read_page(seller_id, limit, projection)
+    cpu = (time.process_time() - started) * 1000 / rounds
+
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "cpu_ms": round(cpu, 3),
+        "peak_kib": round((peak - before) / 1024, 1),
+    }
+
+
+async def main(pages: list[int], rounds: int) -> None:
+    seller_id = uuid.uuid4()
+    await seed(seller_id, max(pages))
+    try:
+        result = {}
+        for limit in pages:
+            result[f"{limit}_rows"] = {
+                "orm": await measure(seller_id, limit, False, rounds),
+                "projection": await measure(seller_id, limit, True, rounds),
+            }
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(delete(Listing).where(Listing.seller_id == seller_id))
+        await engine.dispose()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.pages, args.rounds))
@@ -0,0 +1,120 @@
+# --------------------------------------------------------------------------
+# 100건짜리 /listing/ 페이지의 응답 직렬화 시간을 측정하는 벤치마크 모듈입니다.
+#
+# 같은 ListingSchema 목록을 기존 경로(FastAPI가 response_model로 다시 검증한 뒤
+# jsonable_encoder + json으로 인코딩)와 새 경로(미리 만든 TypeAdapter로 바로
+# 직렬화)로 각각 응답 본문까지 만들어 보고, 요청당 소요 시간을 비교합니다.
+# ORM 객체에서 schema를 만드는 단계(__dict__ / from_attributes)도 함께 측정합니다.
+#
+# 실행: python -m benchmark.bench_serialization [--items 100] [--rounds 2000]
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.crud._base import Page
+from src.db.models import Listing
+from src.router._pagination import paginate
+from src.schemas.responses import ListingSchema
+
+
+def make_listings(count: int) -> List[Listing]:
+    now = datetime.utcnow()
+    return [
+        Listing(
+            id=uuid.uuid4(),
+            seller_id=uuid.uuid4(),
+            created_at=now,
+            is_closed=False,
+            detail="서울 고궁 투어 가이드 " * 10,
+            seller_info="K-Buddy 가이드",
+            promotion_start=now,
+            promotion_end=now + timedelta(days=7),
+            amount=10000 + i,
+        )
+        for i in range(count)
+    ]
+
+
+def measure(func, rounds: int) -> dict:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return {
+        "mean_us": round(statistics.fmean(samples), 1),
+        "p50_us": round(statistics.median(samples), 1),
+    }
+
+
+def main(items: int, rounds: int) -> None:
+    listings = make_listings(items)
+    page = Page(
+        items=[ListingSchema.model_validate(item.__dict__) for item in listings],
+        next_cursor=None,
+    )
+    field = create_response_field(name="Response", type_=List[ListingSchema])
+    loop = asyncio.new_event_loop()
+
+    def fastapi_default(response_class):
+        # 핸들러가 schema 목록을 반환했을 때 FastAPI가 응답 본문을 만드는 경로입니다.
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=page.items)
+        )
+        return response_class(content).body
+
+    def type_adapter():
+        return paginate(page, ListingSchema).body
+
+    before = fastapi_default(JSONResponse)
+    after = type_adapter()
+    assert json.loads(before) == json.loads(after), "응답 본문이 달라졌습니다."
+
+    result = {
+        "items": items,
+        "rounds": rounds,
+        "body_bytes": len(after),
+        "build_schema": {
+            "from_dict": measure(
+                lambda: [ListingSchema.model_validate(o.__dict__) for o in listings],
+                rounds,
+            ),
+            "from_attributes": measure(
+                lambda: [ListingSchema.model_validate(o) for o in listings], rounds
+            ),
+        },
+        "serialize": {
+            "before_revalidate_json": measure(
+                lambda: fastapi_default(JSONResponse), rounds
+            ),
+            "before_revalidate_orjson": measure(
+                lambda: fastapi_default(ORJSONResponse), rounds
+            ),
+            "after_type_adapter": measure(type_adapter, rounds),
+        },
+    }
+    loop.close()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.items, args.rounds)
@@ -0,0 +1,482 @@
+# --------------------------------------------------------------------------
+# 주요 사용자 시나리오를 HTTP로 재현하는 부하 테스트 모듈입니다.
+#
+# create_app으로 만든 서버를 별도 프로세스의 uvicorn으로 띄우고(로컬 Postgres 사용),
+# Tour API는 이 프로세스 안의 stub HTTP 서버로 대신합니다.
+# 가상 사용자(virtual user)마다 회원 가입/로그인 후 판매글 조회, 주문 생성,
+# 포인트 적립/잔액 조회, 여행기 요청 CRUD, 지역 큐레이션을 가중치에 따라 섞어 호출하고,
+# route별 처리량, p50/p95/p99 지연과 에러율을 JSON으로 출력합니다.
+#
+# 실행: python -m benchmark.loadtest [--users 20] [--duration 30] [--output result.json]
+#
+# DB 설정은 서버와 같은 .env / 환경 변수(POSTGRES_*)를 사용하며, 부하 테스트가 만든
+# 데이터는 지우지 않으므로 전용 DB를 쓰는 것이 좋습니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import socket
+import subprocess
+import time
+import uuid
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import httpx
+import uvicorn
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+API_PREFIX = "/kbuddy/api/v1"
+
+# 가상 사용자가 로그인 후 한 번의 반복에서 고르는 시나리오와 가중치입니다.
+SCENARIO_WEIGHTS = {
+    "browse_listings": 40,
+    "view_listing": 15,
+    "create_order": 10,
+    "point_balance": 15,
+    "itinerary_request_crud": 10,
+    "curate": 10,
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    index = min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def create_stub_tour_api(latency: float) -> Starlette:
+    from src.utils.tour_api import StubTourAPIUpstream, TourAPIError
+
+    upstream = StubTourAPIUpstream()
+
+    async def fetch(request: Request) -> JSONResponse:
+        await asyncio.sleep(latency)
+        try:
+            body = await upstream.fetch(
+                request.path_params["operation"], dict(request.query_params)
+            )
+        except TourAPIError as e:
+            return JSONResponse({"error": e.message}, status_code=e.status_code)
+        return JSONResponse(body)
+
+    return Starlette(routes=[Route("/{operation}", fetch)])
+
+
+def serve_app(port: int, tour_api_endpoint: str, init_db: bool) -> None:
+    """부하 테스트 대상 서버 프로세스의 진입점입니다."""
+    from src import create_app, init_logger
+    from src.core.settings import AppSettings
+    from src.db._base import Base
+    from src.db.database import engine
+    from src.utils.tour_api import HTTPTourAPIUpstream, TourAPIClient, get_tour_api
+
+    app_settings = AppSettings(
+        DATABASE_MIGRATION_CHECK=False, LOGGING_DEBUG_LEVEL=False
+    )
+    init_logger(app_settings)
+
+    if init_db:
+
+        async def create_tables() -> None:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            await engine.dispose()
+
+        asyncio.run(create_tables())
+
+    tour_api = TourAPIClient(
+        upstream=HTTPTourAPIUpstream(
+            endpoint=tour_api_endpoint, service_key="loadtest"
+        ),
+        area_code_ttl=app_settings.TOUR_API_AREA_CODE_TTL_SECONDS,
+        area_list_ttl=app_settings.TOUR_API_AREA_LIST_TTL_SECONDS,
+        stale_ttl=app_settings.TOUR_API_STALE_TTL_SECONDS,
+    )
+    app = create_app(app_settings)
+    app.dependency_overrides[get_tour_api] = lambda: tour_api
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, name: str, elapsed: float, status: str, failed: bool) -> None:
+        self.latencies[name].append(elapsed * 1000)
+        self.statuses[name][status] += 1
+        if failed:
+            self.errors[name] += 1
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        routes = {}
+        for name in sorted(self.latencies):
+            samples = sorted(self.latencies[name])
+            routes[name] = {
+                "requests": len(samples),
+                "errors": self.errors[name],
+                "error_rate": round(self.errors[name] / len(samples), 4),
+                "throughput_rps": round(len(samples) / elapsed, 2),
+                "p50_ms": round(percentile(samples, 0.50), 2),
+                "p95_ms": round(percentile(samples, 0.95), 2),
+                "p99_ms": round(percentile(samples, 0.99), 2),
+                "max_ms": round(samples[-1], 2),
+                "statuses": dict(self.statuses[name]),
+            }
+        total = sum(route["requests"] for route in routes.values())
+        errors = sum(route["errors"] for route in routes.values())
+        return {
+            "requests": total,
+            "errors": errors,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "throughput_rps": round(total / elapsed, 2),
+            "routes": routes,
+        }
+
+
+class VirtualUser:
+    def __init__(
+        self,
+        index: int,
+        base_url: str,
+        recorder: Recorder,
+        listing_ids: List[str],
+        limits: httpx.Limits,
+    ):
+        self.index = index
+        self.recorder = recorder
+        self.listing_ids = listing_ids
+        self.client = httpx.AsyncClient(
+            base_url=base_url + API_PREFIX, limits=limits, timeout=30.0
+        )
+        self.user_id: Optional[str] = None
+        self.email = f"loadtest-{uuid.uuid4().hex[:12]}@example.com"
+
+    async def request(
+        self, name: str, method: str, url: str, **kwargs: Any
+    ) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.recorder.record(
+                name, time.perf_counter() - started, type(e).__name__, True
+            )
+            return None
+        self.recorder.record(
+            name,
+            time.perf_counter() - started,
+            str(response.status_code),
+            response.status_code >= 400,
+        )
+        return response
+
+    async def signup_and_login(self) -> bool:
+        password = "loadtest-password"
+        response = await self.request(
+            "POST /user/signup",
+            "POST",
+            "/user/signup",
+            json={
+                "email": self.email,
+                "password": password,
+                "nickname": f"loadtest{self.index}-{uuid.uuid4().hex[:6]}",
+                "bio": "load test user",
+                "first_name": "Load",
+                "last_name": "Test",
+            },
+        )
+        if response is None or response.status_code != 200:
+            return False
+        self.user_id = response.json()["id"]
+        response = await self.request(
+            "POST /user/login",
+            "POST",
+            "/user/login",
+            json={"identifier": self.email, "password": password},
+        )
+        if response is None or response.status_code != 200:
+            return False
+
+        now = datetime.utcnow()
+        await self.request(
+            "POST /point/events",
+            "POST",
+            "/point/events",
+            json={
+                "user_id": self.user_id,
+                "event_type": "earn",
+                "amount": 1000,
+                "detail": "load test signup bonus",
+                "event_date": now.isoformat(),
+                "exp_date": (now + timedelta(days=365)).isoformat(),
+            },
+        )
+        return True
+
+    async def browse_listings(self) -> None:
+        response = await self.request(
+            "GET /listing/", "GET", "/listing/", params={"limit": 20}
+        )
+        cursor = response.headers.get("X-Next-Cursor") if response else None
+        if cursor:
+            await self.request(
+                "GET /listing/?cursor",
+                "GET",
+                "/listing/",
+                params={"limit": 20, "cursor": cursor},
+            )
+
+    async def view_listing(self) -> None:
+        listing_id = random.choice(self.listing_ids)
+        await self.request("GET /listing/{id}", "GET", f"/listing/{listing_id}")
+
+    async def create_order(self) -> Optional[Dict[str, Any]]:
+        response = await self.request(
+            "POST /order/",
+            "POST",
+            "/order/",
+            json={
+                "amount": random.randint(100, 1000),
+                "is_refunded": False,
+                "buyer_id": self.user_id,
+                "listing_id": random.choice(self.listing_ids),
+            },
+        )
+        if response is None or response.status_code != 200:
+            return None
+        return response.json()
+
+    async def point_balance(self) -> None:
+        await self.request(
+            "GET /point/user/{id}/balance",
+            "GET",
+            f"/point/user/{self.user_id}/balance",
+        )
+
+    async def itinerary_request_crud(self) -> None:
+        order = await self.create_order()
+        if order is None:
+            return
+        payload = {
+            "listing_id": order["listing_id"],
+            "order_id": order["id"],
+            "request_user_id": self.user_id,
+            "first_name": "Load",
+            "last_name": "Test",
+            "birthday": date(1990, 1, 1).isoformat(),
+            "person_under": 1,
+            "person_over": 2,
+            "contact_method": "email",
+            "contact": self.email,
+            "travel_start": date(2025, 5, 1).isoformat(),
+            "travel_end": date(2025, 5, 5).isoformat(),
+            "travel_purpose": "Vacation",
+            "travel_pri": ["Activities", "Cuisine"],
+            "transport_pri": ["Public"],
+            "travel_restrict": "None",
+            "travel_addi": "None",
+        }
+        response = await self.request(
+            "POST /itinerary/request/", "POST", "/itinerary/request/", json=payload
+        )
+        if response is None or response.status_code != 200:
+            return
+        request_id = response.json()["id"]
+        await self.request(
+            "GET /itinerary/request/{id}", "GET", f"/itinerary/request/{request_id}"
+        )
+        await self.request(
+            "PUT /itinerary/request/{id}",
+            "PUT",
+            f"/itinerary/request/{request_id}",
+            json={**payload, "travel_addi": "Updated by load test"},
+        )
+        await self.request("GET /itinerary/request/", "GET", "/itinerary/request/")
+        await self.request(
+            "POST /itinerary/request/{id}/delete",
+            "POST",
+            f"/itinerary/request/{request_id}/delete",
+        )
+
+    async def curate(self) -> None:
+        await self.request("GET /area/curate", "GET", "/area/curate")
+
+    async def run(self, deadline: float) -> None:
+        scenarios = list(SCENARIO_WEIGHTS)
+        weights = list(SCENARIO_WEIGHTS.values())
+        while time.perf_counter() < deadline:
+            scenario = random.choices(scenarios, weights)[0]
+            await getattr(self, scenario)()
+
+
+async def seed_listings(base_url: str, count: int) -> List[str]:
+    now = datetime.utcnow()
+    listing_ids = []
+    async with httpx.AsyncClient(base_url=base_url + API_PREFIX) as client:
+        seller_id = str(uuid.uuid4())
+        for i in range(count):
+            response = await client.post(
+                "/listing/",
+                json={
+                    "seller_id": seller_id,
+                    "created_at": now.isoformat(),
+                    "is_closed": False,
+                    "detail": f"Load test listing {i}",
+                    "seller_info": "load test seller",
+                    "promotion_start": now.isoformat(),
+                    "promotion_end": (now + timedelta(days=30)).isoformat(),
+                    "amount": 10000 + i,
+                },
+            )
+            response.raise_for_status()
+            listing_ids.append(response.json()["id"])
+    return listing_ids
+
+
+async def wait_until_ready(base_url: str, timeout: float = 60.0) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while True:
+            try:
+                response = await client.get(f"{API_PREFIX}/ping")
+                if response.status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            if time.perf_counter() > deadline:
+                raise RuntimeError("Load test server did not start in time")
+            await asyncio.sleep(0.2)
+
+
+async def run_load(args: argparse.Namespace) -> Dict[str, Any]:
+    stub_port = free_port()
+    stub_server = uvicorn.Server(
+        uvicorn.Config(
+            create_stub_tour_api(args.upstream_latency_ms / 1000),
+            host="127.0.0.1",
+            port=stub_port,
+            log_level="warning",
+            access_log=False,
+        )
+    )
+    stub_task = asyncio.create_task(stub_server.serve())
+
+    app_port = free_port()
+    base_url = f"http://127.0.0.1:{app_port}"
+    server = multiprocessing.get_context("spawn").Process(
+        target=serve_app,
+        args=(app_port, f"http://127.0.0.1:{stub_port}", args.init_db),
+        daemon=True,
+    )
+    server.start()
+    users: List[VirtualUser] = []
+    try:
+        await wait_until_ready(base_url)
+        listing_ids = await seed_listings(base_url, args.listings)
+
+        # 회원 가입/로그인(bcrypt)은 측정 구간과 섞이지 않도록 먼저 끝내고 따로 집계합니다.
+        setup_recorder = Recorder()
+        limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+        users = [
+            VirtualUser(i, base_url, setup_recorder, listing_ids, limits)
+            for i in range(args.users)
+        ]
+        setup_started = time.perf_counter()
+        logged_in = await asyncio.gather(*(user.signup_and_login() for user in users))
+        setup_elapsed = time.perf_counter() - setup_started
+
+        recorder = Recorder()
+        active_users = [user for user, ok in zip(users, logged_in) if ok]
+        for user in active_users:
+            user.recorder = recorder
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(user.run(deadline) for user in active_users))
+        elapsed = time.perf_counter() - started
+    finally:
+        for user in users:
+            await user.client.aclose()
+        server.terminate()
+        server.join(timeout=10)
+        stub_server.should_exit = True
+        await stub_task
+
+    return {
+        "git_commit": git_commit(),
+        "started_at": datetime.utcnow().isoformat(),
+        "config": {
+            "users": args.users,
+            "duration_seconds": args.duration,
+            "listings": args.listings,
+            "upstream_latency_ms": args.upstream_latency_ms,
+            "scenario_weights": SCENARIO_WEIGHTS,
+        },
+        "active_users": len(active_users),
+        "setup": {
+            "elapsed_seconds": round(setup_elapsed, 3),
+            **setup_recorder.report(setup_elapsed),
+        },
+        "elapsed_seconds": round(elapsed, 3),
+        **recorder.report(elapsed),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--listings", type=int, default=200)
+    parser.add_argument("--upstream-latency-ms", type=float, default=30.0)
+    parser.add_argument(
+        "--init-db",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Create missing tables before the run",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", type=str, default=None)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    result = asyncio.run(run_load(args))
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
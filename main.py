@@ -5,19 +5,13 @@
 # --------------------------------------------------------------------------
 from __future__ import annotations
 
-import uvicorn
-
 from src import create_app, init_logger
 from src.core.settings import settings
+from src.core.server import serve
 
 init_logger(settings)
 
 app = create_app(settings)
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "main:app",
-        host=settings.SERVER_DOMAIN,
-        port=settings.SERVER_PORT,
-        reload=True,
-    )
+    serve(settings)
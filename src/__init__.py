@@ -5,19 +5,43 @@
 # --------------------------------------------------------------------------
 from __future__ import annotations
 
+import asyncio
 import logging
+import secrets
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from setuptools_scm import get_version
 
 from src.core.settings import settings
-from src.db.database import engine, Base
+from src.db.database import engine, replica_engine
+from src.db.migration import check_schema_revision
+from src.db.data.csv_converter import area_ranking
 from src.helper.logging import init_logger as _init_logger
 from src.router import router
+from src.router._pagination import NEXT_CURSOR_HEADER
 from src.core.settings import AppSettings
 from src.utils.documents import add_description_at_api_tags
+from src.utils.authentication import password_hasher
+from src.utils.tour_api import tour_api
+from src.utils.jobs import job_registry, shutdown_process_pool
+from src.utils.metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    MetricsMiddleware,
+    flush_metrics,
+    instrument_engine,
+    metrics,
+    monitor_event_loop_lag,
+)
+from src.utils.query_stats import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    REPEATED_QUERY_HEADER,
+    QueryStatsMiddleware,
+    instrument_queries,
+)
 
 __version__ = get_version(
     root="../", relative_to=__file__
@@ -33,14 +57,66 @@ def init_logger(app_settings: AppSettings) -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    ranking_watcher = None
+    loop_lag_monitor = None
+    metrics_flusher = None
+    job_sweeper = None
     try:
         logger.info("Application startup")
-        logger.info("Create connection and setting up database")
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        if app.state.settings.DATABASE_MIGRATION_CHECK:
+            logger.info("Checking database schema revision")
+            async with engine.connect() as conn:
+                revision = await check_schema_revision(conn)
+            logger.info(f"Database schema is at revision {revision}")
+        await tour_api.start()
+        await asyncio.to_thread(area_ranking.reload_if_changed)
+        ranking_watcher = asyncio.create_task(
+            area_ranking.watch(settings.VISITOR_STATS_RELOAD_INTERVAL_SECONDS)
+        )
+        # 이전에 강제 종료된 worker가 남긴 작업을 먼저 정리한 뒤 주기적으로 확인합니다.
+        await job_registry.fail_stale(engine)
+        job_sweeper = asyncio.create_task(job_registry.sweep_stale(engine))
+        if app.state.settings.METRICS_ENABLED:
+            loop_lag_monitor = asyncio.create_task(
+                monitor_event_loop_lag(
+                    app.state.settings.METRICS_EVENT_LOOP_LAG_INTERVAL_SECONDS
+                )
+            )
+            if metrics.multiprocess:
+                metrics_flusher = asyncio.create_task(
+                    flush_metrics(app.state.settings.METRICS_FLUSH_INTERVAL_SECONDS)
+                )
         yield
     finally:
         logger.info("Application shutdown")
+        if ranking_watcher is not None:
+            ranking_watcher.cancel()
+        if loop_lag_monitor is not None:
+            loop_lag_monitor.cancel()
+        if job_sweeper is not None:
+            job_sweeper.cancel()
+            with suppress(asyncio.CancelledError):
+                await job_sweeper
+        await job_registry.shutdown(app.state.settings.JOB_SHUTDOWN_TIMEOUT_SECONDS)
+        await tour_api.close()
+        password_hasher.shutdown()
+        shutdown_process_pool()
+        if metrics_flusher is not None:
+            metrics_flusher.cancel()
+            metrics.write_snapshot(live=False)
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    # 공개된 app에서 내부 지표가 노출되지 않도록 METRICS_ACCESS_TOKEN을 가진 scraper만 허용합니다.
+    expected = f"Bearer {request.app.state.settings.METRICS_ACCESS_TOKEN}"
+    provided = request.headers.get("Authorization", "")
+    if not secrets.compare_digest(provided.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid metrics access token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return Response(metrics.render(), media_type=METRICS_CONTENT_TYPE)
 
 
 def create_app(app_settings: AppSettings) -> FastAPI:
@@ -49,9 +125,11 @@ def create_app(app_settings: AppSettings) -> FastAPI:
         description="K-Buddy Backend API Server (for SW창업캡스톤디자인2)",
         version=__version__,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         openapi_url="/kbuddy/api/v1/openapi.json",
         redoc_url="/kbuddy/api/v1/redoc",
     )
+    app.state.settings = app_settings
 
     if settings.BACKEND_CORS_ORIGINS:
         app.add_middleware(
@@ -62,6 +140,31 @@ def create_app(app_settings: AppSettings) -> FastAPI:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=[
+                NEXT_CURSOR_HEADER,
+                QUERY_COUNT_HEADER,
+                QUERY_TIME_HEADER,
+                REPEATED_QUERY_HEADER,
+            ],
+        )
+
+    instrument_queries(engine, app_settings.SLOW_QUERY_THRESHOLD_MS / 1000)
+    if replica_engine is not None:
+        instrument_queries(replica_engine, app_settings.SLOW_QUERY_THRESHOLD_MS / 1000)
+    app.add_middleware(
+        QueryStatsMiddleware,
+        debug=app_settings.DEBUG_SQL_QUERY_STATS,
+        n_plus_one_threshold=app_settings.DEBUG_N_PLUS_ONE_THRESHOLD,
+    )
+
+    if app_settings.METRICS_ENABLED:
+        instrument_engine(engine)
+        if replica_engine is not None:
+            instrument_engine(replica_engine, name="replica")
+        app.add_middleware(MetricsMiddleware)
+    if app_settings.METRICS_ENABLED and app_settings.METRICS_ACCESS_TOKEN:
+        app.add_api_route(
+            "/metrics", metrics_endpoint, methods=["GET"], include_in_schema=False
         )
 
     app.include_router(router)
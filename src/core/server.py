@@ -0,0 +1,158 @@
+# --------------------------------------------------------------------------
+# Backend Application을 실행하는 server runner를 정의한 모듈입니다.
+#
+# 운영 환경에서는 gunicorn이 여러 개의 uvicorn worker process(uvloop + httptools)를
+# 관리하며, SIGTERM을 받으면 진행 중인 요청과 백그라운드 작업을 SERVER_GRACEFUL_TIMEOUT_SECONDS
+# 안에서 마무리한 뒤 종료하고, SERVER_MAX_REQUESTS개의 요청을 처리한 worker는 실행 중인
+# 백그라운드 작업이 끝난 뒤 새 worker로 교체합니다.
+# SERVER_RELOAD가 켜져 있으면 개발용으로 단일 uvicorn process를 autoreload와 함께 실행합니다.
+#
+# worker마다 따로 있는 상태는 다음과 같이 다룹니다.
+# - 백그라운드 작업 상태는 DB(Background_Job)에 두므로 어느 worker에서든 조회되고,
+#   종료하는 worker는 lifespan에서 실행 중인 작업을 기다렸다가 남은 작업을 취소합니다.
+#   강제 종료(SIGKILL)된 worker의 작업은 heartbeat가 끊기므로 다른 worker가 실패로 정리합니다.
+# - metric은 worker마다 공유 디렉터리에 snapshot을 남기고 /metrics가 이를 합치므로,
+#   worker가 교체되어도 counter가 줄어들지 않습니다.
+# - 인증 캐시(principal_cache)는 worker마다 따로 있으므로, worker가 여러 개면 TTL을
+#   AUTH_CACHE_MULTI_WORKER_TTL_SECONDS 이하로 줄여 수정/탈퇴가 늦게 반영되는 시간을 제한합니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import sys
+import tempfile
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import uvicorn
+
+from gunicorn.app.base import BaseApplication
+from gunicorn.arbiter import Arbiter
+from uvicorn.server import Server
+from uvicorn.workers import UvicornWorker
+
+from src.core.settings import AppSettings, default_workers, settings
+from src.utils.jobs import job_registry
+from src.utils.metrics import mark_process_dead, metrics
+
+APP_PATH = "main:app"
+
+
+class KBuddyUvicornServer(Server):
+    """SERVER_MAX_REQUESTS에 도달해도 실행 중인 백그라운드 작업이 끝날 때까지 교체를 미룹니다."""
+
+    async def on_tick(self, counter: int) -> bool:
+        should_exit = await super().on_tick(counter)
+        if should_exit and not self.should_exit and job_registry.running:
+            return False
+        return should_exit
+
+
+class KBuddyUvicornWorker(UvicornWorker):
+    """
+    auto 대신 uvloop event loop와 httptools parser를 명시적으로 사용하는 worker입니다.
+
+    SIGTERM을 받으면 진행 중인 요청을 SERVER_REQUEST_DRAIN_SECONDS 동안 마무리한 뒤
+    lifespan 종료에서 백그라운드 작업을 JOB_SHUTDOWN_TIMEOUT_SECONDS 동안 기다리므로,
+    둘을 합쳐도 gunicorn이 worker를 강제 종료하는 graceful timeout을 넘지 않습니다.
+    """
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.config.timeout_graceful_shutdown = settings.SERVER_REQUEST_DRAIN_SECONDS
+
+    async def _serve(self) -> None:
+        # UvicornWorker._serve와 같지만 KBuddyUvicornServer를 사용합니다.
+        self.config.app = self.wsgi
+        server = KBuddyUvicornServer(config=self.config)
+        self._install_sigquit_handler()
+        await server.serve(sockets=self.sockets)
+        if not server.started:
+            sys.exit(Arbiter.WORKER_BOOT_ERROR)
+
+
+def metrics_hooks(directory: str) -> Dict[str, Callable[..., None]]:
+    """worker들이 directory에 metric snapshot을 남기도록 하는 gunicorn server hook입니다."""
+
+    def on_starting(server: Any) -> None:
+        # 이전 실행의 snapshot이 남아 있으면 counter가 이어서 더해지므로 비웁니다.
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        for path in Path(directory).glob("*.json"):
+            path.unlink()
+
+    def post_fork(server: Any, worker: Any) -> None:
+        metrics.enable_multiprocess(directory)
+
+    def child_exit(server: Any, worker: Any) -> None:
+        mark_process_dead(directory, worker.pid)
+
+    return {
+        "on_starting": on_starting,
+        "post_fork": post_fork,
+        "child_exit": child_exit,
+    }
+
+
+def gunicorn_options(
+    app_settings: AppSettings, metrics_dir: Optional[str] = None
+) -> Dict[str, Any]:
+    options = {
+        "bind": f"{app_settings.SERVER_DOMAIN}:{app_settings.SERVER_PORT}",
+        "workers": app_settings.SERVER_WORKERS or default_workers(),
+        "worker_class": f"{__name__}.{KBuddyUvicornWorker.__name__}",
+        "backlog": app_settings.SERVER_BACKLOG,
+        "keepalive": app_settings.SERVER_KEEPALIVE_SECONDS,
+        "graceful_timeout": app_settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        "max_requests": app_settings.SERVER_MAX_REQUESTS,
+        "max_requests_jitter": app_settings.SERVER_MAX_REQUESTS_JITTER,
+        "accesslog": "-",
+        "errorlog": "-",
+    }
+    if metrics_dir is not None:
+        options.update(metrics_hooks(metrics_dir))
+    return options
+
+
+class KBuddyServer(BaseApplication):
+    """
+    gunicorn 설정 파일이나 command line 대신 AppSettings로 설정하는 gunicorn application입니다.
+
+    worker마다 APP_PATH를 새로 import하므로 DB engine과 background task는
+    fork 이후 각 worker 안에서 만들어집니다.
+    """
+
+    def __init__(self, options: Dict[str, Any]):
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> str:
+        # UvicornWorker는 app이 문자열이면 worker process 안에서 직접 import합니다.
+        return APP_PATH
+
+
+def serve(app_settings: AppSettings) -> None:
+    if app_settings.SERVER_RELOAD:
+        uvicorn.run(
+            APP_PATH,
+            host=app_settings.SERVER_DOMAIN,
+            port=app_settings.SERVER_PORT,
+            loop="uvloop",
+            http="httptools",
+            reload=True,
+        )
+        return
+
+    metrics_dir = None
+    if app_settings.METRICS_ENABLED:
+        metrics_dir = app_settings.METRICS_MULTIPROCESS_DIR or tempfile.mkdtemp(
+            prefix="kbuddy-metrics-"
+        )
+    KBuddyServer(gunicorn_options(app_settings, metrics_dir)).run()
@@ -8,6 +8,7 @@
 # --------------------------------------------------------------------------
 from __future__ import annotations
 
+import os
 import warnings
 
 from typing import Any, Dict, Optional, Annotated
@@ -25,6 +26,17 @@ from pydantic_core import MultiHostUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# 종료 시 background job을 기다린 뒤 연결 정리, 마지막 기록 등에 남겨 두는 시간입니다.
+SERVER_SHUTDOWN_MARGIN_SECONDS = 5
+
+
+def default_workers() -> int:
+    # container에서는 os.cpu_count()가 할당되지 않은 core까지 세므로 affinity를 우선합니다.
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 def parse_cors(v: Any) -> list[str] | str:
     if isinstance(v, str) and not v.startswith("["):
         return [i.strip() for i in v.split(",")]
@@ -61,6 +73,11 @@ class AppSettings(BaseSettings):
         description="Change the server's thread pool size to handle non-async function",
     )
 
+    PROCESS_POOL_SIZE: int = Field(
+        default=2,
+        description="Worker processes for CPU heavy jobs such as CSV parsing",
+    )
+
     SECRET_KEY: str = Field(
         default="example_secret_key_WoW",
         description="Secret key to be used for issuing HMAC tokens.",
@@ -74,6 +91,36 @@ class AppSettings(BaseSettings):
         default=8000,
         description="Server's port",
     )
+    SERVER_WORKERS: Optional[int] = Field(
+        default=None,
+        description="Worker processes to serve requests (default: available CPU count)",
+    )
+    SERVER_BACKLOG: int = Field(
+        default=2048,
+        description="Maximum pending connections waiting in the listen queue",
+    )
+    SERVER_KEEPALIVE_SECONDS: int = Field(
+        default=5,
+        description="Seconds an idle keep-alive connection is held open",
+    )
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = Field(
+        default=30,
+        description="Seconds a worker may take to shut down after SIGTERM before it is killed. "
+        "In-flight requests get what is left after JOB_SHUTDOWN_TIMEOUT_SECONDS "
+        "and a 5 second cleanup margin",
+    )
+    SERVER_MAX_REQUESTS: int = Field(
+        default=10000,
+        description="Requests a worker serves before it is replaced (0: never)",
+    )
+    SERVER_MAX_REQUESTS_JITTER: int = Field(
+        default=1000,
+        description="Random extra requests added to SERVER_MAX_REQUESTS per worker",
+    )
+    SERVER_RELOAD: bool = Field(
+        default=False,
+        description="If True, run a single worker with autoreload for local development",
+    )
 
     TOUR_API_KEY_ENCODING: str = Field(
         default="tour_api_key_encoded",
@@ -87,6 +134,134 @@ class AppSettings(BaseSettings):
         default="http://apis.data.go.kr/B551011/EngService1",
         description="한국관광공사_영문 관광정보서비스_GW API endpoint"
     )
+    TOUR_API_TIMEOUT_SECONDS: float = Field(
+        default=3.0,
+        description="Connect/read timeout of a single Tour API attempt",
+    )
+    TOUR_API_DEADLINE_SECONDS: float = Field(
+        default=5.0,
+        description="Total time budget of a Tour API call including retries",
+    )
+    TOUR_API_MAX_RETRIES: int = Field(
+        default=2,
+        description="Retries on Tour API transport errors and 5xx responses",
+    )
+    TOUR_API_MAX_CONNECTIONS: int = Field(
+        default=20,
+        description="Maximum pooled connections to the Tour API per worker",
+    )
+    TOUR_API_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=10,
+        description="Maximum idle keep-alive connections to the Tour API per worker",
+    )
+    TOUR_API_BREAKER_FAILURE_RATE: float = Field(
+        default=0.5,
+        description="Error rate over recent Tour API calls that opens the circuit",
+    )
+    TOUR_API_BREAKER_MIN_CALLS: int = Field(
+        default=10,
+        description="Minimum recent Tour API calls before the circuit may open",
+    )
+    TOUR_API_BREAKER_RESET_SECONDS: float = Field(
+        default=30.0,
+        description="Seconds the Tour API circuit stays open before a probe call",
+    )
+    TOUR_API_AREA_CODE_TTL_SECONDS: int = Field(
+        default=60 * 60 * 24 * 7,
+        description="Seconds the Tour API area code table is served from cache",
+    )
+    TOUR_API_AREA_LIST_TTL_SECONDS: int = Field(
+        default=60 * 60 * 6,
+        description="Seconds an areaBasedList1 response per sigungu is served from cache",
+    )
+    TOUR_API_STALE_TTL_SECONDS: int = Field(
+        default=60 * 60 * 24,
+        description="Seconds an expired Tour API response may still be served while refreshing",
+    )
+
+    AUTH_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        description="Seconds an authenticated user stays cached per access token",
+    )
+    AUTH_CACHE_MULTI_WORKER_TTL_SECONDS: int = Field(
+        default=5,
+        description="Upper bound of AUTH_CACHE_TTL_SECONDS when more than one server worker runs. "
+        "Editing or withdrawing a user clears only the cache of the worker that handled it, "
+        "so other workers may keep authenticating the old user for up to this many seconds",
+    )
+    AUTH_CACHE_MAX_SIZE: int = Field(
+        default=10000,
+        description="Maximum number of access tokens kept in the auth cache",
+    )
+
+    VISITOR_STATS_RELOAD_INTERVAL_SECONDS: float = Field(
+        default=60.0,
+        description="Seconds between checks of the visitor statistics CSV for changes",
+    )
+
+    METRICS_ENABLED: bool = Field(
+        default=True,
+        description="If True, record request/DB/upstream metrics",
+    )
+    METRICS_ACCESS_TOKEN: Optional[str] = Field(
+        default=None,
+        description="Bearer token required to read /metrics "
+        "(default: /metrics is not served)",
+    )
+    METRICS_EVENT_LOOP_LAG_INTERVAL_SECONDS: float = Field(
+        default=0.5,
+        description="Seconds between event loop lag samples",
+    )
+    METRICS_MULTIPROCESS_DIR: Optional[str] = Field(
+        default=None,
+        description="Directory where each server worker leaves its metrics snapshot "
+        "(default: a new temporary directory per server start)",
+    )
+    METRICS_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=1.0,
+        description="Seconds between metrics snapshot writes of a server worker",
+    )
+
+    SLOW_QUERY_THRESHOLD_MS: float = Field(
+        default=200.0,
+        description="SQL statements slower than this are logged with redacted parameters",
+    )
+    DEBUG_SQL_QUERY_STATS: bool = Field(
+        default=False,
+        description="If True, add per-request SQL count/time headers and warn on N+1 patterns",
+    )
+    DEBUG_N_PLUS_ONE_THRESHOLD: int = Field(
+        default=5,
+        description="Same-shape statements allowed per request before an N+1 warning",
+    )
+
+    JOB_PROGRESS_INTERVAL_SECONDS: float = Field(
+        default=1.0,
+        description="Seconds between progress writes of a running background job",
+    )
+    JOB_SHUTDOWN_TIMEOUT_SECONDS: float = Field(
+        default=15.0,
+        description="Seconds shutdown waits for running background jobs before cancelling them",
+    )
+    JOB_HEARTBEAT_INTERVAL_SECONDS: float = Field(
+        default=10.0,
+        description="Seconds between heartbeat writes of a running background job",
+    )
+    JOB_STALE_AFTER_SECONDS: float = Field(
+        default=60.0,
+        description="Seconds without a heartbeat after which an unfinished background job "
+        "is marked failed (e.g. its worker was killed)",
+    )
+
+    MAX_UPLOAD_BYTES: int = Field(
+        default=50 * 1024 * 1024,
+        description="Maximum size of an uploaded CSV file; larger uploads are rejected with 413",
+    )
+
+    BULK_MAX_ITEMS: int = Field(
+        default=1000,
+        description="Maximum number of objects accepted by one bulk create/update/delete request",
+    )
 
     HASH_ALGORITHM: str = Field(default="HS256", description="Algorithm for Hashing")
     # 60 minutes * 24 hours * 8 days = 8 days
@@ -122,6 +297,47 @@ class AppSettings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    @computed_field  # type: ignore[misc]
+    @property
+    def SERVER_REQUEST_DRAIN_SECONDS(self) -> float:
+        # 요청을 마무리한 뒤 background job을 기다리고, 남은 정리까지 graceful timeout 안에 끝냅니다.
+        return (
+            self.SERVER_GRACEFUL_TIMEOUT_SECONDS
+            - self.JOB_SHUTDOWN_TIMEOUT_SECONDS
+            - SERVER_SHUTDOWN_MARGIN_SECONDS
+        )
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def AUTH_CACHE_EFFECTIVE_TTL_SECONDS(self) -> int:
+        workers = 1 if self.SERVER_RELOAD else self.SERVER_WORKERS or default_workers()
+        if workers > 1:
+            return min(self.AUTH_CACHE_TTL_SECONDS, self.AUTH_CACHE_MULTI_WORKER_TTL_SECONDS)
+        return self.AUTH_CACHE_TTL_SECONDS
+
+    POSTGRES_REPLICA_SERVER: Optional[str] = Field(
+        default=None,
+        description="Read replica PostgreSQL server. If unset, every query goes to the primary",
+    )
+
+    POSTGRES_REPLICA_PORT: Optional[int] = Field(
+        default=None, description="Read replica port number (default: POSTGRES_PORT)"
+    )
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def DATABASE_REPLICA_URI(self) -> Optional[PostgresDsn]:
+        if not self.POSTGRES_REPLICA_SERVER:
+            return None
+        return MultiHostUrl.build(
+            scheme="postgresql+psycopg",
+            username=self.POSTGRES_USER,
+            password=self.POSTGRES_PASSWORD,
+            host=self.POSTGRES_REPLICA_SERVER,
+            port=self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT,
+            path=self.POSTGRES_DB,
+        )
+
     DATABASE_OPTIONS: Dict[str, Any] = Field(
         default={
             "pool_size": 10,
@@ -132,6 +348,11 @@ class AppSettings(BaseSettings):
         description="MariaDB option to create a connection.",
     )
 
+    DATABASE_MIGRATION_CHECK: bool = Field(
+        default=True,
+        description="If True, refuse to start unless the DB is at the alembic head revision",
+    )
+
     def _check_default_secret(self, var_name: str, value: str | None) -> None:
         if value == "changethis":
             message = (
@@ -149,5 +370,19 @@ class AppSettings(BaseSettings):
 
         return self
 
+    @model_validator(mode="after")
+    def _check_shutdown_timeouts(self) -> Self:
+        if self.SERVER_REQUEST_DRAIN_SECONDS <= 0:
+            raise ValueError(
+                "SERVER_GRACEFUL_TIMEOUT_SECONDS must be longer than JOB_SHUTDOWN_TIMEOUT_SECONDS "
+                f"+ {SERVER_SHUTDOWN_MARGIN_SECONDS}s, otherwise workers are killed mid-shutdown"
+            )
+        if self.JOB_STALE_AFTER_SECONDS <= self.JOB_HEARTBEAT_INTERVAL_SECONDS:
+            raise ValueError(
+                "JOB_STALE_AFTER_SECONDS must be longer than JOB_HEARTBEAT_INTERVAL_SECONDS"
+            )
+
+        return self
+
 
 settings = AppSettings()
@@ -5,24 +5,107 @@
 # --------------------------------------------------------------------------
 from __future__ import annotations
 
-from typing import Any, Type, List, Optional
+import json
+import base64
+import binascii
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Type, List, NamedTuple, Optional, Sequence, Tuple
 
 from pydantic import BaseModel
-from sqlalchemy import select, text
+from sqlalchemy import (
+    column,
+    delete,
+    insert,
+    inspect,
+    select,
+    text,
+    tuple_,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
+from src.helper.exceptions import InternalException, ErrorCode
+
+
+# 대량 수정 시 하나의 UPDATE ... FROM (VALUES ...) 문에 싣는 최대 행 수입니다.
+BULK_CHUNK_SIZE = 1000
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(created: datetime, model_id: Any) -> str:
+    payload = json.dumps([created.isoformat(), str(model_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(model: Any, cursor: str) -> tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created, model_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (
+            datetime.fromisoformat(created),
+            model.id.type.python_type(model_id),
+        )
+    except (binascii.Error, TypeError, ValueError):
+        raise InternalException("잘못된 cursor 값입니다.", ErrorCode.BAD_REQUEST)
+
+
+@lru_cache(maxsize=None)
+def loader_options(model: Any, response_model: Type[BaseModel]) -> Tuple[Any, ...]:
+    """
+    response_model이 직렬화하는 relationship을 미리 읽어오는 loader option을 만듭니다.
+
+    AsyncSession에서는 lazy loading을 쓸 수 없으므로, 목록(collection)은 selectinload로
+    relationship당 한 번의 IN 조회로, 단일 객체는 joinedload로 같은 query에서 읽습니다.
+    따라서 N개의 행을 읽어도 query 수는 relationship 수에만 비례합니다.
+    """
+    options = []
+    for relationship in inspect(model).relationships:
+        if relationship.key not in response_model.model_fields:
+            continue
+        loader = selectinload if relationship.uselist else joinedload
+        options.append(loader(getattr(model, relationship.key)))
+    return tuple(options)
+
+
+def _where(query: Any, condition: Optional[Any]) -> Any:
+    if condition is None:
+        return query
+    if isinstance(condition, str):
+        condition = text(condition)
+    return query.where(condition)
 
 
 async def get_object(
-    db: AsyncSession, model: Any, model_id: int | str, response_model: Type[BaseModel]
+    db: AsyncSession,
+    model: Any,
+    model_id: int | str,
+    response_model: Type[BaseModel],
+    options: Optional[Sequence[Any]] = None,
 ) -> Optional[Any]:
-    result = await db.get(model, model_id)
+    if options is None:
+        options = loader_options(model, response_model)
+    result = await db.get(model, model_id, options=options)
+    if result is None:
+        return None
     return response_model.model_validate(result.__dict__)
 
 
 async def get_object_with_uuid(
     db: AsyncSession, model: Any, model_uid: str, response_model: Type[BaseModel]
 ) -> Optional[Any]:
-    result = await db.get(model, model_uid)
+    result = await db.get(
+        model, model_uid, options=loader_options(model, response_model)
+    )
+    if result is None:
+        return None
     return response_model.model_validate(result.__dict__)
 
 
@@ -33,25 +116,113 @@ async def get_objects(
     condition: Optional[Any] = None,
     skip: int = 0,
     limit: int = 100,
+    projection: bool = False,
 ) -> List[Any]:
-    query = select(model).offset(skip).limit(limit)
-    if condition is not None:
-        query = query.where(text(condition))
-    result = await db.execute(query)
-    result_list = result.scalars().all()
-    return [response_model.model_validate(item.__dict__) for item in result_list]
+    page = await get_page(
+        db=db,
+        model=model,
+        response_model=response_model,
+        condition=condition,
+        skip=skip,
+        limit=limit,
+        projection=projection,
+    )
+    return page.items
+
+
+async def get_page(
+    db: AsyncSession,
+    model: Any,
+    response_model: Type[BaseModel],
+    condition: Optional[Any] = None,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    options: Optional[Sequence[Any]] = None,
+    projection: bool = False,
+) -> Page:
+    """
+    (created, id) 순서로 정렬된 한 페이지와 다음 페이지의 cursor를 반환합니다.
+
+    cursor가 주어지면 OFFSET 대신 (created, id) > (...) 조건으로 탐색하므로,
+    ix_<table>_created_id 인덱스를 따라 몇 번째 페이지든 같은 비용으로 조회됩니다.
+    cursor 없이 호출하면 기존과 같이 skip/limit으로 동작합니다.
+    options를 넘기면 response_model 기준의 기본 loader option 대신 사용합니다.
+
+    projection=True면 ORM 객체 대신 테이블 column만 조회해 각 행을 바로 response_model로
+    만듭니다. identity map 등록과 attribute instrumentation을 거치지 않아 읽기 전용 목록에서
+    더 빠르지만, relationship은 채워지지 않으므로 필요하면 호출한 쪽에서 채워야 합니다.
+    """
+    if projection:
+        query = _where(select(*model.__table__.c), condition)
+    else:
+        if options is None:
+            options = loader_options(model, response_model)
+        query = _where(select(model), condition).options(*options)
+    if cursor is not None:
+        query = query.where(
+            tuple_(model.created, model.id) > decode_cursor(model, cursor)
+        )
+    elif skip:
+        query = query.offset(skip)
+    query = query.order_by(model.created, model.id).limit(limit + 1)
+
+    if projection:
+        # ORM 결과 처리를 거치지 않도록 session의 connection에서 Core로 실행합니다.
+        result = await (await db.connection(bind_arguments={"clause": query})).execute(
+            query
+        )
+        keys = tuple(result.keys())
+        result_list = result.all()
+        rows = (dict(zip(keys, row)) for row in result_list[:limit])
+    else:
+        result_list = (await db.execute(query)).scalars().all()
+        rows = (item.__dict__ for item in result_list[:limit])
+    items = [response_model.model_validate(row) for row in rows]
+
+    next_cursor = None
+    if len(result_list) > limit:
+        last = result_list[limit - 1]
+        next_cursor = encode_cursor(last.created, last.id)
+    return Page(items=items, next_cursor=next_cursor)
+
+
+def _validate_rows(result: Any, response_model: Type[BaseModel]) -> List[Any]:
+    keys = tuple(result.keys())
+    return [response_model.model_validate(dict(zip(keys, row))) for row in result]
+
+
+async def _persist(db: AsyncSession, commit: bool) -> None:
+    # commit=False면 flush만 하여, 호출한 쪽이 같은 transaction에서 추가 작업 후 commit합니다.
+    if commit:
+        await db.commit()
+    else:
+        await db.flush()
 
 
 async def create_object(
-    db: AsyncSession, model: Any, obj: BaseModel, response_model: Type[BaseModel]
+    db: AsyncSession,
+    model: Any,
+    obj: BaseModel,
+    response_model: Type[BaseModel],
+    commit: bool = True,
+    extra_values: Optional[Dict[str, Any]] = None,
 ) -> Any:
-    obj_data = obj.model_dump()
-    db_obj = model(**obj_data)
+    """
+    INSERT ... RETURNING 한 번으로 객체를 추가하고, 반환된 행을 바로 response_model로 만듭니다.
 
-    db.add(db_obj)
-    await db.commit()
-    await db.refresh(db_obj)
-    return response_model.model_validate(db_obj.__dict__)
+    ORM 객체를 add한 뒤 commit하고 다시 refresh(SELECT)하지 않으므로 DB 왕복은 한 번입니다.
+    server default(created 등)도 RETURNING으로 함께 받습니다. extra_values는 obj에 없는
+    column 값(예: 상위 객체의 id)을 더할 때 사용합니다.
+    """
+    table = model.__table__
+    query = insert(table).returning(*table.c)
+    result = await (await db.connection()).execute(
+        query, {**obj.model_dump(), **(extra_values or {})}
+    )
+    item = _validate_rows(result, response_model)[0]
+    await _persist(db, commit)
+    return item
 
 
 async def update_object(
@@ -60,28 +231,167 @@ async def update_object(
     model_id: int | str,
     obj: BaseModel,
     response_model: Type[BaseModel],
+    commit: bool = True,
+    condition: Optional[Any] = None,
+    extra_values: Optional[Dict[str, Any]] = None,
 ) -> Optional[Any]:
-    query = select(model).filter(model.id == model_id)
-    db_obj = (await db.execute(query)).scalar_one_or_none()
-    if db_obj is None:
+    """
+    UPDATE ... WHERE id = ... RETURNING 한 번으로 obj에서 설정된 값만 반영하고,
+    수정된 행을 response_model로 반환합니다. 행이 없으면(condition에 맞지 않으면) None입니다.
+
+    먼저 SELECT로 읽어 attribute를 바꾼 뒤 commit/refresh하던 세 번의 왕복이 한 번으로 줄며,
+    updated 같은 onupdate 값도 RETURNING으로 함께 받습니다. extra_values는 obj에 없는
+    column 값(SQL 식도 가능)을 함께 바꿀 때 사용합니다.
+    """
+    table = model.__table__
+    update_data = {**obj.model_dump(exclude_unset=True), **(extra_values or {})}
+    if update_data:
+        query = update(table).values(update_data).returning(*table.c)
+    else:
+        # 바꿀 값이 없으면 기존과 같이 현재 행을 그대로 돌려줍니다.
+        query = select(*table.c)
+    query = _where(query.where(table.c.id == model_id), condition)
+    result = await (await db.connection()).execute(query)
+    items = _validate_rows(result, response_model)
+    if not items:
         return None
-    update_data = obj.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_obj, key, value)
-    db.add(db_obj)
-    await db.commit()
-    await db.refresh(db_obj)
-    return response_model.model_validate(db_obj.__dict__)
+    await _persist(db, commit)
+    return items[0]
+
+
+@lru_cache(maxsize=None)
+def has_delete_cascade(model: Any) -> bool:
+    return any(
+        relationship.cascade.delete for relationship in inspect(model).relationships
+    )
 
 
 async def delete_object(
-    db: AsyncSession, model: Any, model_id: int | str
+    db: AsyncSession,
+    model: Any,
+    model_id: int | str,
+    commit: bool = True,
+    condition: Optional[Any] = None,
 ) -> Optional[int]:
-    query = select(model).filter(model.id == model_id)
-    db_obj = (await db.execute(query)).scalar_one_or_none()
-    if db_obj:
+    """
+    DELETE ... WHERE id = ... RETURNING id 한 번으로 삭제하고, 삭제된 행이 없으면 None을 반환합니다.
+
+    cascade="delete"인 relationship이 있는 model(Area, Itinerary 등)은 ORM이 자식 행까지
+    지우도록 기존과 같이 객체를 읽은 뒤 session에서 삭제합니다.
+    """
+    if has_delete_cascade(model):
+        query = _where(select(model).where(model.id == model_id), condition)
+        db_obj = (await db.execute(query)).scalar_one_or_none()
+        if db_obj is None:
+            return None
         await db.delete(db_obj)
-        await db.commit()
     else:
-        return None
+        table = model.__table__
+        query = _where(delete(table).where(table.c.id == model_id), condition)
+        result = await (await db.connection()).execute(query.returning(table.c.id))
+        if result.first() is None:
+            return None
+    await _persist(db, commit)
     return model_id
+
+
+async def create_objects(
+    db: AsyncSession,
+    model: Any,
+    objs: Sequence[BaseModel],
+    response_model: Type[BaseModel],
+    commit: bool = True,
+) -> List[Any]:
+    """
+    여러 객체를 multi-row INSERT ... RETURNING으로 추가하고, 입력 순서대로 반환합니다.
+
+    ORM 객체를 만들지 않고 Core executemany로 실행하므로 SQLAlchemy가 행들을
+    insertmanyvalues 단위(기본 1000행)로 묶어 보내며, add/commit/refresh를 객체마다
+    반복하지 않습니다. 모든 행은 같은 transaction에 들어갑니다.
+    """
+    if not objs:
+        return []
+    table = model.__table__
+    query = insert(table).returning(*table.c, sort_by_parameter_order=True)
+    result = await (await db.connection()).execute(
+        query, [obj.model_dump() for obj in objs]
+    )
+    items = _validate_rows(result, response_model)
+    await _persist(db, commit)
+    return items
+
+
+async def update_objects(
+    db: AsyncSession,
+    model: Any,
+    objs: Sequence[BaseModel],
+    response_model: Type[BaseModel],
+    commit: bool = True,
+) -> Dict[Any, Any]:
+    """
+    각 객체의 id에 해당하는 행에 나머지 값을 UPDATE ... FROM (VALUES ...) ... RETURNING으로
+    반영하고, 수정된 행을 id별로 반환합니다. 반환값에 없는 id는 존재하지 않는 행입니다.
+
+    수정하는 column 조합이 같은 객체끼리 묶어 BULK_CHUNK_SIZE개씩 한 문장으로 실행합니다.
+    같은 id가 두 번 들어오면 어느 값이 반영될지 정해지지 않으므로 호출한 쪽에서 막아야 합니다.
+    """
+    table = model.__table__
+    groups: Dict[Tuple[str, ...], List[Tuple[Any, ...]]] = {}
+    unchanged = []
+    for obj in objs:
+        data = obj.model_dump(exclude_unset=True, exclude={"id"})
+        if not data:
+            unchanged.append(obj.id)
+            continue
+        groups.setdefault(tuple(data), []).append((obj.id, *data.values()))
+
+    conn = await db.connection()
+    updated: Dict[Any, Any] = {}
+    for keys, rows in groups.items():
+        for start in range(0, len(rows), BULK_CHUNK_SIZE):
+            source = values(
+                column("id", table.c.id.type),
+                *(column(key, table.c[key].type) for key in keys),
+                name="data",
+            ).data(rows[start : start + BULK_CHUNK_SIZE])
+            query = (
+                update(table)
+                .where(table.c.id == source.c.id)
+                .values({key: source.c[key] for key in keys})
+                .returning(*table.c)
+            )
+            result = await conn.execute(query)
+            updated.update(
+                (item.id, item) for item in _validate_rows(result, response_model)
+            )
+
+    # 수정할 값이 없는 객체는 현재 값을 그대로 돌려줍니다.
+    if unchanged:
+        result = await conn.execute(select(*table.c).where(table.c.id.in_(unchanged)))
+        updated.update(
+            (item.id, item) for item in _validate_rows(result, response_model)
+        )
+    await _persist(db, commit)
+    return updated
+
+
+async def delete_objects(
+    db: AsyncSession,
+    model: Any,
+    model_ids: Sequence[Any],
+    response_model: Type[BaseModel],
+    commit: bool = True,
+) -> Dict[Any, Any]:
+    """
+    여러 행을 DELETE ... WHERE id IN (...) RETURNING 한 번으로 삭제하고,
+    삭제된 행을 id별로 반환합니다. 반환값에 없는 id는 존재하지 않는 행입니다.
+    ORM cascade는 적용되지 않으므로 has_delete_cascade인 model에는 사용하지 않습니다.
+    """
+    if not model_ids:
+        return {}
+    table = model.__table__
+    query = delete(table).where(table.c.id.in_(model_ids)).returning(*table.c)
+    result = await (await db.connection()).execute(query)
+    deleted = {item.id: item for item in _validate_rows(result, response_model)}
+    await _persist(db, commit)
+    return deleted
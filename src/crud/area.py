@@ -5,11 +5,22 @@
 # --------------------------------------------------------------------------
 from __future__ import annotations
 
-from typing import List, Optional
+import time
+import hashlib
 
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import String, func, literal, literal_column, select, true
+from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ._base import (
+    Page,
+    get_page,
     get_objects,
     get_object,
     create_object,
@@ -17,7 +28,8 @@ from ._base import (
     delete_object,
 )
 from src.db.models import Area, AreaImage
-from src.schemas.responses import AreaSchema, AreaImageSchema
+from src.helper.exceptions import InternalException, ErrorCode
+from src.schemas.responses import AreaSchema, AreaImageSchema, AreaIngestReport
 from src.schemas.requests import (
     AreaCreate,
     AreaUpdate,
@@ -26,45 +38,228 @@ from src.schemas.requests import (
 )
 
 
+async def _attach_area_images(
+    db: AsyncSession, areas: List[AreaSchema], images_limit: Optional[int] = None
+) -> None:
+    """
+    페이지의 모든 지역 이미지를 지역당 최대 images_limit장씩 한 번의 query로 채웁니다.
+
+    LATERAL 안에서 지역마다 ix_Area_Image_area_id_created_id를 LIMIT만큼만 읽으므로,
+    지역에 이미지가 많아도 읽는 행 수는 지역 수 x images_limit을 넘지 않습니다.
+    images_limit이 None이면 지역의 모든 이미지를 채웁니다.
+    """
+    if not areas:
+        return
+    page_areas = select(Area.id).where(Area.id.in_([area.id for area in areas]))
+    page_areas = page_areas.subquery()
+    top_images = (
+        select(*AreaImage.__table__.c)
+        .where(AreaImage.area_id == page_areas.c.id)
+        .order_by(AreaImage.created, AreaImage.id)
+        .limit(images_limit)
+        .lateral()
+    )
+    query = (
+        select(*top_images.c)
+        .select_from(page_areas)
+        .join(top_images, true())
+        .order_by(top_images.c.area_id, top_images.c.created, top_images.c.id)
+    )
+
+    result = await (await db.connection(bind_arguments={"clause": query})).execute(
+        query
+    )
+    keys = tuple(result.keys())
+    images: Dict[int, List[AreaImageSchema]] = defaultdict(list)
+    for row in result:
+        images[row.area_id].append(AreaImageSchema.model_validate(dict(zip(keys, row))))
+    for area in areas:
+        area.images = images[area.id]
+
+
 async def get_all_areas(
-    db: AsyncSession, skip: int = 0, limit: int = 100
-) -> List[AreaSchema]:
-    return await get_objects(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    images_limit: Optional[int] = None,
+) -> Page:
+    page = await get_page(
         db=db,
         model=Area,
         response_model=AreaSchema,
         # condition="",
+        cursor=cursor,
         skip=skip,
         limit=limit,
+        projection=True,
     )
+    await _attach_area_images(db, page.items, images_limit)
+    return page
 
 
-async def get_area(db: AsyncSession, area_id: int) -> Optional[AreaSchema]:
-    return await get_object(
-        db=db, model=Area, model_id=area_id, response_model=AreaSchema
+async def get_area(
+    db: AsyncSession, area_id: int, images_limit: Optional[int] = None
+) -> Optional[AreaSchema]:
+    area = await get_object(
+        db=db,
+        model=Area,
+        model_id=area_id,
+        response_model=AreaSchema,
+        options=None if images_limit is None else (),
     )
+    if area is not None and images_limit is not None:
+        await _attach_area_images(db, [area], images_limit)
+    return area
+
+
+@asynccontextmanager
+async def _unique_area_name(db: AsyncSession) -> AsyncIterator[None]:
+    """Area.name unique 제약 위반을 409 InternalException으로 바꿉니다."""
+    try:
+        yield
+    except IntegrityError as e:
+        if getattr(e.orig, "sqlstate", None) != UNIQUE_VIOLATION:
+            raise
+        await db.rollback()
+        raise InternalException(
+            "같은 이름의 지역이 이미 있습니다.", error_code=ErrorCode.CONFLICT
+        )
 
 
 async def create_area(db: AsyncSession, area: AreaCreate) -> AreaSchema:
-    return await create_object(db=db, model=Area, obj=area, response_model=AreaSchema)
+    async with _unique_area_name(db):
+        return await create_object(
+            db=db,
+            model=Area,
+            obj=area,
+            response_model=AreaSchema,
+            extra_values={"content_hash": area_content_hash(area.model_dump())},
+        )
 
 
 async def update_area(
     db: AsyncSession, area_id: int, area: AreaUpdate
 ) -> Optional[AreaSchema]:
-    return await update_object(
-        db=db,
-        model=Area,
-        model_id=area_id,
-        obj=area,
-        response_model=AreaSchema,
+    values = area.model_dump(exclude_unset=True)
+    extra_values = (
+        {"content_hash": _content_hash_expression(values)} if values else None
     )
+    async with _unique_area_name(db):
+        return await update_object(
+            db=db,
+            model=Area,
+            model_id=area_id,
+            obj=area,
+            response_model=AreaSchema,
+            extra_values=extra_values,
+        )
 
 
 async def delete_area(db: AsyncSession, area_id: int) -> Optional[int]:
     return await delete_object(db=db, model=Area, model_id=area_id)
 
 
+# PostgreSQL unique_violation SQLSTATE
+UNIQUE_VIOLATION = "23505"
+
+AREA_CONTENT_FIELDS = ("name", "address", "website", "contact_num", "open_time")
+
+# 관광자원 CSV에 있는 field입니다. open_time처럼 API로만 입력하는 field는 CSV 적재가 덮어쓰지 않습니다.
+AREA_CSV_FIELDS = ("name", "address", "website", "contact_num")
+
+
+def area_content_hash(area: Dict[str, Any]) -> str:
+    content = "\x1f".join(
+        "" if area.get(field) is None else str(area[field])
+        for field in AREA_CONTENT_FIELDS
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _content_hash_expression(values: Dict[str, Any]) -> Any:
+    """
+    area_content_hash와 같은 값을 UPDATE 안에서 계산하는 SQL 식입니다.
+
+    일부 field만 바꾸는 경우에도 바뀌지 않은 field는 현재 행의 값을 사용합니다.
+    values의 값은 python 값이거나 SQL 식(예: ON CONFLICT의 excluded 컬럼)입니다.
+    """
+    table = Area.__table__
+    parts = []
+    for field in AREA_CONTENT_FIELDS:
+        if field not in values:
+            value = table.c[field]
+        elif isinstance(values[field], ColumnElement):
+            value = values[field]
+        else:
+            value = literal(values[field], String)
+        parts.append(func.coalesce(value, ""))
+    content = func.concat_ws("\x1f", *parts)
+    return func.encode(func.sha256(func.convert_to(content, "UTF8")), "hex")
+
+
+async def upsert_areas(
+    db: AsyncSession,
+    areas: Sequence[Dict[str, Any]],
+    batch_size: int = 1000,
+    on_batch: Optional[Callable[[int], None]] = None,
+) -> AreaIngestReport:
+    """
+    Area 행을 name 기준으로 batch 단위 INSERT ... ON CONFLICT DO UPDATE 합니다.
+
+    기존 행은 CSV field(AREA_CSV_FIELDS)만 갱신하고 open_time 같은 나머지 field는 유지하며,
+    갱신 후의 내용 hash가 저장된 hash와 같은 행은 건너뛰므로 같은 데이터를 다시 적재해도
+    결과가 바뀌지 않습니다. 전체 적재는 하나의 트랜잭션으로 commit 됩니다.
+    """
+    started = time.perf_counter()
+
+    # 한 statement 안에서 같은 행을 두 번 갱신할 수 없으므로 name 기준으로 중복을 제거합니다.
+    rows = {}
+    for area in areas:
+        row = {field: area.get(field) for field in AREA_CSV_FIELDS}
+        row["content_hash"] = area_content_hash(row)
+        rows[row["name"]] = row
+    rows = list(rows.values())
+
+    inserted = updated = 0
+    for offset in range(0, len(rows), batch_size):
+        batch = rows[offset : offset + batch_size]
+        stmt = insert(Area).values(batch)
+        csv_values = {field: stmt.excluded[field] for field in AREA_CSV_FIELDS}
+        # 갱신될 행(CSV field + 기존 행의 나머지 field)의 hash
+        merged_hash = _content_hash_expression(csv_values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Area.name],
+            set_={
+                **{
+                    field: csv_values[field]
+                    for field in AREA_CSV_FIELDS
+                    if field != "name"
+                },
+                "content_hash": merged_hash,
+                "updated": func.now(),
+            },
+            where=Area.content_hash.is_distinct_from(merged_hash),
+        ).returning(literal_column("xmax = 0").label("inserted"))
+        result = await db.execute(stmt)
+        for (is_inserted,) in result:
+            if is_inserted:
+                inserted += 1
+            else:
+                updated += 1
+        if on_batch is not None:
+            on_batch(offset + len(batch))
+    await db.commit()
+
+    return AreaIngestReport(
+        total=len(rows),
+        inserted=inserted,
+        updated=updated,
+        skipped=len(rows) - inserted - updated,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+    )
+
+
 async def get_area_images(
     db: AsyncSession, area_id: int, skip: int = 0, limit: int = 100
 ) -> List[AreaImageSchema]:
@@ -76,6 +271,7 @@ async def get_area_images(
         condition=condition,
         skip=skip,
         limit=limit,
+        projection=True,
     )
 
 
@@ -88,11 +284,13 @@ async def get_area_image(db: AsyncSession, image_id: int) -> Optional[AreaImageS
 async def create_area_image(
     db: AsyncSession, area_id: int, image: AreaImageCreate
 ) -> AreaImageSchema:
-    db_image = AreaImage(area_id=area_id, **image.model_dump())
-    db.add(db_image)
-    await db.commit()
-    await db.refresh(db_image)
-    return AreaImageSchema.model_validate(db_image)
+    return await create_object(
+        db=db,
+        model=AreaImage,
+        obj=image,
+        response_model=AreaImageSchema,
+        extra_values={"area_id": area_id},
+    )
 
 
 async def update_area_image(
@@ -5,15 +5,17 @@
 # --------------------------------------------------------------------------
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ._base import (
-    get_objects,
+    Page,
+    get_page,
     get_object,
     create_object,
+    update_object,
     delete_object,
 )
 from src.db.models import Itinerary, ItineraryRequest
@@ -32,6 +34,7 @@ async def get_all_itinerary_requests(
         select(ItineraryRequest)
         .where(ItineraryRequest.is_deleted == False)
         .where(ItineraryRequest.request_user_id == user_id)
+        .order_by(ItineraryRequest.created, ItineraryRequest.id)
         .offset(skip)
         .limit(limit)
     )
@@ -61,37 +64,66 @@ async def create_itinerary_request(
     )
 
 
+def _writable_itinerary_request(request_user_id: Optional[Any]) -> Any:
+    # 삭제되지 않았고, request_user_id가 주어지면 그 사용자가 작성한 요청만 수정/삭제합니다.
+    condition = ItineraryRequest.is_deleted == False
+    if request_user_id is not None:
+        condition = and_(condition, ItineraryRequest.request_user_id == request_user_id)
+    return condition
+
+
 async def update_itinerary_request(
-    db: AsyncSession, request_id: str, request: ItineraryRequestUpdate
+    db: AsyncSession,
+    request_id: str,
+    request: ItineraryRequestUpdate,
+    request_user_id: Optional[Any] = None,
 ) -> Optional[ItineraryRequestSchema]:
-    db_itinerary_request = await db.get(ItineraryRequest, request_id)
-    if db_itinerary_request is None or db_itinerary_request.is_deleted:
-        return None
-    for key, value in request.model_dump(exclude_unset=True).items():
-        setattr(db_itinerary_request, key, value)
-    db.add(db_itinerary_request)
-    await db.commit()
-    await db.refresh(db_itinerary_request)
-    return ItineraryRequestSchema.model_validate(db_itinerary_request)
+    return await update_object(
+        db=db,
+        model=ItineraryRequest,
+        model_id=request_id,
+        obj=request,
+        response_model=ItineraryRequestSchema,
+        condition=_writable_itinerary_request(request_user_id),
+    )
 
 
-async def delete_itinerary_request(db: AsyncSession, request_id: str) -> Optional[str]:
-    db_itinerary_request = await db.get(ItineraryRequest, request_id)
-    db_itinerary_request.is_deleted = True
-    db.add(db_itinerary_request)
+async def delete_itinerary_request(
+    db: AsyncSession, request_id: str, request_user_id: Optional[Any] = None
+) -> Optional[str]:
+    # 여행기 요청은 is_deleted만 표시하는 soft delete입니다.
+    query = (
+        update(ItineraryRequest)
+        .where(ItineraryRequest.id == request_id)
+        .where(_writable_itinerary_request(request_user_id))
+        .values(is_deleted=True)
+        .returning(ItineraryRequest.id)
+    )
+    deleted = (await db.execute(query)).first()
+    if deleted is None:
+        return None
     await db.commit()
     return request_id
 
 
 async def get_all_itineraries(
-    db: AsyncSession, target_user: str, skip: int = 0, limit: int = 100
-) -> List[ItinerarySchema]:
-    condition = f"user_id='{target_user}'"
-    return await get_objects(
+    db: AsyncSession,
+    target_user: str,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> Page:
+    # 여행기의 소유자는 원본 여행기 요청의 작성자입니다.
+    requests = select(ItineraryRequest.id).where(
+        ItineraryRequest.request_user_id == target_user,
+        ItineraryRequest.is_deleted == False,
+    )
+    return await get_page(
         db=db,
-        condition=condition,
+        condition=Itinerary.request_id.in_(requests),
         model=Itinerary,
         response_model=ItinerarySchema,
+        cursor=cursor,
         skip=skip,
         limit=limit,
     )
@@ -5,31 +5,38 @@
 # --------------------------------------------------------------------------
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ._base import (
-    get_objects,
+    Page,
+    get_page,
     get_object,
     create_object,
     update_object,
     delete_object,
+    create_objects,
+    update_objects,
+    delete_objects,
 )
 from src.db.models import Listing
-from src.schemas.requests import ListingCreate, ListingUpdate
+from src.schemas.requests import ListingCreate, ListingUpdate, ListingBulkUpdate
 from src.schemas.responses import ListingSchema
 
 
 async def get_all_listings(
-    db: AsyncSession, skip: int = 0, limit: int = 100
-) -> List[ListingSchema]:
-    return await get_objects(
+    db: AsyncSession, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+) -> Page:
+    return await get_page(
         db=db,
         model=Listing,
         response_model=ListingSchema,
+        cursor=cursor,
         skip=skip,
         limit=limit,
+        projection=True,
     )
 
 
@@ -59,3 +66,27 @@ async def update_listing(
 
 async def delete_listing(db: AsyncSession, listing_id: str) -> Optional[int]:
     return await delete_object(db=db, model=Listing, model_id=listing_id)
+
+
+async def create_listings(
+    db: AsyncSession, listings: List[ListingCreate]
+) -> List[ListingSchema]:
+    return await create_objects(
+        db=db, model=Listing, objs=listings, response_model=ListingSchema
+    )
+
+
+async def update_listings(
+    db: AsyncSession, listings: List[ListingBulkUpdate]
+) -> Dict[UUID, ListingSchema]:
+    return await update_objects(
+        db=db, model=Listing, objs=listings, response_model=ListingSchema
+    )
+
+
+async def delete_listings(
+    db: AsyncSession, listing_ids: List[UUID]
+) -> Dict[UUID, ListingSchema]:
+    return await delete_objects(
+        db=db, model=Listing, model_ids=listing_ids, response_model=ListingSchema
+    )
@@ -5,31 +5,38 @@
 # --------------------------------------------------------------------------
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ._base import (
-    get_objects,
+    Page,
+    get_page,
     get_object,
     create_object,
     update_object,
     delete_object,
+    create_objects,
+    update_objects,
+    delete_objects,
 )
 from src.db.models import Order
-from src.schemas.requests import OrderCreate, OrderUpdate
+from src.schemas.requests import OrderCreate, OrderUpdate, OrderBulkUpdate
 from src.schemas.responses import OrderSchema
 
 
 async def get_all_orders(
-    db: AsyncSession, skip: int = 0, limit: int = 100
-) -> List[OrderSchema]:
-    return await get_objects(
+    db: AsyncSession, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+) -> Page:
+    return await get_page(
         db=db,
         model=Order,
         response_model=OrderSchema,
+        cursor=cursor,
         skip=skip,
         limit=limit,
+        projection=True,
     )
 
 
@@ -59,3 +66,27 @@ async def update_order(
 
 async def delete_order(db: AsyncSession, order_id: str) -> Optional[int]:
     return await delete_object(db=db, model=Order, model_id=order_id)
+
+
+async def create_orders(
+    db: AsyncSession, orders: List[OrderCreate]
+) -> List[OrderSchema]:
+    return await create_objects(
+        db=db, model=Order, objs=orders, response_model=OrderSchema
+    )
+
+
+async def update_orders(
+    db: AsyncSession, orders: List[OrderBulkUpdate]
+) -> Dict[UUID, OrderSchema]:
+    return await update_objects(
+        db=db, model=Order, objs=orders, response_model=OrderSchema
+    )
+
+
+async def delete_orders(
+    db: AsyncSession, order_ids: List[UUID]
+) -> Dict[UUID, OrderSchema]:
+    return await delete_objects(
+        db=db, model=Order, model_ids=order_ids, response_model=OrderSchema
+    )
@@ -5,39 +5,55 @@
 # --------------------------------------------------------------------------
 from __future__ import annotations
 
-from typing import List, Optional
+from collections import defaultdict
+from logging import getLogger
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
 
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ._base import (
+    Page,
+    get_page,
     get_objects,
     get_object,
     create_object,
-    update_object,
-    delete_object,
+    create_objects,
+    update_objects,
+    delete_objects,
 )
-from src.db.models import PointDetail, PointEvent
+from src.db.models import PointBalance, PointDetail, PointEvent
 from src.schemas.requests import (
     PointEventCreate,
     PointEventUpdate,
+    PointEventBulkUpdate,
     PointDetailCreate,
     PointDetailUpdate,
 )
 from src.schemas.responses import PointDetailSchema, PointEventSchema
 
 
+log = getLogger(__name__)
+
+
 async def get_all_point_events(
-    db: AsyncSession, target_user: str, skip: int = 0, limit: int = 100
-) -> List[PointEventSchema]:
-    condition = f"user_id='{target_user}'"
-    return await get_objects(
+    db: AsyncSession,
+    target_user: str,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> Page:
+    return await get_page(
         db=db,
-        condition=condition,
+        condition=PointEvent.user_id == target_user,
         model=PointEvent,
         response_model=PointEventSchema,
+        cursor=cursor,
         skip=skip,
         limit=limit,
+        projection=True,
     )
 
 
@@ -52,25 +68,111 @@ async def get_point_event(
 async def create_point_event(
     db: AsyncSession, event: PointEventCreate
 ) -> PointEventSchema:
-    return await create_object(
-        db=db, model=PointEvent, obj=event, response_model=PointEventSchema
+    result = await create_object(
+        db=db,
+        model=PointEvent,
+        obj=event,
+        response_model=PointEventSchema,
+        commit=False,
     )
+    await apply_point_balance_deltas(db, [(result.user_id, result.amount)])
+    await db.commit()
+    return result
 
 
 async def update_point_event(
     db: AsyncSession, event_id: int, event: PointEventUpdate
 ) -> Optional[PointEventSchema]:
-    return await update_object(
+    updated = await _update_returning_old(
+        db, PointEvent, event_id, event, PointEventSchema, ("user_id", "amount")
+    )
+    if updated is None:
+        return None
+    result, (old_user_id, old_amount) = updated
+    await apply_point_balance_deltas(
+        db, [(old_user_id, -old_amount), (result.user_id, result.amount)]
+    )
+    await db.commit()
+    return result
+
+
+async def delete_point_event(db: AsyncSession, event_id: int) -> Optional[int]:
+    deleted = await delete_objects(
         db=db,
         model=PointEvent,
-        model_id=event_id,
-        obj=event,
+        model_ids=[event_id],
         response_model=PointEventSchema,
+        commit=False,
     )
+    if not deleted:
+        return None
+    old = deleted[event_id]
+    await apply_point_balance_deltas(db, [(old.user_id, -old.amount)])
+    await db.commit()
+    return event_id
 
 
-async def delete_point_event(db: AsyncSession, event_id: int) -> Optional[int]:
-    return await delete_object(db=db, model=PointEvent, model_id=event_id)
+async def create_point_events(
+    db: AsyncSession, events: List[PointEventCreate]
+) -> List[PointEventSchema]:
+    results = await create_objects(
+        db=db,
+        model=PointEvent,
+        objs=events,
+        response_model=PointEventSchema,
+        commit=False,
+    )
+    await apply_point_balance_deltas(
+        db, [(result.user_id, result.amount) for result in results]
+    )
+    await db.commit()
+    return results
+
+
+async def update_point_events(
+    db: AsyncSession, events: List[PointEventBulkUpdate]
+) -> Dict[int, PointEventSchema]:
+    query = (
+        select(PointEvent.id, PointEvent.user_id, PointEvent.amount)
+        .where(PointEvent.id.in_([event.id for event in events]))
+        .with_for_update()
+    )
+    old = {
+        event_id: (user_id, amount)
+        for event_id, user_id, amount in await db.execute(query)
+    }
+    results = await update_objects(
+        db=db,
+        model=PointEvent,
+        objs=events,
+        response_model=PointEventSchema,
+        commit=False,
+    )
+    deltas = []
+    for event_id, result in results.items():
+        old_user_id, old_amount = old[event_id]
+        deltas += [(old_user_id, -old_amount), (result.user_id, result.amount)]
+    await apply_point_balance_deltas(db, deltas)
+    await db.commit()
+    return results
+
+
+async def delete_point_events(
+    db: AsyncSession, event_ids: List[int]
+) -> Dict[int, PointEventSchema]:
+    # RETURNING으로 삭제된 행의 값을 받으므로 미리 잠그고 읽을 필요가 없습니다.
+    results = await delete_objects(
+        db=db,
+        model=PointEvent,
+        model_ids=event_ids,
+        response_model=PointEventSchema,
+        commit=False,
+    )
+    await apply_point_balance_deltas(
+        db, [(result.user_id, -result.amount) for result in results.values()]
+    )
+    await db.commit()
+    return results
 
 
 async def get_all_point_details(
@@ -82,6 +184,7 @@ async def get_all_point_details(
         response_model=PointDetailSchema,
         skip=skip,
         limit=limit,
+        projection=True,
     )
 
 
@@ -96,42 +199,213 @@ async def get_point_detail(
 async def create_point_detail(
     db: AsyncSession, detail: PointDetailCreate
 ) -> PointDetailSchema:
-    return await create_object(
-        db=db, model=PointDetail, obj=detail, response_model=PointDetailSchema
+    result = await create_object(
+        db=db,
+        model=PointDetail,
+        obj=detail,
+        response_model=PointDetailSchema,
+        commit=False,
     )
+    owners = await _get_event_owners(db, [result.event_id])
+    await apply_point_balance_deltas(db, [(owners[result.event_id], -result.point)])
+    await db.commit()
+    return result
 
 
 async def update_point_detail(
     db: AsyncSession, detail_id: int, detail: PointDetailUpdate
 ) -> Optional[PointDetailSchema]:
-    return await update_object(
+    updated = await _update_returning_old(
+        db, PointDetail, detail_id, detail, PointDetailSchema, ("event_id", "point")
+    )
+    if updated is None:
+        return None
+    result, (old_event_id, old_point) = updated
+    owners = await _get_event_owners(db, [old_event_id, result.event_id])
+    await apply_point_balance_deltas(
+        db,
+        [
+            (owners[old_event_id], old_point),
+            (owners[result.event_id], -result.point),
+        ],
+    )
+    await db.commit()
+    return result
+
+
+async def delete_point_detail(db: AsyncSession, detail_id: int) -> Optional[int]:
+    deleted = await delete_objects(
         db=db,
         model=PointDetail,
-        model_id=detail_id,
-        obj=detail,
+        model_ids=[detail_id],
         response_model=PointDetailSchema,
+        commit=False,
     )
+    if not deleted:
+        return None
+    old = deleted[detail_id]
+    owners = await _get_event_owners(db, [old.event_id])
+    await apply_point_balance_deltas(db, [(owners[old.event_id], old.point)])
+    await db.commit()
+    return detail_id
 
 
-async def delete_point_detail(db: AsyncSession, detail_id: int) -> Optional[int]:
-    return await delete_object(db=db, model=PointDetail, model_id=detail_id)
+async def _update_returning_old(
+    db: AsyncSession,
+    model: Any,
+    model_id: int,
+    obj: BaseModel,
+    response_model: Type[BaseModel],
+    old_columns: Sequence[str],
+) -> Optional[Tuple[Any, Tuple[Any, ...]]]:
+    """
+    행을 수정하고, 수정된 행과 변경 전 old_columns 값을 함께 반환합니다. 행이 없으면 None입니다.
+
+    변경 전 값으로 잔액 증감분을 계산하므로, 행을 FOR UPDATE로 잠그며 읽는 CTE와
+    UPDATE ... RETURNING을 한 문장으로 실행해 읽기와 쓰기 사이에 다른 수정이 끼어들지 못하게 합니다.
+    """
+    table = model.__table__
+    old = (
+        select(table.c.id, *(table.c[name] for name in old_columns))
+        .where(table.c.id == model_id)
+        .with_for_update()
+        .cte("old")
+    )
+    query = (
+        update(table)
+        .where(table.c.id == old.c.id)
+        .values(obj.model_dump(exclude_unset=True))
+        .returning(
+            *table.c, *(old.c[name].label(f"old_{name}") for name in old_columns)
+        )
+    )
+    row = (await (await db.connection()).execute(query)).mappings().first()
+    if row is None:
+        return None
+    result = response_model.model_validate({key: row[key] for key in table.c.keys()})
+    return result, tuple(row[f"old_{name}"] for name in old_columns)
+
+
+async def _get_event_owners(
+    db: AsyncSession, event_ids: Iterable[int]
+) -> Dict[int, Any]:
+    query = select(PointEvent.id, PointEvent.user_id).where(
+        PointEvent.id.in_(set(event_ids))
+    )
+    return {event_id: user_id for event_id, user_id in await db.execute(query)}
+
+
+async def apply_point_balance_deltas(
+    db: AsyncSession, deltas: Iterable[Tuple[Any, int]]
+) -> None:
+    """
+    사용자별 잔액 증감분을 Point_Balance에 한 번의 upsert로 반영합니다.
+
+    commit하지 않으므로 호출한 쪽의 Point_Event/Point_Detail 변경과 같은
+    transaction에 묶입니다. 잠금 순서를 고정하기 위해 user_id 순으로 정렬합니다.
+    """
+    totals: Dict[Any, int] = defaultdict(int)
+    for user_id, delta in deltas:
+        totals[user_id] += delta
+    rows = [
+        {"user_id": user_id, "balance": delta}
+        for user_id, delta in sorted(totals.items(), key=lambda item: str(item[0]))
+        if delta
+    ]
+    if not rows:
+        return
+
+    stmt = insert(PointBalance).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PointBalance.user_id],
+        set_={
+            "balance": PointBalance.balance + stmt.excluded.balance,
+            "updated": func.now(),
+        },
+    )
+    await db.execute(stmt)
 
 
-# Function to calculate remaining points
 async def get_user_points(db: AsyncSession, user_id: str) -> int:
-    query = select(PointEvent).where(PointEvent.user_id == user_id)
-    result = await db.execute(query)
-    events = result.scalars().all()
+    query = select(PointBalance.balance).where(PointBalance.user_id == user_id)
+    balance = (await db.execute(query)).scalar_one_or_none()
+    return balance or 0
+
+
+async def calculate_user_points(db: AsyncSession, user_id: str) -> int:
+    """Point_Balance를 거치지 않고 이력 전체를 DB에서 집계한 잔액입니다. (검증용)"""
+    earned = select(func.coalesce(func.sum(PointEvent.amount), 0)).where(
+        PointEvent.user_id == user_id
+    )
+    used = (
+        select(func.coalesce(func.sum(PointDetail.point), 0))
+        .join(PointEvent, PointEvent.id == PointDetail.event_id)
+        .where(PointEvent.user_id == user_id)
+    )
+    query = select(earned.scalar_subquery() - used.scalar_subquery())
+    return (await db.execute(query)).scalar_one()
+
+
+async def check_user_points(db: AsyncSession, user_id: str) -> Dict[str, Any]:
+    """
+    ledger 잔액과 이력 전체를 집계한 잔액을 함께 읽어 비교합니다.
 
-    total_points = 0
-    for event in events:
-        total_points += event.amount
+    잠금이나 쓰기 없이 읽기만 하므로 replica에서도 실행되며,
+    어긋난 ledger는 src.utils.point_balance 배치 작업이 바로잡습니다.
+    """
+    balance = await get_user_points(db, user_id)
+    verified = await calculate_user_points(db, user_id)
+    return {
+        "balance": balance,
+        "verified_balance": verified,
+        "consistent": balance == verified,
+    }
 
-    query = select(PointDetail).where(PointDetail.event_id.in_([e.id for e in events]))
-    result = await db.execute(query)
-    details = result.scalars().all()
 
-    for detail in details:
-        total_points -= detail.point
+async def repair_user_points(
+    db: AsyncSession, user_ids: Sequence[Any]
+) -> Dict[Any, int]:
+    """
+    user_ids의 ledger를 이력 집계 값으로 바로잡고, 보정한 사용자별 증감분을 반환합니다.
+
+    commit하지 않으며, 호출한 쪽이 같은 transaction에서 commit합니다.
+    """
+    # ledger 행을 먼저 잠가, 집계 이후에 커밋되는 쓰기의 증감분이 보정 뒤에 반영되게 합니다.
+    ledger = dict(
+        (
+            await db.execute(
+                select(PointBalance.user_id, PointBalance.balance)
+                .where(PointBalance.user_id.in_(user_ids))
+                .order_by(PointBalance.user_id)
+                .with_for_update()
+            )
+        ).all()
+    )
+    actual: Dict[Any, int] = defaultdict(int)
+    earned = await db.execute(
+        select(PointEvent.user_id, func.sum(PointEvent.amount))
+        .where(PointEvent.user_id.in_(user_ids))
+        .group_by(PointEvent.user_id)
+    )
+    used = await db.execute(
+        select(PointEvent.user_id, func.sum(PointDetail.point))
+        .join(PointEvent, PointEvent.id == PointDetail.event_id)
+        .where(PointEvent.user_id.in_(user_ids))
+        .group_by(PointEvent.user_id)
+    )
+    for user_id, amount in earned:
+        actual[user_id] += amount
+    for user_id, point in used:
+        actual[user_id] -= point
 
-    return total_points
+    deltas = {}
+    for user_id in user_ids:
+        delta = actual[user_id] - ledger.get(user_id, 0)
+        if delta:
+            log.warning(
+                f"Point balance ledger of {user_id} was {ledger.get(user_id, 0)}, "
+                f"expected {actual[user_id]}"
+            )
+            deltas[user_id] = delta
+    await apply_point_balance_deltas(db, deltas.items())
+    return deltas
@@ -5,13 +5,14 @@
 # --------------------------------------------------------------------------
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ._base import (
-    get_objects,
+    Page,
+    get_page,
     get_object,
     create_object,
     update_object,
@@ -21,19 +22,25 @@ from src.db.models import User
 from src.schemas.requests import UserCreate, UserUpdate
 from src.schemas.responses import UserSchema
 from src.helper.exceptions import InternalException, ErrorCode
-from src.utils.authentication import decode_user_data_from_token, get_password_hash
+from src.utils.authentication import (
+    decode_user_data_from_token,
+    password_hasher,
+    principal_cache,
+)
 
 
 async def get_all_users(
-    db: AsyncSession, skip: int = 0, limit: int = 100
-) -> List[UserSchema]:
-    return await get_objects(
+    db: AsyncSession, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+) -> Page:
+    return await get_page(
         db=db,
         model=User,
         response_model=UserSchema,
         # condition="",
+        cursor=cursor,
         skip=skip,
         limit=limit,
+        projection=True,
     )
 
 
@@ -60,7 +67,7 @@ async def get_current_user(db: AsyncSession):
 
 
 async def create_user(db: AsyncSession, user: UserCreate) -> UserSchema:
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await password_hasher.hash(user.password)
     user.password = hashed_password
     return await create_object(db=db, model=User, obj=user, response_model=UserSchema)
 
@@ -68,17 +75,21 @@ async def create_user(db: AsyncSession, user: UserCreate) -> UserSchema:
 async def update_user(
     db: AsyncSession, user_id: str, user: UserUpdate
 ) -> Optional[UserSchema]:
-    return await update_object(
+    updated_user = await update_object(
         db=db,
         model=User,
         model_id=user_id,
         obj=user,
         response_model=UserSchema,
     )
+    principal_cache.invalidate_user(user_id)
+    return updated_user
 
 
 async def delete_user(db: AsyncSession, user_id: str) -> Optional[int]:
-    return await delete_object(db=db, model=User, model_id=user_id)
+    deleted_id = await delete_object(db=db, model=User, model_id=user_id)
+    principal_cache.invalidate_user(user_id)
+    return deleted_id
 
 
 async def get_user_by_identifier(db: AsyncSession, identifier: str) -> Optional[User]:
@@ -3,7 +3,7 @@
 #
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import Column, DateTime, Index, func
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import object_session, Session
 from sqlalchemy.orm import declarative_base
@@ -19,6 +19,19 @@ class ModelBase(Base):
     def __tablename__(cls) -> str:
         return cls.__name__.lower()
 
+    @declared_attr
+    def __table_args__(cls) -> tuple:
+        # 모든 목록 조회가 (created, id) 순서의 keyset 페이지네이션을 사용하므로
+        # id 컬럼이 있는 테이블마다 해당 복합 인덱스를 둡니다.
+        # 추가 인덱스는 __indexes__에 선언합니다.
+        indexes = tuple(getattr(cls, "__indexes__", ()))
+        if "id" not in cls.__dict__:
+            return indexes
+        return (
+            Index(f"ix_{cls.__tablename__}_created_id", "created", "id"),
+            *indexes,
+        )
+
     created = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated = Column(
         DateTime(timezone=True),
@@ -1,15 +1,30 @@
+import io
+import os
+import time
 import random
-import chardet
+import asyncio
+import hashlib
+import logging
 import pandas as pd
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from chardet.universaldetector import UniversalDetector
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-from src.db.models import Area
 from src.db import database
-from src.schemas.requests import AreaCreate
+from src.crud.area import upsert_areas
+from src.schemas.responses import AreaIngestReport
+from src.utils.jobs import Job, run_in_process
 from enum import Enum
 
 
+logger = logging.getLogger(__name__)
+
+VISITOR_STATS_FILE_PATH = "src/db/data/20240602001629_지역별 방문자 수.csv"
+
+
 class AreaName(Enum):
     강남구 = "Gangnam-gu"
     강동구 = "Gangdong-gu"
@@ -38,56 +53,200 @@ class AreaName(Enum):
     중랑구 = "Jungnang-gu"
 
 
-async def create_data(db: AsyncSession, data: AreaCreate):
-    db_data = Area(**data.model_dump())
-    db.add(db_data)
-    await db.commit()
-    await db.refresh(db_data)
-    return db_data
+ENCODING_DETECT_BYTES = 64 * 1024
+
+TOURISM_CSV_COLUMNS = {
+    '영문명': 'name',
+    '상세주소': 'address',
+    '홈페이지': 'website',
+    '연락처': 'contact_num',
+}
+
+# Area 컬럼 길이 제한 (src.db.models.Area)
+AREA_MAX_LENGTHS = {'name': 100, 'address': 512, 'contact_num': 100}
+
+
+class EncodingSniffer:
+    """파일 앞부분(limit bytes)만 보고 인코딩을 추정합니다."""
+
+    def __init__(self, limit: int = ENCODING_DETECT_BYTES):
+        self.limit = limit
+        self._seen = 0
+        self._detector = UniversalDetector()
+
+    def feed(self, chunk: bytes) -> None:
+        if self._detector.done or self._seen >= self.limit:
+            return
+        chunk = chunk[: self.limit - self._seen]
+        self._seen += len(chunk)
+        self._detector.feed(chunk)
+
+    def result(self) -> str:
+        self._detector.close()
+        encoding = (self._detector.result['encoding'] or 'utf-8').lower()
+        # EUC-KR로 추정되어도 확장 문자를 포함할 수 있으므로 상위 호환인 cp949로 읽습니다.
+        return 'cp949' if encoding == 'euc-kr' else encoding
 
 
 def detect_encoding(file_path: str) -> str:
+    sniffer = EncodingSniffer()
     with open(file_path, 'rb') as f:
-        result = chardet.detect(f.read())
-    return result['encoding']
+        sniffer.feed(f.read(ENCODING_DETECT_BYTES))
+    return sniffer.result()
+
+
+def read_tourism_csv(
+    file_path: str, encoding: Optional[str] = None
+) -> Tuple[List[dict], int]:
+    """
+    관광자원정보 CSV를 Area 적재용 record 목록으로 변환합니다.
+
+    행 단위 pydantic 검증 대신 컬럼 단위(vectorized)로 검증하며,
+    (유효한 record 목록, 제외된 행 수)를 반환합니다.
+    process pool에서 실행할 수 있도록 module 최상위 함수로 둡니다.
+    """
+    encoding = encoding or detect_encoding(file_path)
+
+    df = pd.read_csv(file_path, encoding=encoding, dtype=str)
+    missing_columns = set(TOURISM_CSV_COLUMNS) - set(df.columns)
+    if missing_columns:
+        raise ValueError(f"Missing CSV columns: {sorted(missing_columns)}")
+
+    df = df[list(TOURISM_CSV_COLUMNS)].rename(columns=TOURISM_CSV_COLUMNS)
+    total_rows = len(df)
+
+    df['name'] = df['name'].str.strip()
+    df['address'] = df['address'].fillna('')
+    df = df.dropna(subset=['name'])
+    df = df[df['name'] != '']
+    df = df.drop_duplicates(subset=['name'])
+
+    valid = pd.Series(True, index=df.index)
+    for column, max_length in AREA_MAX_LENGTHS.items():
+        valid &= df[column].isna() | (df[column].str.len() <= max_length)
+    df = df[valid]
 
+    df = df.astype(object).where(df.notna(), None)
+    return df.to_dict('records'), total_rows - len(df)
 
-async def csv_to_db(db: AsyncSession):
+
+async def csv_to_db(db: AsyncSession) -> AreaIngestReport:
     file_path = "src/db/data/한국문화관광연구원_관광자원정보.csv"
-    encoding = detect_encoding(file_path)
 
-    df = pd.read_csv(file_path, encoding=encoding)
-    df = df.dropna(subset=['영문명'])
-    df['영문명'] = df['영문명'].str.strip()
-    df = df.drop_duplicates(subset=['영문명'])
+    started = time.perf_counter()
+    areas, rejected = await asyncio.to_thread(read_tourism_csv, file_path)
+    parse_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    report = await upsert_areas(db, areas)
+    report.parse_ms = parse_ms
+    report.rejected = rejected
+    return report
+
 
-    for _, row in df.iterrows():
-        data = AreaCreate(
-            name=str(row['영문명']),
-            address=str(row['상세주소']),
-            website=str(row['홈페이지']),
-            contact_num=str(row['연락처']),
-        )
-        await create_data(db, data)
+async def ingest_tourism_csv_file(
+    job: Job, bind: AsyncEngine, file_path: str, encoding: str
+) -> AreaIngestReport:
+    """업로드된 관광자원정보 CSV를 process pool에서 파싱한 뒤 Area 테이블에 적재합니다."""
+    try:
+        job.advance("parsing")
+        started = time.perf_counter()
+        areas, rejected = await run_in_process(read_tourism_csv, file_path, encoding)
+        parse_ms = round((time.perf_counter() - started) * 1000, 3)
 
+        job.advance("writing", processed=0, total=len(areas))
+        async with AsyncSession(bind=bind) as db:
+            report = await upsert_areas(
+                db, areas, on_batch=lambda done: job.advance("writing", done)
+            )
+        report.parse_ms = parse_ms
+        report.rejected = rejected
+        job.advance("done", processed=len(areas))
+        return report
+    finally:
+        os.unlink(file_path)
 
-async def get_top_5_areas(file_path: str):
-    encoding = detect_encoding(file_path)
-    df = pd.read_csv(file_path, encoding=encoding)
+
+def rank_areas(content: bytes, size: int = 5) -> Tuple[str, ...]:
+    sniffer = EncodingSniffer()
+    sniffer.feed(content)
+    encoding = sniffer.result()
+    df = pd.read_csv(io.BytesIO(content), encoding=encoding)
 
     df['기초지자체명'] = df['기초지자체명'].str.strip()
 
     df = df.dropna(subset=['기초지자체 방문자 수'])
 
-    top_5_areas = df.sort_values(by='기초지자체 방문자 수', ascending=False).head(5)
+    top_areas = df.sort_values(by='기초지자체 방문자 수', ascending=False).head(size)
+
+    return tuple(
+        AreaName[x].value if x in AreaName.__members__ else x
+        for x in top_areas['기초지자체명']
+    )
+
+
+class AreaRanking:
+    """
+    지역별 방문자 수 CSV를 한 번만 파싱해 상위 지역(영문명) 목록을 메모리에 보관합니다.
+
+    파일의 mtime/size가 바뀌었고 내용 hash도 달라진 경우에만 다시 파싱하며,
+    요청 처리 경로(top, choice)는 디스크나 chardet, pandas를 사용하지 않습니다.
+    """
+
+    def __init__(self, file_path: str, size: int = 5):
+        self.file_path = file_path
+        self.size = size
+        self.top: Tuple[str, ...] = ()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._digest: Optional[str] = None
 
-    top_5_areas['기초지자체명_영어'] = top_5_areas['기초지자체명'].map(
-        lambda x: AreaName[x].value if x in AreaName.__members__ else x)
+    def reload_if_changed(self) -> bool:
+        stat = os.stat(self.file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return False
 
-    return top_5_areas['기초지자체명_영어'].tolist()
+        with open(self.file_path, 'rb') as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()
+        self._signature = signature
+        if digest == self._digest:
+            return False
+
+        self.top = rank_areas(content, self.size)
+        self._digest = digest
+        logger.info(f"Loaded visitor ranking from {self.file_path}: {self.top}")
+        return True
+
+    def choice(self) -> str:
+        if not self.top:
+            self.reload_if_changed()
+        return random.choice(self.top)
+
+    async def watch(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.reload_if_changed)
+            except Exception:
+                logger.exception(f"Failed to reload visitor ranking from {self.file_path}")
+
+
+area_ranking = AreaRanking(VISITOR_STATS_FILE_PATH)
+
+
+async def get_top_5_areas(file_path: str = VISITOR_STATS_FILE_PATH):
+    if file_path == area_ranking.file_path:
+        if not area_ranking.top:
+            area_ranking.reload_if_changed()
+        return list(area_ranking.top)
+
+    with open(file_path, 'rb') as f:
+        return list(rank_areas(f.read()))
 
 
-async def get_random_area(file_path: str):
+async def get_random_area(file_path: str = VISITOR_STATS_FILE_PATH):
+    if file_path == area_ranking.file_path:
+        return area_ranking.choice()
     top_5_areas = await get_top_5_areas(file_path)
     return random.choice(top_5_areas)
 
@@ -1,27 +1,94 @@
 # --------------------------------------------------------------------------
 # Database 연결에 사용되는 로직을 정의한 모듈입니다.
 #
+# POSTGRES_REPLICA_SERVER가 설정되어 있으면 읽기 전용 요청의 SELECT는 replica pool로,
+# 그 외의 모든 문은 primary pool로 보냅니다.
+#
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import Engine, Select
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
 
 from pydantic import AnyUrl
 
 from src.core.settings import settings
 from src.db._base import Base
+from src.utils.metrics import InstrumentedAsyncQueuePool
 
 
 SQLALCHEMY_DATABASE_URL: AnyUrl = str(settings.DATABASE_URI)
 engine_options = settings.DATABASE_OPTIONS
 
-engine = create_async_engine(SQLALCHEMY_DATABASE_URL, **engine_options)
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL, poolclass=InstrumentedAsyncQueuePool, **engine_options
+)
+
+replica_engine: Optional[AsyncEngine] = None
+if settings.DATABASE_REPLICA_URI is not None:
+    replica_engine = create_async_engine(
+        str(settings.DATABASE_REPLICA_URI),
+        poolclass=InstrumentedAsyncQueuePool,
+        **engine_options,
+    )
+
+# 이 header가 있는 요청은 읽기 전용이라도 primary에서 읽습니다. (쓰기 직후 다시 읽는 경우 등)
+PRIMARY_HEADER = "X-DB-Primary"
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class RoutingSession(Session):
+    """
+    replica가 주어지면 잠금 없는 SELECT를 replica로 보내는 Session입니다.
+
+    flush, INSERT/UPDATE/DELETE, FOR UPDATE 같은 쓰기 문이 한 번이라도 실행되면
+    그 뒤의 SELECT도 primary로 보내 같은 session 안에서는 방금 쓴 값을 읽도록 합니다.
+    """
+
+    def __init__(self, *args, replica: Optional[Engine] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica = replica
+        self.use_primary = replica is None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if not self.use_primary:
+            if (
+                not self._flushing
+                and isinstance(clause, Select)
+                and clause._for_update_arg is None
+            ):
+                return self.replica
+            self.use_primary = True
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def wants_replica(request: Request) -> bool:
+    if request.method not in READ_ONLY_METHODS:
+        return False
+    return request.headers.get(PRIMARY_HEADER, "").lower() not in ("1", "true", "yes")
+
+
+def open_session(
+    request: Request, primary: AsyncEngine, replica: Optional[AsyncEngine] = None
+) -> AsyncSession:
+    """요청의 method와 PRIMARY_HEADER를 보고 replica를 쓸 수 있는 session을 엽니다."""
+    if replica is not None and wants_replica(request):
+        return AsyncSession(
+            bind=primary,
+            sync_session_class=RoutingSession,
+            replica=replica.sync_engine,
+        )
+    return AsyncSession(bind=primary, sync_session_class=RoutingSession)
 
 
 # Dependency
-async def get_db():
+async def get_db(request: Request):
     db = None
     try:
-        db = AsyncSession(bind=engine)
+        db = open_session(request, engine, replica_engine)
         yield db
     finally:
         await db.close()
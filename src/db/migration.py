@@ -0,0 +1,62 @@
+# --------------------------------------------------------------------------
+# DB schema migration(Alembic) revision을 확인하는 로직을 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+
+
+class SchemaRevisionError(RuntimeError):
+    pass
+
+
+def get_alembic_config() -> Config:
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    return config
+
+
+@lru_cache(maxsize=1)
+def get_head_revision() -> Optional[str]:
+    """migration 파일만 읽어 head revision을 구하며, DB에는 접근하지 않습니다."""
+    return ScriptDirectory.from_config(get_alembic_config()).get_current_head()
+
+
+async def get_current_revision(conn: AsyncConnection) -> Optional[str]:
+    try:
+        result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+    except ProgrammingError:
+        return None
+    return result.scalar_one_or_none()
+
+
+async def check_schema_revision(conn: AsyncConnection) -> str:
+    """
+    DB의 alembic_version이 코드의 head revision과 같은지 한 번의 query로 확인합니다.
+
+    worker는 schema를 만들거나 reflection하지 않고, 배포 단계에서
+    `alembic upgrade head`가 먼저 실행되었는지만 확인합니다.
+    """
+    head = get_head_revision()
+    current = await get_current_revision(conn)
+    if current != head:
+        raise SchemaRevisionError(
+            f"DB schema revision is {current!r} but the application expects {head!r}. "
+            "Run `alembic upgrade head` before starting workers. A database created "
+            "by the old metadata.create_all must first be marked with "
+            "`alembic stamp 0001` so that the following revisions are applied to it."
+        )
+    return current
@@ -0,0 +1,442 @@
+"""baseline: 기존 metadata.create_all 시점(migration 도입 이전)의 model schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 04:23:41.610769
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "Area",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("address", sa.String(length=512), nullable=False),
+        sa.Column("website", sa.Text(), nullable=True),
+        sa.Column("contact_num", sa.String(length=100), nullable=True),
+        sa.Column("open_time", sa.Text(), nullable=True),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "Hashtag",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("id2", sa.UUID(), nullable=False),
+        sa.Column("tag", sa.String(length=100), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "Listing",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("seller_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column("is_closed", sa.Boolean(), nullable=False),
+        sa.Column("detail", sa.Text(), nullable=False),
+        sa.Column("seller_info", sa.Text(), nullable=False),
+        sa.Column("promotion_start", sa.TIMESTAMP(), nullable=False),
+        sa.Column("promotion_end", sa.TIMESTAMP(), nullable=False),
+        sa.Column("amount", sa.Integer(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "Users",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("email", sa.String(length=256), nullable=True),
+        sa.Column("password", sa.String(length=256), nullable=True),
+        sa.Column("nickname", sa.String(length=30), nullable=True),
+        sa.Column("create_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("bio", sa.String(length=50), nullable=False),
+        sa.Column("point", sa.Integer(), nullable=True),
+        sa.Column("profile_img", sa.String(length=2048), nullable=True),
+        sa.Column("first_name", sa.String(length=50), nullable=True),
+        sa.Column("last_name", sa.String(length=50), nullable=True),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email"),
+    )
+    op.create_table(
+        "Area_Image",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("area_id", sa.Integer(), nullable=False),
+        sa.Column("area_img", sa.String(length=2048), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["area_id"],
+            ["Area.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "Area_Review",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("area_id", sa.Integer(), nullable=False),
+        sa.Column("reviewer_id", sa.UUID(), nullable=False),
+        sa.Column("detail", sa.Text(), nullable=False),
+        sa.Column("rating", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["area_id"],
+            ["Area.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "Itinerary_Request",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("listing_id", sa.UUID(), nullable=False),
+        sa.Column("order_id", sa.UUID(), nullable=False),
+        sa.Column("request_user_id", sa.UUID(), nullable=False),
+        sa.Column("first_name", sa.String(length=50), nullable=False),
+        sa.Column("last_name", sa.String(length=25), nullable=False),
+        sa.Column("birthday", sa.Date(), nullable=False),
+        sa.Column("person_under", sa.Integer(), nullable=True),
+        sa.Column("person_over", sa.Integer(), nullable=True),
+        sa.Column("contact_method", sa.String(), nullable=False),
+        sa.Column("contact", sa.String(length=100), nullable=False),
+        sa.Column("travel_start", sa.Date(), nullable=False),
+        sa.Column("travel_end", sa.Date(), nullable=False),
+        sa.Column("travel_purpose", sa.Text(), nullable=False),
+        sa.Column(
+            "travel_pri",
+            postgresql.ARRAY(
+                sa.Enum(
+                    "ACTIVITIES",
+                    "BUDGET",
+                    "CULTURE",
+                    "CUISINE",
+                    "HISTORY",
+                    "LOCAL_EVENTS",
+                    "NATURE",
+                    "PHOTOGRAPHY",
+                    "RELAXATION",
+                    "SHOPPING",
+                    name="travelprienum",
+                    native_enum=False,
+                )
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "transport_pri",
+            postgresql.ARRAY(
+                sa.Enum(
+                    "TAXI", "CAR", "PUBLIC", name="transportprienum", native_enum=False
+                )
+            ),
+            nullable=False,
+        ),
+        sa.Column("travel_restrict", sa.Text(), nullable=True),
+        sa.Column("travel_addi", sa.Text(), nullable=True),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["listing_id"],
+            ["Listing.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "Orders",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("amount", sa.Integer(), nullable=False),
+        sa.Column("is_refunded", sa.Boolean(), nullable=False),
+        sa.Column("buyer_id", sa.UUID(), nullable=False),
+        sa.Column("listing_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["listing_id"],
+            ["Listing.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "Point_Event",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("event_type", sa.String(), nullable=False),
+        sa.Column("amount", sa.Integer(), nullable=False),
+        sa.Column("detail", sa.String(length=100), nullable=False),
+        sa.Column("event_date", sa.TIMESTAMP(), nullable=False),
+        sa.Column("exp_date", sa.TIMESTAMP(), nullable=True),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["Users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "User_Review",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("reviewer_id", sa.UUID(), nullable=False),
+        sa.Column("detail", sa.Text(), nullable=False),
+        sa.Column("rating", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["reviewer_id"],
+            ["Users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "Itinerary",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("request_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["request_id"],
+            ["Itinerary_Request.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "Point_Detail",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("related_event_id", sa.Integer(), nullable=False),
+        sa.Column("point_date", sa.TIMESTAMP(), nullable=False),
+        sa.Column("point", sa.Integer(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["event_id"],
+            ["Point_Event.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["related_event_id"],
+            ["Point_Event.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "Place_Container",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("itinerary_id", sa.UUID(), nullable=False),
+        sa.Column("request_id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("container_date", sa.Date(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["itinerary_id"],
+            ["Itinerary.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["request_id"],
+            ["Itinerary_Request.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "Transport_Container",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("itinerary_id", sa.UUID(), nullable=False),
+        sa.Column("request_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "type",
+            sa.Enum("WALK", "DRIVING", "SUBWAY", "BUS", name="transportenum"),
+            nullable=False,
+        ),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("duration", sa.Integer(), nullable=False),
+        sa.Column("container_date", sa.Date(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["itinerary_id"],
+            ["Itinerary.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["request_id"],
+            ["Itinerary_Request.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("Transport_Container")
+    sa.Enum(name="transportenum").drop(op.get_bind(), checkfirst=True)
+    op.drop_table("Place_Container")
+    op.drop_table("Point_Detail")
+    op.drop_table("Itinerary")
+    op.drop_table("User_Review")
+    op.drop_table("Point_Event")
+    op.drop_table("Orders")
+    op.drop_table("Itinerary_Request")
+    op.drop_table("Area_Review")
+    op.drop_table("Area_Image")
+    op.drop_table("Users")
+    op.drop_table("Listing")
+    op.drop_table("Hashtag")
+    op.drop_table("Area")
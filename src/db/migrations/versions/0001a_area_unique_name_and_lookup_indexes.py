@@ -0,0 +1,112 @@
+"""area unique name and lookup indexes: Area.name unique 제약과 content_hash, keyset/조회 인덱스
+
+migration 도입 이전에 create_all로 만든 DB는 `alembic stamp 0001` 후 이 revision부터 적용합니다.
+같은 이름의 Area가 여러 행이면 가장 작은 id만 남기고, 나머지 행의 이미지와 리뷰는
+남는 행으로 옮긴 뒤 삭제합니다.
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-18 05:31:12.204117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001a"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (created, id) keyset 페이지네이션 인덱스를 두는 테이블입니다.
+KEYSET_TABLES = (
+    "Area",
+    "Hashtag",
+    "Listing",
+    "Users",
+    "Area_Image",
+    "Area_Review",
+    "Itinerary_Request",
+    "Orders",
+    "Point_Event",
+    "User_Review",
+    "Itinerary",
+    "Point_Detail",
+    "Place_Container",
+    "Transport_Container",
+)
+
+# (인덱스 이름, 테이블, 컬럼)
+LOOKUP_INDEXES = (
+    ("ix_Users_nickname", "Users", ["nickname"]),
+    ("ix_Area_Image_area_id_created_id", "Area_Image", ["area_id", "created", "id"]),
+    ("ix_Orders_buyer_id", "Orders", ["buyer_id"]),
+    ("ix_Orders_listing_id", "Orders", ["listing_id"]),
+    ("ix_Point_Event_user_id_created_id", "Point_Event", ["user_id", "created", "id"]),
+    ("ix_Itinerary_request_id", "Itinerary", ["request_id"]),
+    ("ix_Point_Detail_event_id", "Point_Detail", ["event_id"]),
+    ("ix_Point_Detail_related_event_id", "Point_Detail", ["related_event_id"]),
+    ("ix_Place_Container_itinerary_id", "Place_Container", ["itinerary_id"]),
+    ("ix_Transport_Container_itinerary_id", "Transport_Container", ["itinerary_id"]),
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE area_duplicates AS
+        SELECT id, MIN(id) OVER (PARTITION BY name) AS keep_id
+        FROM "Area"
+        """
+    )
+    op.execute("DELETE FROM area_duplicates WHERE id = keep_id")
+    for table in ("Area_Image", "Area_Review"):
+        op.execute(
+            f"""
+            UPDATE "{table}" AS child SET area_id = duplicate.keep_id
+            FROM area_duplicates AS duplicate
+            WHERE child.area_id = duplicate.id
+            """
+        )
+    op.execute('DELETE FROM "Area" WHERE id IN (SELECT id FROM area_duplicates)')
+    op.execute("DROP TABLE area_duplicates")
+
+    op.add_column(
+        "Area", sa.Column("content_hash", sa.String(length=64), nullable=True)
+    )
+    op.create_unique_constraint("Area_name_key", "Area", ["name"])
+
+    for table in KEYSET_TABLES:
+        op.create_index(
+            f"ix_{table}_created_id", table, ["created", "id"], unique=False
+        )
+    for name, table, columns in LOOKUP_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+    op.create_index(
+        "ix_Itinerary_Request_request_user_id_active",
+        "Itinerary_Request",
+        ["request_user_id", "created", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_Itinerary_Request_request_user_id_active",
+        table_name="Itinerary_Request",
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+    for name, table, _ in reversed(LOOKUP_INDEXES):
+        op.drop_index(name, table_name=table)
+    for table in reversed(KEYSET_TABLES):
+        op.drop_index(f"ix_{table}_created_id", table_name=table)
+
+    # 합쳐진 중복 Area 행은 되돌리지 않습니다.
+    op.drop_constraint("Area_name_key", "Area", type_="unique")
+    op.drop_column("Area", "content_hash")
@@ -0,0 +1,59 @@
+"""point balance ledger: 사용자별 포인트 잔액 테이블과 기존 이력 backfill
+
+Revision ID: 0002
+Revises: 0001a
+Create Date: 2026-10-18 04:26:07.478172
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "Point_Balance",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("balance", sa.Integer(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["Users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO "Point_Balance" (user_id, balance)
+        SELECT history.user_id, SUM(history.delta)
+        FROM (
+            SELECT user_id, amount AS delta FROM "Point_Event"
+            UNION ALL
+            SELECT event.user_id, -detail.point
+            FROM "Point_Detail" AS detail
+            JOIN "Point_Event" AS event ON event.id = detail.event_id
+        ) AS history
+        GROUP BY history.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("Point_Balance")
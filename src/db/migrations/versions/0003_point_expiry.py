@@ -0,0 +1,39 @@
+"""point expiry: 만료 처리 표시 컬럼과 만료 대상 partial 인덱스
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 04:28:56.539655
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("Point_Event", sa.Column("expired_at", sa.TIMESTAMP(), nullable=True))
+    op.create_index(
+        "ix_Point_Event_pending_expiry",
+        "Point_Event",
+        ["user_id", "exp_date"],
+        unique=False,
+        postgresql_where=sa.text("expired_at IS NULL AND exp_date IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_Point_Event_pending_expiry",
+        table_name="Point_Event",
+        postgresql_where=sa.text("expired_at IS NULL AND exp_date IS NOT NULL"),
+    )
+    op.drop_column("Point_Event", "expired_at")
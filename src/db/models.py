@@ -9,6 +9,7 @@ from typing import Optional
 from enum import Enum
 
 from sqlalchemy import (
+    Index,
     Integer,
     String,
     Column,
@@ -20,13 +21,13 @@ from sqlalchemy import (
     Enum as SQLAlchemyEnum,
     UUID as SQLUUID,
 )
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 
 from src.db._base import ModelBase
-from src.utils.authentication import verify_password
+from src.utils.authentication import password_hasher
 
 
 class User(ModelBase):
@@ -45,8 +46,11 @@ class User(ModelBase):
     reviews = relationship("UserReview", back_populates="reviewer")
     point_events = relationship("PointEvent", back_populates="user")
 
-    def verify_password(self, password: str) -> bool:
-        return verify_password(password, self.password)
+    # 로그인 시 email 또는 nickname으로 조회합니다. (email은 unique 인덱스가 있음)
+    __indexes__ = (Index("ix_Users_nickname", "nickname"),)
+
+    async def verify_password(self, password: str) -> bool:
+        return await password_hasher.verify(password, self.password)
 
     @classmethod
     async def get_user_by_email(cls, db: AsyncSession, email: str) -> Optional["User"]:
@@ -129,6 +133,17 @@ class ItineraryRequest(ModelBase):
     place_containers = relationship("PlaceContainer", back_populates="request")
     transport_containers = relationship("TransportContainer", back_populates="request")
 
+    # 삭제되지 않은 본인 요청만 (created, id) 순서로 조회하므로 partial 인덱스로 둡니다.
+    __indexes__ = (
+        Index(
+            "ix_Itinerary_Request_request_user_id_active",
+            "request_user_id",
+            "created",
+            "id",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+    )
+
 
 class Order(ModelBase):
     __tablename__ = "Orders"
@@ -138,6 +153,11 @@ class Order(ModelBase):
     buyer_id = Column(SQLUUID(as_uuid=True), nullable=False)
     listing_id = Column(SQLUUID(as_uuid=True), ForeignKey("Listing.id"), nullable=False)
 
+    __indexes__ = (
+        Index("ix_Orders_buyer_id", "buyer_id"),
+        Index("ix_Orders_listing_id", "listing_id"),
+    )
+
 
 class Itinerary(ModelBase):
     __tablename__ = "Itinerary"
@@ -152,6 +172,8 @@ class Itinerary(ModelBase):
         "TransportContainer", back_populates="itinerary", cascade="all, delete-orphan"
     )
 
+    __indexes__ = (Index("ix_Itinerary_request_id", "request_id"),)
+
 
 class PlaceContainer(ModelBase):
     __tablename__ = "Place_Container"
@@ -169,6 +191,8 @@ class PlaceContainer(ModelBase):
     itinerary = relationship("Itinerary", back_populates="place_containers")
     request = relationship("ItineraryRequest", back_populates="place_containers")
 
+    __indexes__ = (Index("ix_Place_Container_itinerary_id", "itinerary_id"),)
+
 
 class TransportEnum(str, Enum):
     WALK = "Walk"
@@ -194,6 +218,8 @@ class TransportContainer(ModelBase):
     itinerary = relationship("Itinerary", back_populates="transport_containers")
     request = relationship("ItineraryRequest", back_populates="transport_containers")
 
+    __indexes__ = (Index("ix_Transport_Container_itinerary_id", "itinerary_id"),)
+
 
 class UserReview(ModelBase):
     __tablename__ = "User_Review"
@@ -209,14 +235,19 @@ class UserReview(ModelBase):
 class Area(ModelBase):
     __tablename__ = "Area"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(100), nullable=False)
+    name = Column(String(100), nullable=False, unique=True)
     address = Column(String(512), nullable=False)
     website = Column(Text, nullable=True)
     contact_num = Column(String(100), nullable=True)
     open_time = Column(Text, nullable=True)
+    # 대량 적재 시 변경되지 않은 행을 건너뛰기 위한 내용 hash (sha256)
+    content_hash = Column(String(64), nullable=True)
 
     images = relationship(
-        "AreaImage", back_populates="area", cascade="all, delete-orphan"
+        "AreaImage",
+        back_populates="area",
+        cascade="all, delete-orphan",
+        order_by=lambda: (AreaImage.created, AreaImage.id),
     )
 
 
@@ -239,6 +270,10 @@ class AreaImage(ModelBase):
 
     area = relationship("Area", back_populates="images")
 
+    __indexes__ = (
+        Index("ix_Area_Image_area_id_created_id", "area_id", "created", "id"),
+    )
+
 
 class PointEvent(ModelBase):
     __tablename__ = "Point_Event"
@@ -249,9 +284,23 @@ class PointEvent(ModelBase):
     detail = Column(String(100), nullable=False)
     event_date = Column(TIMESTAMP, nullable=False)
     exp_date = Column(TIMESTAMP, nullable=True)
+    # 만료 배치가 처리한 시각입니다. 처리된 이벤트는 다시 만료 대상이 되지 않습니다.
+    expired_at = Column(TIMESTAMP, nullable=True)
 
     user = relationship("User", back_populates="point_events")
 
+    # 본인 포인트 이벤트 목록(keyset 페이지)과 잔액 계산이 user_id로 조회합니다.
+    # 만료 배치는 아직 처리되지 않은 만료일이 있는 이벤트만 사용자 순으로 훑습니다.
+    __indexes__ = (
+        Index("ix_Point_Event_user_id_created_id", "user_id", "created", "id"),
+        Index(
+            "ix_Point_Event_pending_expiry",
+            "user_id",
+            "exp_date",
+            postgresql_where=text("expired_at IS NULL AND exp_date IS NOT NULL"),
+        ),
+    )
+
 
 class PointDetail(ModelBase):
     __tablename__ = "Point_Detail"
@@ -263,3 +312,46 @@ class PointDetail(ModelBase):
 
     event = relationship("PointEvent", foreign_keys=[event_id])
     related_event = relationship("PointEvent", foreign_keys=[related_event_id])
+
+    __indexes__ = (
+        Index("ix_Point_Detail_event_id", "event_id"),
+        Index("ix_Point_Detail_related_event_id", "related_event_id"),
+    )
+
+
+class PointBalance(ModelBase):
+    """
+    사용자별 포인트 잔액 ledger입니다.
+
+    Point_Event/Point_Detail을 쓰는 같은 transaction 안에서 증감분이 반영되므로,
+    잔액 조회는 이력의 길이와 관계없이 한 행만 읽습니다.
+    """
+
+    __tablename__ = "Point_Balance"
+    user_id = Column(
+        SQLUUID(as_uuid=True),
+        ForeignKey("Users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    balance = Column(Integer, nullable=False, default=0)
+
+
+class BackgroundJob(ModelBase):
+    """
+    CSV 적재 같은 백그라운드 작업의 상태입니다.
+
+    작업은 요청을 받은 worker process에서 실행되지만, 상태는 DB에 두므로
+    어느 worker로 온 조회 요청에서도 같은 진행 상황을 볼 수 있습니다.
+    """
+
+    __tablename__ = "Background_Job"
+    id = Column(SQLUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False)
+    stage = Column(String(50), nullable=True)
+    processed = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=True)
+    result = Column(JSONB, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(TIMESTAMP, nullable=False)
+    finished_at = Column(TIMESTAMP, nullable=True)
@@ -14,6 +14,7 @@ class ErrorCode(Enum):
     FORBIDDEN = ("FORBIDDEN", "KB-003", 403)
     NOT_FOUND = ("NOT_FOUND", "KB-004", 404)
     UNKNOWN_ERROR = ("UNKNOWN_ERROR", "KB-005", 500)
+    CONFLICT = ("CONFLICT", "KB-006", 409)
 
 
 class ExceptionSchema(BaseModel):
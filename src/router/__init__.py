@@ -3,8 +3,11 @@
 #
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
-from fastapi import APIRouter, Depends
+import os
+import tempfile
 
+from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .user import user_router
@@ -15,8 +18,14 @@ from .order import order_router
 from .point import point_router
 from .itinerary import itinerary_router
 
+from src.core.settings import settings
 from src.db import database
 from src.db.data import csv_converter
+from src.helper.exceptions import InternalException, ErrorCode
+from src.schemas.responses import IngestJobSchema
+from src.utils.jobs import job_registry
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 router = APIRouter(prefix="/kbuddy/api/v1")
 
@@ -47,5 +56,68 @@ async def ping():
 
 @router.post("/upload-csv/")
 async def upload_csv(db: AsyncSession = Depends(database.get_db)):
-    await csv_converter.csv_to_db(db)
-    return {"message": "CSV data has been uploaded successfully"}
+    report = await csv_converter.csv_to_db(db)
+    return {
+        "message": "CSV data has been uploaded successfully",
+        "report": report.model_dump(),
+    }
+
+
+@router.post(
+    "/upload-csv/file",
+    status_code=202,
+    response_model=IngestJobSchema,
+    summary="관광자원정보 CSV 업로드",
+    description="업로드한 CSV를 백그라운드에서 파싱해 지역 정보로 적재하고, 진행 상황을 조회할 job을 반환합니다.",
+)
+async def upload_csv_file(
+    file: UploadFile, db: AsyncSession = Depends(database.get_db)
+):
+    # 요청 본문을 chunk 단위로 임시 파일에 옮기면서 앞부분으로 인코딩을 추정합니다.
+    sniffer = csv_converter.EncodingSniffer()
+    size = 0
+    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as tmp:
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > settings.MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"업로드 파일은 최대 {settings.MAX_UPLOAD_BYTES} bytes까지 허용됩니다.",
+                    )
+                sniffer.feed(chunk)
+                await run_in_threadpool(tmp.write, chunk)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+    encoding = sniffer.result()
+
+    bind = db.bind
+    try:
+        job = await job_registry.submit(
+            bind,
+            "area-csv-ingest",
+            lambda job: csv_converter.ingest_tourism_csv_file(
+                job, bind, tmp.name, encoding
+            ),
+        )
+    except BaseException:
+        # 작업이 등록되지 않으면 임시 파일을 지울 주체가 없습니다.
+        os.unlink(tmp.name)
+        raise
+    return IngestJobSchema.model_validate(job)
+
+
+@router.get(
+    "/upload-csv/jobs/{job_id}",
+    response_model=IngestJobSchema,
+    summary="CSV 적재 작업 조회",
+    description="CSV 적재 작업의 상태와 진행률을 조회합니다.",
+)
+async def get_upload_job(job_id: str, db: AsyncSession = Depends(database.get_db)):
+    job = await job_registry.get(db.bind, job_id)
+    if job is None:
+        raise InternalException(
+            "해당 작업을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
+        )
+    return IngestJobSchema.model_validate(job)
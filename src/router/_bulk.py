@@ -0,0 +1,66 @@
+# --------------------------------------------------------------------------
+# 대량 생성/수정/삭제 API의 요청 검사와 항목별 결과 응답을 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from typing import Any, Dict, List, Sequence
+
+from fastapi import Response
+
+from src.core.settings import settings
+from src.helper.exceptions import InternalException, ErrorCode
+from src.router._response import schema_response
+from src.schemas.responses import BulkItemResult, BulkResultStatus
+
+
+def check_bulk_size(items: Sequence[Any]) -> None:
+    """목록이 비어 있거나 BULK_MAX_ITEMS를 넘으면 거절합니다."""
+    if not items:
+        raise InternalException("처리할 항목이 없습니다.", ErrorCode.BAD_REQUEST)
+    if len(items) > settings.BULK_MAX_ITEMS:
+        raise InternalException(
+            f"한 번에 최대 {settings.BULK_MAX_ITEMS}개까지 처리할 수 있습니다.",
+            ErrorCode.BAD_REQUEST,
+        )
+
+
+def check_bulk_ids(ids: Sequence[Any]) -> None:
+    """check_bulk_size에 더해, 같은 id가 두 번 들어오면 거절합니다."""
+    check_bulk_size(ids)
+    if len(set(ids)) != len(ids):
+        raise InternalException("중복된 id가 있습니다.", ErrorCode.BAD_REQUEST)
+
+
+def created_response(items: List[Any], response_model: Any) -> Response:
+    result_model = BulkItemResult[response_model]
+    results = [
+        result_model.model_construct(
+            index=index, id=item.id, status=BulkResultStatus.CREATED, item=item
+        )
+        for index, item in enumerate(items)
+    ]
+    return schema_response(results, List[result_model])
+
+
+def bulk_response(
+    ids: Sequence[Any],
+    found: Dict[Any, Any],
+    status: BulkResultStatus,
+    response_model: Any,
+) -> Response:
+    """
+    요청한 id 순서대로, found에 있는 항목은 status로, 없는 항목은 not_found로 응답합니다.
+
+    crud가 이미 검증한 객체를 담으므로 결과 schema는 model_construct로 다시 검증 없이 만듭니다.
+    """
+    result_model = BulkItemResult[response_model]
+    results = [
+        result_model.model_construct(
+            index=index,
+            id=model_id,
+            status=status if model_id in found else BulkResultStatus.NOT_FOUND,
+            item=found.get(model_id),
+        )
+        for index, model_id in enumerate(ids)
+    ]
+    return schema_response(results, List[result_model])
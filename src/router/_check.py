@@ -11,16 +11,41 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.crud.user import get_user_by_email
 from src.helper.exceptions import InternalException, ErrorCode
 from src.db import database
-from src.utils.authentication import decode_user_data_from_token
+from src.schemas.responses import UserSchema
+from src.utils.authentication import decode_user_data_from_token, principal_cache
 
 log = getLogger(__name__)
 
 
-def auth(request: Request):
+async def auth(
+    request: Request, db: AsyncSession = Depends(database.get_db)
+) -> UserSchema:
+    """
+    요청의 access token으로 인증된 유저(principal)를 요청당 한 번만 조회합니다.
+
+    조회 결과는 request.state.principal에 저장되고, 토큰 단위로 principal_cache에
+    캐싱되므로 캐시 hit 시에는 JWT decode와 DB 조회를 모두 생략합니다.
+    """
+    principal = getattr(request.state, "principal", None)
+    if principal is not None:
+        return principal
+
     token = request.cookies.get("access_token")
     if not token:
         raise InternalException("인증 정보가 없습니다.", ErrorCode.BAD_REQUEST)
 
+    principal = principal_cache.get(token)
+    if principal is None:
+        token_data, user_email = await decode_user_data_from_token(token=token)
+        user = await get_user_by_email(db=db, user_email=user_email)
+        if user is None:
+            raise InternalException("유저를 찾을 수 없습니다.", ErrorCode.NOT_FOUND)
+        principal = UserSchema.model_validate(user)
+        principal_cache.set(token, principal, expires_at=token_data.exp)
+
+    request.state.principal = principal
+    return principal
+
 
 async def get_auth_from_cookie(request: Request):
     token = request.cookies.get("access_token")
@@ -29,12 +54,8 @@ async def get_auth_from_cookie(request: Request):
 
 async def get_current_user_info(
     request: Request, db: AsyncSession = Depends(database.get_db)
-):
-    token_data, user_email = await get_auth_from_cookie(request=request)
-    user = await get_user_by_email(db=db, user_email=user_email)
-    if user is None:
-        raise InternalException("유저를 찾을 수 없습니다.", ErrorCode.NOT_FOUND)
-    return user
+) -> UserSchema:
+    return await auth(request=request, db=db)
 
 
 async def check_user(
@@ -0,0 +1,27 @@
+# --------------------------------------------------------------------------
+# 목록 조회 API의 cursor 페이지네이션 응답 처리를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from typing import Any, List
+
+from fastapi import Response
+
+from src.crud._base import Page
+from src.router._response import schema_response
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def paginate(page: Page, response_model: Any) -> Response:
+    """
+    페이지의 목록을 response_model 목록으로 직렬화한 응답을 반환합니다.
+
+    다음 페이지가 있으면 cursor를 X-Next-Cursor header로 내려주고, 본문에는
+    기존과 같이 목록만 반환합니다.
+    """
+    headers = None
+    if page.next_cursor is not None:
+        headers = {NEXT_CURSOR_HEADER: page.next_cursor}
+    return schema_response(page.items, List[response_model], headers=headers)
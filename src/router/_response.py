@@ -0,0 +1,42 @@
+# --------------------------------------------------------------------------
+# 이미 검증된 schema 객체를 JSON 응답으로 직렬화하는 메서드를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import orjson
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def schema_response(
+    content: Any,
+    response_model: Any,
+    headers: Optional[Dict[str, str]] = None,
+    status_code: int = 200,
+) -> Response:
+    """
+    crud에서 이미 검증한 schema 객체를 미리 만들어 둔 TypeAdapter로 바로 직렬화합니다.
+
+    Response를 직접 반환하면 FastAPI가 response_model로 다시 검증하고
+    jsonable_encoder를 거쳐 인코딩하는 과정을 건너뜁니다.
+    response_model에 선언된 field만 python 객체로 꺼낸 뒤, datetime/UUID 변환이 빠른
+    orjson으로 인코딩하고 SecretStr처럼 orjson이 모르는 값만 jsonable_encoder에 맡깁니다.
+    """
+    data = get_type_adapter(response_model).dump_python(content)
+    # OPT_UTC_Z: pydantic(FastAPI 기본 응답)과 같이 UTC datetime을 "+00:00" 대신 "Z"로 씁니다.
+    return Response(
+        content=orjson.dumps(data, default=jsonable_encoder, option=orjson.OPT_UTC_Z),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
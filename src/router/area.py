@@ -3,16 +3,16 @@
 #
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
-import httpx
-
 from logging import getLogger
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.crud import area as crud
 from src.db import database
+from src.router._pagination import paginate
+from src.router._response import schema_response
 from src.schemas.requests import (
     AreaCreate,
     AreaUpdate,
@@ -20,7 +20,7 @@ from src.schemas.requests import (
     AreaImageUpdate,
 )
 from src.db.data import csv_converter
-from src.core.settings import settings
+from src.utils.tour_api import TourAPIClient, TourAPIError, get_tour_api
 from src.schemas.responses import AreaSchema, AreaImageSchema, AreaSchemaAPI
 from src.helper.exceptions import InternalException, ErrorCode
 
@@ -28,58 +28,24 @@ from src.helper.exceptions import InternalException, ErrorCode
 log = getLogger(__name__)
 area_router = APIRouter(prefix="/area")
 
+IMAGES_LIMIT_QUERY = Query(
+    None, ge=0, description="지역마다 포함할 이미지의 최대 개수입니다. (기본값: 전체)"
+)
+
 
-async def get_area_data():
-    file_path = "src/db/data/20240602001629_지역별 방문자 수.csv"
-    random_area = await csv_converter.get_random_area(file_path)
-
-    # 지역 코드 정보를 조회하는 API 요청
-    area_code_url = f"{settings.TOUR_API_ENDPOINT}/areaCode1"
-    area_code_params = {
-        "serviceKey": settings.TOUR_API_KEY_DECODING,
-        "numOfRows": 30,
-        "pageNo": 1,
-        "MobileOS": "ETC",
-        "MobileApp": "K-Buddy",
-        "_type": "JSON",
-        "areaCode": 1
-    }
-
-    async with httpx.AsyncClient() as client:
-        area_code_response = await client.get(area_code_url, params=area_code_params)
-        if area_code_response.status_code != 200:
-            raise HTTPException(status_code=area_code_response.status_code, detail="Failed to fetch area codes")
-
-        area_codes = area_code_response.json()
-        area_code = None
-        for item in area_codes['response']['body']['items']['item']:
-            if item['name'] == random_area:
-                area_code = item['code']
-                break
+async def get_area_data(tour_api: TourAPIClient):
+    random_area = await csv_converter.get_random_area()
 
+    try:
+        # 지역 코드 정보 조회 (캐시)
+        area_code = await tour_api.get_area_code(random_area)
         if not area_code:
             raise HTTPException(status_code=404, detail="Area code not found for selected area")
 
-        # 관광 정보 조회하는 API 요청
-        tour_info_url = f"{settings.TOUR_API_ENDPOINT}/areaBasedList1"
-        tour_info_params = {
-            "serviceKey": settings.TOUR_API_KEY_DECODING,
-            "numOfRows": 5,
-            "pageNo": 1,
-            "MobileOS": "ETC",
-            "MobileApp": "K-Buddy",
-            "listYN": "Y",
-            "arrange": "A",
-            "areaCode": 1,
-            "sigunguCode": area_code,
-            "_type": "JSON",
-        }
-
-        tour_info_response = await client.get(tour_info_url, params=tour_info_params)
-        if tour_info_response.status_code != 200:
-            raise HTTPException(status_code=tour_info_response.status_code, detail="Failed to fetch tour info")
-
-        tour_info = tour_info_response.json()
+        # 관광 정보 조회 (캐시)
+        tour_info = await tour_api.get_area_based_list(area_code)
+    except TourAPIError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
 
     return tour_info
 
@@ -91,9 +57,9 @@ async def get_area_data():
     description="사용자에게 최근 가장 트랜드한 장소 5개를 큐레이션합니다."
 )
 async def cureate_areas(
-
+    tour_api: TourAPIClient = Depends(get_tour_api),
 ):
-    tour_info = await get_area_data()
+    tour_info = await get_area_data(tour_api)
 
     areas = []
     for item in tour_info['response']['body']['items']['item']:
@@ -117,10 +83,17 @@ async def cureate_areas(
     description="모든 지역에 대한 정보를 조회합니다.",
 )
 async def get_all_areas(
-    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(database.get_db)
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    images_limit: Optional[int] = IMAGES_LIMIT_QUERY,
+    db: AsyncSession = Depends(database.get_db),
 ):
     log.info(f"Reading students info with skip: {skip} and limit: {limit}")
-    return await crud.get_all_areas(db, skip=skip, limit=limit)
+    page = await crud.get_all_areas(
+        db, skip=skip, limit=limit, cursor=cursor, images_limit=images_limit
+    )
+    return paginate(page, AreaSchema)
 
 
 @area_router.get(
@@ -129,13 +102,17 @@ async def get_all_areas(
     summary="단일 지역 조회",
     description="하나의 지역에 대한 정보를 조회합니다.",
 )
-async def read_area(area_id: int, db: AsyncSession = Depends(database.get_db)):
-    db_area = await crud.get_area(db, area_id)
+async def read_area(
+    area_id: int,
+    images_limit: Optional[int] = IMAGES_LIMIT_QUERY,
+    db: AsyncSession = Depends(database.get_db),
+):
+    db_area = await crud.get_area(db, area_id, images_limit=images_limit)
     if db_area is None:
         raise InternalException(
             "해당 지역을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    return db_area
+    return schema_response(db_area, AreaSchema)
 
 
 @area_router.post(
@@ -159,7 +136,12 @@ async def update_area(
     area: AreaUpdate,
     db: AsyncSession = Depends(database.get_db),
 ):
-    return await crud.update_area(db, area_id, area)
+    db_area = await crud.update_area(db, area_id, area)
+    if db_area is None:
+        raise InternalException(
+            "해당 지역을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
+        )
+    return db_area
 
 
 @area_router.delete(
@@ -193,7 +175,8 @@ async def get_area_images(
         raise InternalException(
             "해당 지역을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    return await crud.get_area_images(db, area_id, skip=skip, limit=limit)
+    db_images = await crud.get_area_images(db, area_id, skip=skip, limit=limit)
+    return schema_response(db_images, List[AreaImageSchema])
 
 
 @area_router.get(
@@ -208,7 +191,7 @@ async def get_area_image(image_id: int, db: AsyncSession = Depends(database.get_
         raise InternalException(
             "해당 지역의 이미지를 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    return db_image
+    return schema_response(db_image, AreaImageSchema)
 
 
 @area_router.post(
@@ -237,12 +220,12 @@ async def create_area_image(
 async def update_area_image(
     image_id: int, image: AreaImageUpdate, db: AsyncSession = Depends(database.get_db)
 ):
-    db_image = await crud.get_area_image(db, image_id)
+    db_image = await crud.update_area_image(db, image_id, image)
     if db_image is None:
         raise InternalException(
             "해당 이미지를 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    return await crud.update_area_image(db, image_id, image)
+    return db_image
 
 
 @area_router.delete(
@@ -252,10 +235,9 @@ async def update_area_image(
     description="지역의 이미지를 삭제합니다.",
 )
 async def delete_area_image(image_id: int, db: AsyncSession = Depends(database.get_db)):
-    db_image = await crud.get_area_image(db, image_id)
-    if db_image is None:
+    deleted_id = await crud.delete_area_image(db, image_id)
+    if deleted_id is None:
         raise InternalException(
             "해당 이미지를 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    await crud.delete_area_image(db, image_id)
     return {"detail": "이미지가 성공적으로 삭제되었습니다."}
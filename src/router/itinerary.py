@@ -5,7 +5,7 @@
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
 from logging import getLogger
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,6 +13,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.router._check import check_user, auth, get_current_user_info
 from src.crud import itinerary as crud
 from src.db import database
+from src.router._pagination import paginate
+from src.router._response import schema_response
 from src.helper.exceptions import InternalException, ErrorCode
 from src.schemas.requests import (
     ItineraryRequestUpdate,
@@ -26,6 +28,20 @@ log = getLogger(__name__)
 itinerary_router = APIRouter(prefix="/itinerary")
 
 
+async def _itinerary_request_write_error(
+    db: AsyncSession, request_id: str, forbidden_message: str
+) -> InternalException:
+    """
+    수정/삭제가 한 행에도 적용되지 않았을 때만 요청을 다시 읽어,
+    요청이 없는 경우(404)와 본인이 작성하지 않은 경우(403)를 구분합니다.
+    """
+    if await crud.get_itinerary_request(db, request_id) is None:
+        return InternalException(
+            "해당 여행기 요청을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
+        )
+    return InternalException(forbidden_message, error_code=ErrorCode.FORBIDDEN)
+
+
 @itinerary_router.get(
     "/request/",
     response_model=List[ItineraryRequestSchema],
@@ -41,9 +57,10 @@ async def get_all_itinerary_requests(
 ):
     current_user = await get_current_user_info(request, db)
     log.info(f"Reading itinerary requests with skip: {skip} and limit: {limit}")
-    return await crud.get_all_itinerary_requests(
+    db_itinerary_requests = await crud.get_all_itinerary_requests(
         db, str(current_user.id), skip=skip, limit=limit
     )
+    return schema_response(db_itinerary_requests, List[ItineraryRequestSchema])
 
 
 @itinerary_router.get(
@@ -67,7 +84,7 @@ async def read_itinerary_request(
             "본인이 작성한 여행기 요청서만 볼 수 있습니다.",
             error_code=ErrorCode.FORBIDDEN,
         )
-    return db_itinerary_request
+    return schema_response(db_itinerary_request, ItineraryRequestSchema)
 
 
 @itinerary_router.post(
@@ -101,17 +118,14 @@ async def update_itinerary_request(
     db: AsyncSession = Depends(database.get_db),
 ):
     current_user = await get_current_user_info(request, db)
-    db_itinerary_request = await crud.get_itinerary_request(db, request_id)
+    db_itinerary_request = await crud.update_itinerary_request(
+        db, request_id, itinerary_request, request_user_id=current_user.id
+    )
     if db_itinerary_request is None:
-        raise InternalException(
-            "해당 여행기 요청을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
+        raise await _itinerary_request_write_error(
+            db, request_id, "본인이 작성한 여행기 요청서만 수정할 수 있습니다."
         )
-    if db_itinerary_request.request_user_id != current_user.id:
-        raise InternalException(
-            "본인이 작성한 여행기 요청서만 수정할 수 있습니다.",
-            error_code=ErrorCode.FORBIDDEN,
-        )
-    return await crud.update_itinerary_request(db, request_id, itinerary_request)
+    return db_itinerary_request
 
 
 @itinerary_router.post(
@@ -127,20 +141,38 @@ async def delete_itinerary_request(
     db: AsyncSession = Depends(database.get_db),
 ):
     current_user = await get_current_user_info(request, db)
-    db_itinerary_request = await crud.get_itinerary_request(db, request_id)
-    if db_itinerary_request is None:
-        raise InternalException(
-            "해당 여행기 요청을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
-        )
-    if db_itinerary_request.request_user_id != current_user.id:
-        raise InternalException(
-            "본인이 작성한 여행기 요청서만 삭제할 수 있습니다.",
-            error_code=ErrorCode.FORBIDDEN,
+    deleted_id = await crud.delete_itinerary_request(
+        db, request_id, request_user_id=current_user.id
+    )
+    if deleted_id is None:
+        raise await _itinerary_request_write_error(
+            db, request_id, "본인이 작성한 여행기 요청서만 삭제할 수 있습니다."
         )
-    deleted_id = await crud.delete_itinerary_request(db, request_id)
     return {"detail": "여행기 요청이 성공적으로 삭제되었습니다."}
 
 
+@itinerary_router.get(
+    "/",
+    response_model=List[ItinerarySchema],
+    summary="여행기 전체를 불러오기",
+    description="본인의 여행기 요청으로 만들어진 모든 여행기를 조회합니다.",
+    dependencies=[Depends(auth)],
+)
+async def get_all_itineraries(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(database.get_db),
+):
+    current_user = await get_current_user_info(request, db)
+    log.info(f"Reading itineraries with skip: {skip} and limit: {limit}")
+    page = await crud.get_all_itineraries(
+        db, str(current_user.id), skip=skip, limit=limit, cursor=cursor
+    )
+    return paginate(page, ItinerarySchema)
+
+
 @itinerary_router.get(
     "/{itinerary_id}",
     response_model=ItinerarySchema,
@@ -156,7 +188,7 @@ async def read_itinerary(
             "해당 여행기를 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
 
-    return db_itinerary
+    return schema_response(db_itinerary, ItinerarySchema)
 
 
 @itinerary_router.post(
@@ -181,10 +213,9 @@ async def delete_itinerary(
     itinerary_id: str,
     db: AsyncSession = Depends(database.get_db),
 ):
-    db_itinerary = await crud.get_itinerary(db, itinerary_id)
-    if db_itinerary is None:
+    deleted_id = await crud.delete_itinerary(db, itinerary_id)
+    if deleted_id is None:
         raise InternalException(
             "해당 여행기를 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    await crud.delete_itinerary(db, itinerary_id)
     return {"detail": "여행기가 성공적으로 삭제되었습니다."}
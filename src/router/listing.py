@@ -4,16 +4,25 @@
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
 from logging import getLogger
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.crud import listing as crud
 from src.db import database
+from src.router._bulk import (
+    bulk_response,
+    check_bulk_ids,
+    check_bulk_size,
+    created_response,
+)
+from src.router._pagination import paginate
+from src.router._response import schema_response
 from src.helper.exceptions import InternalException, ErrorCode
-from src.schemas.requests import ListingCreate, ListingUpdate
-from src.schemas.responses import ListingSchema
+from src.schemas.requests import ListingCreate, ListingUpdate, ListingBulkUpdate
+from src.schemas.responses import BulkItemResult, BulkResultStatus, ListingSchema
 
 
 log = getLogger(__name__)
@@ -27,10 +36,14 @@ listing_router = APIRouter(prefix="/listing")
     description="모든 판매글을 조회합니다.",
 )
 async def get_all_listings(
-    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(database.get_db)
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(database.get_db),
 ):
     log.info(f"Reading listings with skip: {skip} and limit: {limit}")
-    return await crud.get_all_listings(db, skip=skip, limit=limit)
+    page = await crud.get_all_listings(db, skip=skip, limit=limit, cursor=cursor)
+    return paginate(page, ListingSchema)
 
 
 @listing_router.get(
@@ -45,7 +58,7 @@ async def read_listing(listing_id: str, db: AsyncSession = Depends(database.get_
         raise InternalException(
             "해당 판매글을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    return db_listing
+    return schema_response(db_listing, ListingSchema)
 
 
 @listing_router.post(
@@ -60,6 +73,51 @@ async def create_listing(
     return await crud.create_listing(db, listing)
 
 
+@listing_router.post(
+    "/bulk",
+    response_model=List[BulkItemResult[ListingSchema]],
+    summary="판매글 대량 추가",
+    description="여러 판매글을 한 번에 추가합니다. 목록 전체를 검증한 뒤 하나의 transaction에서 추가하고, 요청 순서대로 결과를 반환합니다.",
+)
+async def create_listings(
+    listings: List[ListingCreate], db: AsyncSession = Depends(database.get_db)
+):
+    check_bulk_size(listings)
+    db_listings = await crud.create_listings(db, listings)
+    return created_response(db_listings, ListingSchema)
+
+
+@listing_router.put(
+    "/bulk",
+    response_model=List[BulkItemResult[ListingSchema]],
+    summary="판매글 대량 수정",
+    description="여러 판매글을 한 번에 수정합니다. 존재하지 않는 판매글은 not_found로 응답합니다.",
+)
+async def update_listings(
+    listings: List[ListingBulkUpdate], db: AsyncSession = Depends(database.get_db)
+):
+    ids = [listing.id for listing in listings]
+    check_bulk_ids(ids)
+    db_listings = await crud.update_listings(db, listings)
+    return bulk_response(ids, db_listings, BulkResultStatus.UPDATED, ListingSchema)
+
+
+@listing_router.post(
+    "/bulk/delete",
+    response_model=List[BulkItemResult[ListingSchema]],
+    summary="판매글 대량 삭제",
+    description="여러 판매글을 한 번에 삭제합니다. 존재하지 않는 판매글은 not_found로 응답합니다.",
+)
+async def delete_listings(
+    listing_ids: List[UUID], db: AsyncSession = Depends(database.get_db)
+):
+    check_bulk_ids(listing_ids)
+    db_listings = await crud.delete_listings(db, listing_ids)
+    return bulk_response(
+        listing_ids, db_listings, BulkResultStatus.DELETED, ListingSchema
+    )
+
+
 @listing_router.put(
     "/{listing_id}",
     response_model=ListingSchema,
@@ -71,12 +129,12 @@ async def update_listing(
     listing: ListingUpdate,
     db: AsyncSession = Depends(database.get_db),
 ):
-    db_listing = await crud.get_listing(db, listing_id)
+    db_listing = await crud.update_listing(db, listing_id, listing)
     if db_listing is None:
         raise InternalException(
             "해당 판매글을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    return await crud.update_listing(db, listing_id, listing)
+    return db_listing
 
 
 @listing_router.delete(
@@ -89,10 +147,9 @@ async def delete_listing(
     listing_id: str,
     db: AsyncSession = Depends(database.get_db),
 ):
-    db_listing = await crud.get_listing(db, listing_id)
-    if db_listing is None:
+    deleted_id = await crud.delete_listing(db, listing_id)
+    if deleted_id is None:
         raise InternalException(
             "해당 판매글을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    await crud.delete_listing(db, listing_id)
     return {"detail": "판매글이 성공적으로 삭제되었습니다."}
@@ -5,16 +5,25 @@
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
 from logging import getLogger
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.crud import order as crud
 from src.db import database
+from src.router._bulk import (
+    bulk_response,
+    check_bulk_ids,
+    check_bulk_size,
+    created_response,
+)
+from src.router._pagination import paginate
+from src.router._response import schema_response
 from src.helper.exceptions import InternalException, ErrorCode
-from src.schemas.requests import OrderCreate, OrderUpdate
-from src.schemas.responses import OrderSchema
+from src.schemas.requests import OrderCreate, OrderUpdate, OrderBulkUpdate
+from src.schemas.responses import BulkItemResult, BulkResultStatus, OrderSchema
 
 
 log = getLogger(__name__)
@@ -28,10 +37,14 @@ order_router = APIRouter(prefix="/order")
     description="모든 주문에 대한 정보를 조회합니다.",
 )
 async def get_all_orders(
-    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(database.get_db)
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(database.get_db),
 ):
     log.info(f"Reading orders with skip: {skip} and limit: {limit}")
-    return await crud.get_all_orders(db, skip=skip, limit=limit)
+    page = await crud.get_all_orders(db, skip=skip, limit=limit, cursor=cursor)
+    return paginate(page, OrderSchema)
 
 
 @order_router.get(
@@ -46,7 +59,7 @@ async def read_order(order_id: str, db: AsyncSession = Depends(database.get_db))
         raise InternalException(
             "해당 주문을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    return db_order
+    return schema_response(db_order, OrderSchema)
 
 
 @order_router.post(
@@ -59,6 +72,49 @@ async def create_order(order: OrderCreate, db: AsyncSession = Depends(database.g
     return await crud.create_order(db, order)
 
 
+@order_router.post(
+    "/bulk",
+    response_model=List[BulkItemResult[OrderSchema]],
+    summary="주문 대량 추가",
+    description="여러 주문을 한 번에 추가합니다. 목록 전체를 검증한 뒤 하나의 transaction에서 추가하고, 요청 순서대로 결과를 반환합니다.",
+)
+async def create_orders(
+    orders: List[OrderCreate], db: AsyncSession = Depends(database.get_db)
+):
+    check_bulk_size(orders)
+    db_orders = await crud.create_orders(db, orders)
+    return created_response(db_orders, OrderSchema)
+
+
+@order_router.put(
+    "/bulk",
+    response_model=List[BulkItemResult[OrderSchema]],
+    summary="주문 대량 수정",
+    description="여러 주문을 한 번에 수정합니다. 존재하지 않는 주문은 not_found로 응답합니다.",
+)
+async def update_orders(
+    orders: List[OrderBulkUpdate], db: AsyncSession = Depends(database.get_db)
+):
+    ids = [order.id for order in orders]
+    check_bulk_ids(ids)
+    db_orders = await crud.update_orders(db, orders)
+    return bulk_response(ids, db_orders, BulkResultStatus.UPDATED, OrderSchema)
+
+
+@order_router.post(
+    "/bulk/delete",
+    response_model=List[BulkItemResult[OrderSchema]],
+    summary="주문 대량 삭제",
+    description="여러 주문을 한 번에 삭제합니다. 존재하지 않는 주문은 not_found로 응답합니다.",
+)
+async def delete_orders(
+    order_ids: List[UUID], db: AsyncSession = Depends(database.get_db)
+):
+    check_bulk_ids(order_ids)
+    db_orders = await crud.delete_orders(db, order_ids)
+    return bulk_response(order_ids, db_orders, BulkResultStatus.DELETED, OrderSchema)
+
+
 @order_router.put(
     "/{order_id}",
     response_model=OrderSchema,
@@ -70,12 +126,12 @@ async def update_order(
     order: OrderUpdate,
     db: AsyncSession = Depends(database.get_db),
 ):
-    db_order = await crud.get_order(db, order_id)
+    db_order = await crud.update_order(db, order_id, order)
     if db_order is None:
         raise InternalException(
             "해당 주문을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    return await crud.update_order(db, order_id, order)
+    return db_order
 
 
 @order_router.delete(
@@ -88,10 +144,9 @@ async def delete_order(
     order_id: str,
     db: AsyncSession = Depends(database.get_db),
 ):
-    db_order = await crud.get_order(db, order_id)
-    if db_order is None:
+    deleted_id = await crud.delete_order(db, order_id)
+    if deleted_id is None:
         raise InternalException(
             "해당 주문을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    await crud.delete_order(db, order_id)
     return {"detail": "주문이 성공적으로 삭제되었습니다."}
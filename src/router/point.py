@@ -4,22 +4,35 @@
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
 from logging import getLogger
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.crud import point as crud
-from src.crud import user as user_crud
 from src.db import database
-from src.router._check import check_user, auth
+from src.router._bulk import (
+    bulk_response,
+    check_bulk_ids,
+    check_bulk_size,
+    created_response,
+)
+from src.router._pagination import paginate
+from src.router._response import schema_response
+from src.router._check import auth, get_current_user_info
 from src.schemas.requests import (
     PointEventCreate,
     PointEventUpdate,
+    PointEventBulkUpdate,
     PointDetailCreate,
     PointDetailUpdate,
 )
-from src.schemas.responses import PointDetailSchema, PointEventSchema
+from src.schemas.responses import (
+    BulkItemResult,
+    BulkResultStatus,
+    PointDetailSchema,
+    PointEventSchema,
+)
 from src.helper.exceptions import InternalException, ErrorCode
 
 
@@ -38,17 +51,15 @@ async def get_all_point_events(
     request: Request,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(database.get_db),
 ):
-    current_user = await check_user(request=request)
-    current_user_data = await user_crud.get_user_by_email(
-        db=db, user_email=current_user
-    )
-    result_data = await crud.get_all_point_events(
-        db, str(current_user_data.id), skip=skip, limit=limit
+    current_user_data = await get_current_user_info(request, db)
+    page = await crud.get_all_point_events(
+        db, str(current_user_data.id), skip=skip, limit=limit, cursor=cursor
     )
     log.info(f"Reading point events with skip: {skip} and limit: {limit}")
-    return result_data
+    return paginate(page, PointEventSchema)
 
 
 @point_router.get(
@@ -61,10 +72,7 @@ async def get_all_point_events(
 async def read_point_event(
     request: Request, event_id: int, db: AsyncSession = Depends(database.get_db)
 ):
-    current_user = await check_user(request=request)
-    current_user_data = await user_crud.get_user_by_email(
-        db=db, user_email=current_user
-    )
+    current_user_data = await get_current_user_info(request, db)
     db_event = await crud.get_point_event(db, event_id)
     if db_event is None:
         raise InternalException(
@@ -74,7 +82,7 @@ async def read_point_event(
         raise InternalException(
             "본인의 포인트 이벤트만 조회 가능합니다.", error_code=ErrorCode.FORBIDDEN
         )
-    return db_event
+    return schema_response(db_event, PointEventSchema)
 
 
 @point_router.post(
@@ -89,6 +97,51 @@ async def create_point_event(
     return await crud.create_point_event(db, event)
 
 
+@point_router.post(
+    "/events/bulk",
+    response_model=List[BulkItemResult[PointEventSchema]],
+    summary="포인트 이벤트 대량 추가",
+    description="여러 포인트 이벤트를 한 번에 추가합니다. 목록 전체를 검증한 뒤 하나의 transaction에서 추가하고 잔액에 반영하며, 요청 순서대로 결과를 반환합니다.",
+)
+async def create_point_events(
+    events: List[PointEventCreate], db: AsyncSession = Depends(database.get_db)
+):
+    check_bulk_size(events)
+    db_events = await crud.create_point_events(db, events)
+    return created_response(db_events, PointEventSchema)
+
+
+@point_router.put(
+    "/events/bulk",
+    response_model=List[BulkItemResult[PointEventSchema]],
+    summary="포인트 이벤트 대량 수정",
+    description="여러 포인트 이벤트를 한 번에 수정합니다. 존재하지 않는 포인트 이벤트는 not_found로 응답합니다.",
+)
+async def update_point_events(
+    events: List[PointEventBulkUpdate], db: AsyncSession = Depends(database.get_db)
+):
+    ids = [event.id for event in events]
+    check_bulk_ids(ids)
+    db_events = await crud.update_point_events(db, events)
+    return bulk_response(ids, db_events, BulkResultStatus.UPDATED, PointEventSchema)
+
+
+@point_router.post(
+    "/events/bulk/delete",
+    response_model=List[BulkItemResult[PointEventSchema]],
+    summary="포인트 이벤트 대량 삭제",
+    description="여러 포인트 이벤트를 한 번에 삭제합니다. 존재하지 않는 포인트 이벤트는 not_found로 응답합니다.",
+)
+async def delete_point_events(
+    event_ids: List[int], db: AsyncSession = Depends(database.get_db)
+):
+    check_bulk_ids(event_ids)
+    db_events = await crud.delete_point_events(db, event_ids)
+    return bulk_response(
+        event_ids, db_events, BulkResultStatus.DELETED, PointEventSchema
+    )
+
+
 @point_router.put(
     "/events/{event_id}",
     response_model=PointEventSchema,
@@ -100,12 +153,12 @@ async def update_point_event(
     event: PointEventUpdate,
     db: AsyncSession = Depends(database.get_db),
 ):
-    db_event = await crud.get_point_event(db, event_id)
+    db_event = await crud.update_point_event(db, event_id, event)
     if db_event is None:
         raise InternalException(
             "해당 포인트 이벤트를 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    return await crud.update_point_event(db, event_id, event)
+    return db_event
 
 
 @point_router.delete(
@@ -118,12 +171,11 @@ async def delete_point_event(
     event_id: int,
     db: AsyncSession = Depends(database.get_db),
 ):
-    db_event = await crud.get_point_event(db, event_id)
-    if db_event is None:
+    deleted_id = await crud.delete_point_event(db, event_id)
+    if deleted_id is None:
         raise InternalException(
             "해당 포인트 이벤트를 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    await crud.delete_point_event(db, event_id)
     return {"detail": "포인트 이벤트가 성공적으로 삭제되었습니다."}
 
 
@@ -137,7 +189,8 @@ async def get_all_point_details(
     skip: int = 0, limit: int = 100, db: AsyncSession = Depends(database.get_db)
 ):
     log.info(f"Reading point details with skip: {skip} and limit: {limit}")
-    return await crud.get_all_point_details(db, skip=skip, limit=limit)
+    db_details = await crud.get_all_point_details(db, skip=skip, limit=limit)
+    return schema_response(db_details, List[PointDetailSchema])
 
 
 @point_router.get(
@@ -154,7 +207,7 @@ async def read_point_detail(
         raise InternalException(
             "해당 포인트 상세 내역을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    return db_detail
+    return schema_response(db_detail, PointDetailSchema)
 
 
 @point_router.post(
@@ -180,12 +233,12 @@ async def update_point_detail(
     detail: PointDetailUpdate,
     db: AsyncSession = Depends(database.get_db),
 ):
-    db_detail = await crud.get_point_detail(db, detail_id)
+    db_detail = await crud.update_point_detail(db, detail_id, detail)
     if db_detail is None:
         raise InternalException(
             "해당 포인트 상세 내역을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    return await crud.update_point_detail(db, detail_id, detail)
+    return db_detail
 
 
 @point_router.delete(
@@ -198,32 +251,36 @@ async def delete_point_detail(
     detail_id: int,
     db: AsyncSession = Depends(database.get_db),
 ):
-    db_detail = await crud.get_point_detail(db, detail_id)
-    if db_detail is None:
+    deleted_id = await crud.delete_point_detail(db, detail_id)
+    if deleted_id is None:
         raise InternalException(
             "해당 포인트 상세 내역을 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    await crud.delete_point_detail(db, detail_id)
     return {"detail": "포인트 상세 내역이 성공적으로 삭제되었습니다."}
 
 
 # response example : {'user_id': '67a57e83-0078-4f11-af56-286e90469b9a', 'balance': 100}
+# verify=true : {..., 'balance': 100, 'verified_balance': 100, 'consistent': True}
 @point_router.get(
     "/user/{user_id}/balance",
     summary="사용자의 포인트 잔액 조회",
-    description="사용자의 포인트 잔액을 조회합니다.",
+    description="사용자의 포인트 잔액을 조회합니다. "
+    "verify=true이면 전체 이력을 집계한 잔액(verified_balance)과 일치 여부를 함께 반환하며, "
+    "잔액 ledger를 고치지는 않습니다.",
     dependencies=[Depends(auth)],
 )
 async def get_user_point_balance(
-    request: Request, user_id: str, db: AsyncSession = Depends(database.get_db)
+    request: Request,
+    user_id: str,
+    verify: bool = False,
+    db: AsyncSession = Depends(database.get_db),
 ):
-    current_user = await check_user(request=request)
-    current_user_data = await user_crud.get_user_by_email(
-        db=db, user_email=current_user
-    )
+    current_user_data = await get_current_user_info(request, db)
     if str(current_user_data.id) != user_id:
         raise InternalException(
             "포인트 내역은 본인만 조회할 수 있습니다.", error_code=ErrorCode.FORBIDDEN
         )
+    if verify:
+        return {"user_id": user_id, **await crud.check_user_points(db, user_id)}
     balance = await crud.get_user_points(db, user_id)
     return {"user_id": user_id, "balance": balance}
@@ -4,7 +4,7 @@
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
 from logging import getLogger
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
@@ -12,7 +12,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.crud import user as crud
 from src.db import database
-from src.utils.authentication import create_access_token
+from src.router._pagination import paginate
+from src.router._response import schema_response
+from src.utils.authentication import create_access_token, principal_cache
 from src.helper.exceptions import InternalException, ErrorCode
 from src.schemas.requests import UserCreate, UserUpdate, UserLogin
 from src.schemas.responses import UserSchema
@@ -29,10 +31,14 @@ user_router = APIRouter(prefix="/user")
     description="모든 회원에 대한 정보를 조회합니다.",
 )
 async def get_all_users(
-    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(database.get_db)
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(database.get_db),
 ):
     log.info(f"Reading students info with skip: {skip} and limit: {limit}")
-    return await crud.get_all_users(db, skip=skip, limit=limit)
+    page = await crud.get_all_users(db, skip=skip, limit=limit, cursor=cursor)
+    return paginate(page, UserSchema)
 
 
 @user_router.get(
@@ -47,7 +53,7 @@ async def read_user(user_uid: str, db: AsyncSession = Depends(database.get_db)):
         raise InternalException(
             "해당 유저를 찾을 수 없습니다.", error_code=ErrorCode.NOT_FOUND
         )
-    return db_user
+    return schema_response(db_user, UserSchema)
 
 
 @user_router.post(
@@ -112,12 +118,14 @@ async def delete_user(
 )
 async def login(user_login: UserLogin, db: AsyncSession = Depends(database.get_db)):
     user = await crud.get_user_by_identifier(db, user_login.identifier)
-    if not user or not user.verify_password(user_login.password):
+    if not user or not await user.verify_password(user_login.password):
         raise InternalException(
             "이메일 혹은 비밀번호가 잘못되었습니다.",
             error_code=ErrorCode.UNAUTHORIZED,
         )
     access_token = create_access_token(data={"sub": user.email})
+    # 같은 초에 재발급된 토큰은 값이 같으므로 이전 캐시 항목을 비웁니다.
+    principal_cache.invalidate_token(f"Bearer {access_token}")
     user_data = UserSchema.model_validate(user.__dict__).model_dump_json()
     response = JSONResponse(content={"user": user_data})
     response.set_cookie(
@@ -143,6 +151,7 @@ async def logout(
             "로그인 되어 있는 유저 정보가 없습니다.",
             error_code=ErrorCode.UNAUTHORIZED,
         )
+    principal_cache.invalidate_token(request.cookies.get("access_token"))
     response = JSONResponse(content="성공적으로 로그아웃 하였습니다.", status_code=204)
     response.delete_cookie(key="access_token")
     return response
@@ -4,6 +4,7 @@
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
 from datetime import datetime, date
+from uuid import UUID
 
 from pydantic import BaseModel, Field, EmailStr
 from typing import Optional, List
@@ -107,6 +108,10 @@ class ListingUpdate(BaseModel):
     amount: Optional[int]
 
 
+class ListingBulkUpdate(ListingUpdate):
+    id: UUID
+
+
 # --------------------------------------------------------------------------
 # Order
 # --------------------------------------------------------------------------
@@ -119,6 +124,10 @@ class OrderUpdate(BaseModel):
     is_refunded: Optional[bool]
 
 
+class OrderBulkUpdate(OrderUpdate):
+    id: UUID
+
+
 # --------------------------------------------------------------------------
 # Itinerary
 # --------------------------------------------------------------------------
@@ -158,6 +167,10 @@ class PointEventUpdate(PointEventBase):
     pass
 
 
+class PointEventBulkUpdate(PointEventUpdate):
+    id: int
+
+
 class PointDetailCreate(PointDetailBase):
     pass
 
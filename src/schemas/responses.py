@@ -8,7 +8,7 @@ from uuid import UUID
 from enum import Enum
 
 from pydantic import BaseModel, Field, EmailStr, SecretStr, field_serializer
-from typing import Optional, List
+from typing import Generic, Optional, List, TypeVar, Union
 
 
 # --------------------------------------------------------------------------
@@ -47,6 +47,42 @@ class AreaSchemaAPI(AreaBase):
     image: str
 
 
+class AreaIngestReport(BaseModel):
+    total: int = Field(..., description="중복 제거 후 적재 대상 행 수입니다.")
+    inserted: int = Field(..., description="새로 추가된 행 수입니다.")
+    updated: int = Field(..., description="내용이 바뀌어 갱신된 행 수입니다.")
+    skipped: int = Field(..., description="내용이 같아 건너뛴 행 수입니다.")
+    elapsed_ms: float = Field(..., description="DB 적재에 걸린 시간(ms)입니다.")
+    parse_ms: Optional[float] = Field(
+        None, description="CSV 파싱과 검증에 걸린 시간(ms)입니다."
+    )
+    rejected: int = Field(
+        0, description="중복되거나 검증에 실패해 제외된 CSV 행 수입니다."
+    )
+
+
+class IngestJobSchema(BaseModel):
+    id: str = Field(..., description="적재 작업의 식별자입니다.")
+    status: str = Field(
+        ..., description="작업 상태입니다. (pending, running, succeeded, failed)"
+    )
+    stage: Optional[str] = Field(
+        None, description="현재 진행 단계입니다. (parsing, writing, done)"
+    )
+    processed: int = Field(..., description="현재 단계에서 처리한 행 수입니다.")
+    total: Optional[int] = Field(None, description="적재 대상 전체 행 수입니다.")
+    progress: float = Field(..., description="0에서 1 사이의 진행률입니다.")
+    result: Optional[AreaIngestReport] = Field(
+        None, description="작업이 끝난 뒤의 적재 결과입니다."
+    )
+    error: Optional[str] = Field(None, description="작업이 실패한 경우의 사유입니다.")
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 # --------------------------------------------------------------------------
 # Listing
 # --------------------------------------------------------------------------
@@ -165,8 +201,8 @@ class TransportContainerSchema(BaseModel):
 
 class ItinerarySchema(ItineraryBase):
     id: UUID
-    place_containers: List[PlaceContainerSchema]
-    transport_containers: List[TransportContainerSchema]
+    place_containers: List[PlaceContainerSchema] = []
+    transport_containers: List[TransportContainerSchema] = []
 
     class Config:
         from_attributes = True
@@ -186,6 +222,7 @@ class PointEventBase(BaseModel):
 
 class PointEventSchema(PointEventBase):
     id: int
+    expired_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -205,6 +242,35 @@ class PointDetailSchema(PointDetailBase):
         from_attributes = True
 
 
+class PointExpiryReport(BaseModel):
+    users: int = Field(..., description="만료 대상 이벤트가 있던 사용자 수입니다.")
+    events_scanned: int = Field(
+        ..., description="FIFO 배분을 위해 읽은 포인트 이벤트 수입니다."
+    )
+    events_expired: int = Field(..., description="만료 처리된 포인트 이벤트 수입니다.")
+    points_expired: int = Field(..., description="만료되어 차감된 포인트 합계입니다.")
+    details_written: int = Field(
+        ..., description="새로 기록한 만료 포인트 상세 내역 수입니다."
+    )
+    chunks: int = Field(
+        ..., description="사용자 묶음(chunk) 단위 transaction 수입니다."
+    )
+    elapsed_ms: float = Field(..., description="전체 처리에 걸린 시간(ms)입니다.")
+    events_per_second: float = Field(
+        ..., description="초당 읽어 처리한 포인트 이벤트 수입니다."
+    )
+
+
+class PointBalanceRepairReport(BaseModel):
+    users: int = Field(..., description="잔액 ledger를 검사한 사용자 수입니다.")
+    repaired: int = Field(..., description="ledger가 어긋나 보정한 사용자 수입니다.")
+    points_adjusted: int = Field(..., description="보정한 증감분 절댓값의 합계입니다.")
+    chunks: int = Field(
+        ..., description="사용자 묶음(chunk) 단위 transaction 수입니다."
+    )
+    elapsed_ms: float = Field(..., description="전체 처리에 걸린 시간(ms)입니다.")
+
+
 # --------------------------------------------------------------------------
 # User
 # --------------------------------------------------------------------------
@@ -252,3 +318,25 @@ class UserSchema(UserBase):
 
     class Config:
         from_attributes = True
+
+
+# --------------------------------------------------------------------------
+# Bulk
+# --------------------------------------------------------------------------
+ItemT = TypeVar("ItemT")
+
+
+class BulkResultStatus(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    NOT_FOUND = "not_found"
+
+
+class BulkItemResult(BaseModel, Generic[ItemT]):
+    index: int = Field(..., description="요청 목록에서 해당 항목의 위치입니다.")
+    id: Union[UUID, int] = Field(..., description="처리한 객체의 고유 식별자입니다.")
+    status: BulkResultStatus = Field(..., description="항목의 처리 결과입니다.")
+    item: Optional[ItemT] = Field(
+        None, description="처리된 객체입니다. 찾지 못한 항목은 비어 있습니다."
+    )
@@ -4,9 +4,13 @@
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
 import jwt
+import time
+import asyncio
+import threading
 
-from typing import Union
+from typing import Union, Callable, Any, Optional
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
@@ -15,6 +19,13 @@ from passlib.context import CryptContext
 
 from src.core.settings import settings
 from src.helper.exceptions import InternalException, ErrorCode
+from src.utils.cache import TTLCache
+from src.utils.metrics import (
+    metrics,
+    PASSWORD_HASHER_IN_FLIGHT,
+    PASSWORD_HASHER_QUEUE_DEPTH,
+    PASSWORD_HASHER_MAX_QUEUE_DEPTH,
+)
 
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.HASH_ALGORITHM
@@ -31,6 +42,7 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     user_email: Union[str, None] = None
+    exp: Union[int, None] = None
 
 
 def verify_password(plain_password, hashed_password):
@@ -41,6 +53,94 @@ def get_password_hash(password):
     return pwd_context.hash(password)
 
 
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증을 이벤트 루프 밖의 bounded thread pool에서 수행합니다.
+
+    bcrypt는 연산 중 GIL을 해제하므로 thread pool로 충분하며,
+    동시에 실행되는 작업 수는 pool 크기(THREAD_POOL_SIZE)로 제한되고
+    나머지 요청은 pool의 큐에서 대기합니다.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._running = 0
+        self._completed = 0
+        self._max_queue_depth = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+        return self._executor
+
+    def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._running += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    async def _submit(self, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._submitted += 1
+            self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(), self._run, func, *args
+            )
+        finally:
+            with self._lock:
+                self._submitted -= 1
+
+    @property
+    def queue_depth(self) -> int:
+        """pool에 제출되었지만 아직 worker thread를 할당받지 못한 작업 수"""
+        return max(self._submitted - self._running, 0)
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "in_flight": self._running,
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self._max_queue_depth,
+                "completed": self._completed,
+            }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(max_workers=settings.THREAD_POOL_SIZE or 1)
+
+
+def _collect_password_hasher_metrics() -> None:
+    stats = password_hasher.stats()
+    PASSWORD_HASHER_QUEUE_DEPTH.set(stats["queue_depth"])
+    PASSWORD_HASHER_IN_FLIGHT.set(stats["in_flight"])
+    PASSWORD_HASHER_MAX_QUEUE_DEPTH.set(stats["max_queue_depth"])
+
+
+metrics.add_collector("password_hasher", _collect_password_hasher_metrics)
+
+
 def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -66,7 +166,60 @@ async def decode_user_data_from_token(
         user_email: str = payload.get("sub")
         if user_email is None:
             raise credentials_exception
-        token_data = TokenData(user_email=user_email)
+        token_data = TokenData(user_email=user_email, exp=payload.get("exp"))
     except jwt.PyJWTError:
         raise credentials_exception
     return token_data, user_email
+
+
+class PrincipalCache:
+    """
+    access token -> 인증된 유저(UserSchema) 매핑을 캐싱합니다.
+
+    항목은 설정된 TTL과 토큰 만료 시각 중 이른 시점에 만료되며,
+    유저 정보가 수정/삭제되면 해당 유저의 모든 토큰 항목을 무효화합니다.
+    캐시는 worker 프로세스마다 따로 존재하므로 다른 worker의 항목은 TTL로만 만료되며,
+    worker가 여러 개면 TTL을 AUTH_CACHE_MULTI_WORKER_TTL_SECONDS 이하로 줄여 그 시간을 제한합니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl, on_evict=self._forget)
+        # 캐시에 남아 있는 토큰만 담으므로 크기는 maxsize를 넘지 않습니다.
+        self._tokens_by_user: dict[str, set[str]] = {}
+
+    def get(self, token: str) -> Optional[Any]:
+        return self._cache.get(token)
+
+    def set(self, token: str, principal: Any, expires_at: Optional[int] = None) -> None:
+        ttl = None if expires_at is None else expires_at - time.time()
+        self._cache.set(token, principal, ttl=ttl)
+        if token in self._cache:
+            self._tokens_by_user.setdefault(str(principal.id), set()).add(token)
+
+    def invalidate_token(self, token: str) -> None:
+        principal = self._cache.pop(token)
+        if principal is not None:
+            self._forget(token, principal)
+
+    def invalidate_user(self, user_id: Any) -> None:
+        for token in self._tokens_by_user.pop(str(user_id), set()):
+            self._cache.pop(token)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._tokens_by_user.clear()
+
+    def _forget(self, token: str, principal: Any) -> None:
+        """캐시에서 빠진(무효화, LRU, 만료) 토큰을 유저별 인덱스에서 지웁니다."""
+        user_id = str(principal.id)
+        tokens = self._tokens_by_user.get(user_id)
+        if tokens is None:
+            return
+        tokens.discard(token)
+        if not tokens:
+            del self._tokens_by_user[user_id]
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.AUTH_CACHE_MAX_SIZE, ttl=settings.AUTH_CACHE_EFFECTIVE_TTL_SECONDS
+)
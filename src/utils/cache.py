@@ -0,0 +1,195 @@
+# --------------------------------------------------------------------------
+# 프로세스 내(in-process) 캐시 구현을 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import time
+import asyncio
+import logging
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    LRU 순서로 최대 maxsize개의 항목을 유지하며, 각 항목은 ttl(초)이 지나면 만료됩니다.
+
+    항목이 LRU로 밀려나거나 만료되어 제거되면 on_evict(key, value)를 호출합니다.
+    (pop/clear로 직접 제거한 항목은 호출하지 않습니다.)
+    이벤트 루프 한 곳에서만 접근한다는 전제로 lock을 사용하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self._evicted(key, value)
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            entry = self._data.pop(key, None)
+            if entry is not None:
+                self._evicted(key, entry[1])
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            evicted_key, (_, evicted_value) = self._data.popitem(last=False)
+            self._evicted(evicted_key, evicted_value)
+
+    def _evicted(self, key: Hashable, value: Any) -> None:
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class StaleWhileRevalidateCache:
+    """
+    fresh_ttl 동안은 캐시된 값을 그대로 반환하고, 이후 stale_ttl 동안은
+    오래된 값을 즉시 반환하면서 key당 하나의 백그라운드 갱신만 실행합니다.
+
+    값이 없거나 stale 기간도 지난 경우에는 loader를 직접 기다리며,
+    같은 key에 대한 동시 요청은 하나의 loader 호출을 공유합니다.
+    """
+
+    def __init__(self, maxsize: int, fresh_ttl: float, stale_ttl: float):
+        self.maxsize = maxsize
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, float, Any]]" = OrderedDict()
+        self._inflight: dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._refreshing: dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        entry = self._data.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            fresh_until, stale_until, value = entry
+            if now < fresh_until:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            if now < stale_until:
+                self._data.move_to_end(key)
+                self.stale_hits += 1
+                # task가 시작되기 전에 들어온 stale 조회도 갱신을 한 번만 예약합니다.
+                if key not in self._inflight and key not in self._refreshing:
+                    task = asyncio.create_task(self._refresh(key, loader))
+                    self._refreshing[key] = task
+                    task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+                return value
+
+        self.misses += 1
+        return await self._load(key, loader)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 대기 중인 요청이 없더라도 "exception never retrieved" 경고를 남기지 않습니다.
+            future.exception()
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    async def _refresh(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> None:
+        try:
+            await self._load(key, loader)
+        except Exception:
+            logger.warning("Background refresh failed for %r, serving stale value", key)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = time.monotonic()
+        self._data[key] = (
+            now + self.fresh_ttl,
+            now + self.fresh_ttl + self.stale_ttl,
+            value,
+        )
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshing": len(self._refreshing),
+        }
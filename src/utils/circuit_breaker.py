@@ -0,0 +1,107 @@
+# --------------------------------------------------------------------------
+# 외부 API 호출을 보호하는 circuit breaker를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import time
+
+from collections import deque
+from enum import Enum
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    최근 window_size번 호출의 실패율이 failure_rate 이상이면 circuit을 열어
+    reset_timeout 동안 호출을 즉시 거절합니다.
+
+    reset_timeout이 지나면 half-open 상태에서 한 번의 시험 호출만 허용하고,
+    성공하면 다시 닫고 실패하면 다시 엽니다.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 30.0,
+    ):
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self.opened_count = 0
+        self.rejected_count = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probing = False
+        return self._state
+
+    @property
+    def error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected_count += 1
+        return False
+
+    def record_success(self) -> None:
+        if self._state is CircuitState.HALF_OPEN:
+            self._outcomes.clear()
+            self._state = CircuitState.CLOSED
+            self._probing = False
+        self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        if self._state is CircuitState.HALF_OPEN:
+            self._open()
+            return
+        self._outcomes.append(False)
+        if (
+            self._state is CircuitState.CLOSED
+            and len(self._outcomes) >= self.min_calls
+            and self.error_rate >= self.failure_rate
+        ):
+            self._open()
+
+    def release(self) -> None:
+        """결과 없이 끝난(취소된) 시험 호출의 자리를 반납합니다."""
+        self._probing = False
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._probing = False
+        self.opened_count += 1
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state.value,
+            "error_rate": round(self.error_rate, 4),
+            "opened_count": self.opened_count,
+            "rejected_count": self.rejected_count,
+        }
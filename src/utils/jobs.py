@@ -0,0 +1,290 @@
+# --------------------------------------------------------------------------
+# 백그라운드 작업(job)과 process pool을 관리하는 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import uuid
+import asyncio
+import logging
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.settings import settings
+from src.db.models import BackgroundJob
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+INTERRUPTED_ERROR = "Interrupted by server shutdown"
+ABANDONED_ERROR = "Abandoned: the worker running this job stopped without finishing it"
+
+# 끝난 작업은 이 기간이 지나면 새 작업을 등록할 때 정리합니다.
+JOB_RETENTION = timedelta(days=7)
+
+
+class Job:
+    def __init__(self, kind: str):
+        self.id = str(uuid.uuid4())
+        self.kind = kind
+        self.status = JobStatus.PENDING
+        self.stage: Optional[str] = None
+        self.processed = 0
+        self.total: Optional[int] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.finished_at: Optional[datetime] = None
+
+    @classmethod
+    def from_row(cls, row: Any) -> "Job":
+        job = cls(row.kind)
+        job.id = str(row.id)
+        job.status = JobStatus(row.status)
+        job.stage = row.stage
+        job.processed = row.processed
+        job.total = row.total
+        job.result = row.result
+        job.error = row.error
+        job.created_at = row.created_at
+        job.finished_at = row.finished_at
+        return job
+
+    @property
+    def progress(self) -> float:
+        if self.status is JobStatus.SUCCEEDED:
+            return 1.0
+        if not self.total:
+            return 0.0
+        return round(min(self.processed / self.total, 1.0), 4)
+
+    def advance(self, stage: str, processed: int = 0, total: Optional[int] = None):
+        self.stage = stage
+        self.processed = processed
+        if total is not None:
+            self.total = total
+
+    def values(self) -> Dict[str, Any]:
+        result = self.result
+        if isinstance(result, BaseModel):
+            result = result.model_dump(mode="json")
+        return {
+            "status": self.status.value,
+            "stage": self.stage,
+            "processed": self.processed,
+            "total": self.total,
+            "result": result,
+            "error": self.error,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobRegistry:
+    """
+    백그라운드 작업을 현재 worker의 이벤트 루프에서 실행하고, 상태는 Background_Job 테이블에 둡니다.
+
+    진행 상황은 advance가 바뀐 경우에만 progress_interval마다 기록하므로, 작업은
+    advance를 자주 호출해도 DB 왕복이 늘어나지 않고 조회는 어느 worker에서든 가능합니다.
+    진행이 없어도 heartbeat_interval마다 행의 updated를 갱신하므로, 강제 종료된 worker의
+    작업은 updated가 stale_after보다 오래되어 fail_stale이 실패로 정리합니다.
+    """
+
+    def __init__(
+        self,
+        progress_interval: float = 1.0,
+        heartbeat_interval: float = 10.0,
+        stale_after: float = 60.0,
+    ):
+        self.progress_interval = progress_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> int:
+        """현재 worker에서 실행 중인 작업 수입니다."""
+        return len(self._tasks)
+
+    async def get(self, bind: AsyncEngine, job_id: str) -> Optional[Job]:
+        # 방금 등록된 작업도 보이도록 replica가 아닌 primary에서 읽습니다.
+        try:
+            key = uuid.UUID(job_id)
+        except ValueError:
+            return None
+        table = BackgroundJob.__table__
+        async with bind.connect() as conn:
+            result = await conn.execute(select(table).where(table.c.id == key))
+            row = result.first()
+        return None if row is None else Job.from_row(row)
+
+    async def submit(
+        self,
+        bind: AsyncEngine,
+        kind: str,
+        runner: Callable[[Job], Awaitable[Any]],
+    ) -> Job:
+        job = Job(kind)
+        table = BackgroundJob.__table__
+        async with bind.begin() as conn:
+            await conn.execute(
+                delete(table).where(
+                    table.c.finished_at < datetime.utcnow() - JOB_RETENTION
+                )
+            )
+            await conn.execute(
+                insert(table).values(
+                    id=uuid.UUID(job.id),
+                    kind=job.kind,
+                    created_at=job.created_at,
+                    **job.values(),
+                )
+            )
+
+        task = asyncio.create_task(self._run(job, bind, runner))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _save(self, job: Job, bind: AsyncEngine) -> None:
+        table = BackgroundJob.__table__
+        async with bind.begin() as conn:
+            await conn.execute(
+                update(table)
+                .where(table.c.id == uuid.UUID(job.id))
+                .values(**job.values(), updated=func.now())
+            )
+
+    async def _report_progress(self, job: Job, bind: AsyncEngine) -> None:
+        loop = asyncio.get_running_loop()
+        saved, saved_at = None, loop.time()
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            current = (job.stage, job.processed, job.total)
+            if current != saved or loop.time() - saved_at >= self.heartbeat_interval:
+                await self._save(job, bind)
+                saved, saved_at = current, loop.time()
+
+    async def fail_stale(self, bind: AsyncEngine) -> int:
+        """heartbeat가 stale_after초 넘게 끊긴 미완료 작업을 실패로 기록하고 그 수를 반환합니다."""
+        table = BackgroundJob.__table__
+        async with bind.begin() as conn:
+            result = await conn.execute(
+                update(table)
+                .where(
+                    table.c.status.in_(
+                        [JobStatus.PENDING.value, JobStatus.RUNNING.value]
+                    ),
+                    table.c.updated < func.now() - timedelta(seconds=self.stale_after),
+                )
+                .values(
+                    status=JobStatus.FAILED.value,
+                    error=ABANDONED_ERROR,
+                    finished_at=datetime.utcnow(),
+                    updated=func.now(),
+                )
+            )
+        if result.rowcount:
+            logger.warning(
+                f"Marked {result.rowcount} abandoned background jobs as failed"
+            )
+        return result.rowcount
+
+    async def sweep_stale(self, bind: AsyncEngine) -> None:
+        """heartbeat_interval마다 fail_stale을 실행합니다."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self.fail_stale(bind)
+            except Exception:
+                logger.exception("Failed to sweep abandoned background jobs")
+
+    async def _run(
+        self,
+        job: Job,
+        bind: AsyncEngine,
+        runner: Callable[[Job], Awaitable[Any]],
+    ) -> None:
+        reporter: Optional[asyncio.Task] = None
+        try:
+            job.status = JobStatus.RUNNING
+            await self._save(job, bind)
+            reporter = asyncio.create_task(self._report_progress(job, bind))
+            job.result = await runner(job)
+            job.status = JobStatus.SUCCEEDED
+        except asyncio.CancelledError:
+            logger.warning(f"Job {job.kind}:{job.id} was interrupted")
+            job.error = INTERRUPTED_ERROR
+            job.status = JobStatus.FAILED
+            raise
+        except Exception as e:
+            logger.exception(f"Job {job.kind}:{job.id} failed")
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+            job.finished_at = datetime.utcnow()
+            await self._save(job, bind)
+
+    async def shutdown(self, timeout: float) -> None:
+        """
+        실행 중인 작업이 timeout초 안에 끝나기를 기다리고, 남은 작업은 취소합니다.
+
+        취소된 작업은 실패(INTERRUPTED_ERROR)로 기록되므로 조회하는 쪽에서 다시 요청할 수 있습니다.
+        """
+        tasks = set(self._tasks)
+        if not tasks:
+            return
+        logger.info(f"Waiting up to {timeout}s for {len(tasks)} background jobs")
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+job_registry = JobRegistry(
+    progress_interval=settings.JOB_PROGRESS_INTERVAL_SECONDS,
+    heartbeat_interval=settings.JOB_HEARTBEAT_INTERVAL_SECONDS,
+    stale_after=settings.JOB_STALE_AFTER_SECONDS,
+)
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.PROCESS_POOL_SIZE,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+async def run_in_process(func: Callable[..., Any], *args: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), func, *args)
+
+
+def shutdown_process_pool() -> None:
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
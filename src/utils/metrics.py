@@ -0,0 +1,560 @@
+# --------------------------------------------------------------------------
+# Prometheus text format으로 노출하는 프로세스 내 metric을 정의한 모듈입니다.
+#
+# metric 값은 worker 프로세스마다 따로 집계되며, 모든 갱신은 이벤트 루프 thread에서
+# 일어난다는 전제로 lock 없이 dict/list의 값만 바꿉니다.
+# 여러 worker로 실행할 때는 enable_multiprocess로 지정한 디렉터리에 worker마다 snapshot을
+# 남기고, scrape를 받은 worker가 모든 snapshot을 합쳐 서버 전체의 값으로 응답합니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import os
+import json
+import time
+import asyncio
+import logging
+import weakref
+
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(v))}"' for name, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    """
+    label 조합마다 값 하나를 갖는 metric(counter, gauge)의 공통 구현입니다.
+
+    Histogram처럼 label 조합마다 여러 값을 갖는 metric은 render, dump, merge를 재정의합니다.
+    """
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def _header(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+
+    def render(self) -> Iterator[str]:
+        yield from self._header()
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+    def dump(self) -> List[list]:
+        """snapshot 파일에 쓸 [label 값 list, 값] 목록을 반환합니다."""
+        return [[list(labels), value] for labels, value in self._values.items()]
+
+    def merge(self, values: List[list]) -> None:
+        """다른 프로세스의 dump 결과를 더합니다."""
+        for labels, value in values:
+            labels = tuple(labels)
+            self._values[labels] = self._values.get(labels, 0.0) + value
+
+    def empty_copy(self) -> "_Metric":
+        return type(self)(self.name, self.documentation, self.labelnames)
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+
+class Gauge(_Metric):
+    """
+    현재 값을 나타내는 metric입니다.
+
+    여러 worker의 값을 합칠 때 multiprocess_mode가 "sum"이면 더하고, "max"이면
+    가장 큰 값을 사용하며, 종료된 worker의 값은 포함하지 않습니다.
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        multiprocess_mode: str = "sum",
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.multiprocess_mode = multiprocess_mode
+
+    def merge(self, values: List[list]) -> None:
+        if self.multiprocess_mode != "max":
+            super().merge(values)
+            return
+        for labels, value in values:
+            labels = tuple(labels)
+            self._values[labels] = max(self._values.get(labels, value), value)
+
+    def empty_copy(self) -> "Gauge":
+        return Gauge(
+            self.name, self.documentation, self.labelnames, self.multiprocess_mode
+        )
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+
+class Histogram(_Metric):
+    """
+    label 조합마다 bucket별 개수와 합계를 하나의 list에 담아 두는 histogram입니다.
+
+    observe는 bisect로 bucket을 찾아 정수 하나와 float 하나만 더하며,
+    Prometheus가 요구하는 누적(cumulative) 개수는 scrape 시점에 계산합니다.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # [bucket별 개수..., +Inf bucket 개수, 합계]
+        self._series: Dict[Labels, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return 0 if series is None else int(sum(series[:-1]))
+
+    def dump(self) -> List[list]:
+        return [[list(labels), series] for labels, series in self._series.items()]
+
+    def merge(self, values: List[list]) -> None:
+        for labels, other in values:
+            labels = tuple(labels)
+            series = self._series.get(labels)
+            if series is None:
+                self._series[labels] = list(other)
+            else:
+                self._series[labels] = [a + b for a, b in zip(series, other)]
+
+    def empty_copy(self) -> "Histogram":
+        return Histogram(self.name, self.documentation, self.labelnames, self.buckets)
+
+    def render(self) -> Iterator[str]:
+        yield from self._header()
+        for labels, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    self.labelnames + ("le",), labels + (_format_value(bound),)
+                )
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            label_text = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_text} {_format_value(series[-1])}"
+            yield f"{self.name}_count{label_text} {cumulative}"
+
+
+class MetricsRegistry:
+    """
+    metric 목록과, scrape 직전에 gauge 값을 채우는 collector 함수를 보관합니다.
+
+    pool 크기나 큐 길이처럼 이미 다른 객체가 들고 있는 값은 요청마다 갱신하지 않고
+    collector가 scrape할 때만 읽어옵니다.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], None]] = {}
+        self._multiprocess_dir: Optional[Path] = None
+
+    @property
+    def multiprocess(self) -> bool:
+        return self._multiprocess_dir is not None
+
+    def _register(self, metric: _Metric) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        multiprocess_mode: str = "sum",
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, multiprocess_mode))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, key: str, collector: Callable[[], None]) -> None:
+        """같은 key로 다시 등록하면 기존 collector를 교체합니다."""
+        self._collectors[key] = collector
+
+    def _collect(self) -> None:
+        for key, collector in list(self._collectors.items()):
+            try:
+                collector()
+            except Exception:
+                logger.exception(f"Metrics collector {key} failed")
+
+    def enable_multiprocess(self, directory: str) -> None:
+        """이 프로세스의 값을 directory에 snapshot으로 남기고, scrape 시 모든 snapshot을 합칩니다."""
+        self._multiprocess_dir = Path(directory)
+
+    def write_snapshot(self, live: bool = True) -> None:
+        """
+        현재 프로세스의 값을 <pid>.json에 씁니다.
+
+        종료하는 worker는 live=False로 남겨, counter와 histogram은 계속 합계에 포함되고
+        gauge는 더 이상 포함되지 않게 합니다.
+        """
+        if self._multiprocess_dir is None:
+            return
+        self._collect()
+        snapshot = {
+            "live": live,
+            "metrics": {name: m.dump() for name, m in self._metrics.items()},
+        }
+        path = self._multiprocess_dir / f"{os.getpid()}.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(snapshot))
+        os.replace(tmp_path, path)
+
+    def _merged_metrics(self) -> List[_Metric]:
+        merged = {name: m.empty_copy() for name, m in self._metrics.items()}
+        for path in sorted(self._multiprocess_dir.glob("*.json")):
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                logger.warning(f"Skipping unreadable metrics snapshot {path}")
+                continue
+            for name, values in snapshot["metrics"].items():
+                metric = merged.get(name)
+                if metric is None:
+                    continue
+                if isinstance(metric, Gauge) and not snapshot["live"]:
+                    continue
+                metric.merge(values)
+        return list(merged.values())
+
+    def render(self) -> str:
+        if self._multiprocess_dir is None:
+            self._collect()
+            rendered = self._metrics.values()
+        else:
+            self.write_snapshot()
+            rendered = self._merged_metrics()
+        lines = []
+        for metric in rendered:
+            lines.extend(metric.render())
+        lines.append("")
+        return "\n".join(lines)
+
+
+metrics = MetricsRegistry()
+
+
+def mark_process_dead(directory: str, pid: int) -> None:
+    """종료된 worker의 snapshot을 live=False로 바꿉니다. (gunicorn master의 child_exit에서 호출)"""
+    path = Path(directory) / f"{pid}.json"
+    try:
+        snapshot = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return
+    snapshot["live"] = False
+    path.write_text(json.dumps(snapshot))
+
+
+async def flush_metrics(interval: float) -> None:
+    """다른 worker가 scrape를 받아도 이 worker의 값이 반영되도록 interval마다 snapshot을 씁니다."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            metrics.write_snapshot()
+        except OSError:
+            logger.exception("Failed to write metrics snapshot")
+
+
+HTTP_REQUESTS = metrics.counter(
+    "kbuddy_http_requests_total",
+    "HTTP requests by method, route template and status code.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = metrics.histogram(
+    "kbuddy_http_request_duration_seconds",
+    "HTTP request latency until the response is fully sent.",
+    ("method", "route"),
+)
+HTTP_REQUESTS_IN_PROGRESS = metrics.gauge(
+    "kbuddy_http_requests_in_progress", "HTTP requests currently being handled."
+)
+
+DB_POOL_CHECKOUTS = metrics.counter(
+    "kbuddy_db_pool_checkouts_total", "Connections checked out of the pool.", ("pool",)
+)
+DB_POOL_WAIT = metrics.histogram(
+    "kbuddy_db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection, including new connects.",
+    ("pool",),
+    buckets=FAST_BUCKETS,
+)
+DB_POOL_SIZE = metrics.gauge("kbuddy_db_pool_size", "Configured pool size.", ("pool",))
+DB_POOL_CHECKED_OUT = metrics.gauge(
+    "kbuddy_db_pool_checked_out", "Connections currently checked out.", ("pool",)
+)
+DB_POOL_OVERFLOW = metrics.gauge(
+    "kbuddy_db_pool_overflow",
+    "Connections opened beyond pool_size (negative while the pool fills up).",
+    ("pool",),
+)
+DB_QUERY_DURATION = metrics.histogram(
+    "kbuddy_db_query_duration_seconds",
+    "SQL statement execution time by statement kind.",
+    ("pool", "statement"),
+    buckets=FAST_BUCKETS,
+)
+DB_QUERY_ERRORS = metrics.counter(
+    "kbuddy_db_query_errors_total", "SQL statements that raised an error.", ("pool",)
+)
+
+TOUR_API_REQUEST_DURATION = metrics.histogram(
+    "kbuddy_tour_api_request_duration_seconds",
+    "Tour API call latency including retries.",
+    ("operation",),
+)
+TOUR_API_ERRORS = metrics.counter(
+    "kbuddy_tour_api_errors_total",
+    "Failed Tour API calls by reason.",
+    ("operation", "reason"),
+)
+TOUR_API_RETRIES = metrics.counter(
+    "kbuddy_tour_api_retries_total", "Tour API request retries."
+)
+TOUR_API_CIRCUIT_OPEN = metrics.gauge(
+    "kbuddy_tour_api_circuit_open",
+    "1 while the Tour API circuit breaker is open.",
+    multiprocess_mode="max",
+)
+TOUR_API_CIRCUIT_REJECTED = metrics.counter(
+    "kbuddy_tour_api_circuit_rejected_total",
+    "Tour API calls rejected by the open circuit.",
+)
+
+PASSWORD_HASHER_QUEUE_DEPTH = metrics.gauge(
+    "kbuddy_password_hasher_queue_depth",
+    "bcrypt jobs waiting for a worker thread.",
+)
+PASSWORD_HASHER_IN_FLIGHT = metrics.gauge(
+    "kbuddy_password_hasher_in_flight", "bcrypt jobs currently running."
+)
+PASSWORD_HASHER_MAX_QUEUE_DEPTH = metrics.gauge(
+    "kbuddy_password_hasher_max_queue_depth",
+    "Largest bcrypt queue depth seen since the worker started.",
+    multiprocess_mode="max",
+)
+
+EVENT_LOOP_LAG = metrics.histogram(
+    "kbuddy_event_loop_lag_seconds",
+    "Delay of a periodic timer beyond its scheduled wake-up time.",
+    buckets=FAST_BUCKETS,
+)
+
+
+class MetricsMiddleware:
+    """
+    요청마다 route template 기준으로 지연 시간과 status code를 기록하는 ASGI middleware입니다.
+
+    route label은 FastAPI가 매칭한 경로 template(/listing/{listing_id})을 사용하므로
+    path parameter 값이 label로 늘어나지 않으며, 매칭되지 않은 요청은 "unmatched"로 묶습니다.
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: dict) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, method, path)
+            HTTP_REQUESTS.inc(method, path, str(status))
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    connection을 얻기까지 걸린 시간(빈 connection 대기와 새 connect 포함)을 기록하는 pool입니다.
+
+    label은 instrument_engine이 붙인 이름을 쓰며, dispose로 pool이 다시 만들어져도 유지됩니다.
+    """
+
+    metrics_name = "primary"
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started, self.metrics_name)
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        pool = super().recreate()
+        pool.metrics_name = self.metrics_name
+        return pool
+
+
+def _statement_kind(statement: str) -> str:
+    head = statement.lstrip()[:6].upper()
+    for kind in ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH"):
+        if head.startswith(kind):
+            return kind
+    return "OTHER"
+
+
+_instrumented_engines: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def instrument_engine(engine: AsyncEngine, name: str = "primary") -> None:
+    """
+    engine의 pool checkout과 SQL 실행 시간을 name label로 기록하도록 event를 연결합니다.
+
+    같은 engine에 여러 번 호출해도 한 번만 연결됩니다.
+    """
+    sync_engine = engine.sync_engine
+    if sync_engine in _instrumented_engines:
+        return
+    _instrumented_engines.add(sync_engine)
+    if isinstance(sync_engine.pool, InstrumentedAsyncQueuePool):
+        sync_engine.pool.metrics_name = name
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKOUTS.inc(name)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if context is not None:
+            context._metrics_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        started = getattr(context, "_metrics_started", None)
+        if started is not None:
+            DB_QUERY_DURATION.observe(
+                time.perf_counter() - started, name, _statement_kind(statement)
+            )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        DB_QUERY_ERRORS.inc(name)
+
+    def collect_pool() -> None:
+        pool = sync_engine.pool
+        for gauge, attribute in (
+            (DB_POOL_SIZE, "size"),
+            (DB_POOL_CHECKED_OUT, "checkedout"),
+            (DB_POOL_OVERFLOW, "overflow"),
+        ):
+            method = getattr(pool, attribute, None)
+            if method is not None:
+                gauge.set(method(), name)
+
+    metrics.add_collector(f"db_pool:{name}", collect_pool)
+
+
+async def monitor_event_loop_lag(interval: float) -> None:
+    """
+    interval마다 잠들었다 깨어난 시각이 예정보다 얼마나 늦었는지 기록합니다.
+
+    동기 작업이 이벤트 루프를 막으면 그 시간만큼 timer가 늦게 실행되므로,
+    이 값이 커지면 루프 위에서 blocking 호출이 있다는 뜻입니다.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        scheduled = loop.time() + interval
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(loop.time() - scheduled, 0.0))
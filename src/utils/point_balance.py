@@ -0,0 +1,89 @@
+# --------------------------------------------------------------------------
+# 포인트 잔액 ledger(Point_Balance) 보정 배치 작업을 정의한 모듈입니다.
+#
+#   $ python -m src.utils.point_balance --chunk-size 1000
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import json
+import time
+import asyncio
+import logging
+import argparse
+
+from typing import Any, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.crud.point import repair_user_points
+from src.db.models import User
+from src.schemas.responses import PointBalanceRepairReport
+
+
+logger = logging.getLogger(__name__)
+
+
+async def _next_user_chunk(
+    db: AsyncSession, after: Optional[Any], size: int
+) -> List[Any]:
+    query = select(User.id).order_by(User.id).limit(size)
+    if after is not None:
+        query = query.where(User.id > after)
+    return list((await db.execute(query)).scalars())
+
+
+async def repair_point_balances(
+    bind: AsyncEngine, chunk_size: int = 1000
+) -> PointBalanceRepairReport:
+    """
+    모든 사용자의 잔액 ledger를 이력 전체의 집계 값과 비교해 어긋난 행을 바로잡습니다.
+
+    사용자를 chunk_size명씩 user_id 순으로 나누어 chunk마다 ledger 행을 잠그고 commit하므로,
+    요청 처리 중인 포인트 쓰기는 chunk 하나의 보정 시간 동안만 기다립니다.
+    """
+    started = time.perf_counter()
+    totals = {"users": 0, "repaired": 0, "points_adjusted": 0, "chunks": 0}
+
+    after = None
+    async with AsyncSession(bind=bind) as db:
+        while user_ids := await _next_user_chunk(db, after, chunk_size):
+            deltas = await repair_user_points(db, user_ids)
+            await db.commit()
+
+            after = user_ids[-1]
+            totals["users"] += len(user_ids)
+            totals["repaired"] += len(deltas)
+            totals["points_adjusted"] += sum(abs(delta) for delta in deltas.values())
+            totals["chunks"] += 1
+            logger.info(
+                f"Point balance chunk {totals['chunks']}: {totals['users']} users, "
+                f"{totals['repaired']} repaired"
+            )
+
+    return PointBalanceRepairReport(
+        **totals, elapsed_ms=round((time.perf_counter() - started) * 1000, 2)
+    )
+
+
+async def main(chunk_size: int) -> None:
+    from src.db.database import engine
+
+    try:
+        report = await repair_point_balances(engine, chunk_size=chunk_size)
+    finally:
+        await engine.dispose()
+    print(json.dumps(report.model_dump(), indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Repair Point_Balance rows that drifted from the point history"
+    )
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(args.chunk_size))
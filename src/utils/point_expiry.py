@@ -0,0 +1,250 @@
+# --------------------------------------------------------------------------
+# 포인트 만료 배치 작업을 정의한 모듈입니다.
+#
+#   $ python -m src.utils.point_expiry --chunk-size 1000
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import json
+import time
+import asyncio
+import logging
+import argparse
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from sqlalchemy import (
+    TIMESTAMP,
+    Integer,
+    and_,
+    any_,
+    bindparam,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.crud.point import apply_point_balance_deltas
+from src.db.models import PointBalance, PointDetail, PointEvent
+from src.schemas.responses import PointExpiryReport
+
+
+logger = logging.getLogger(__name__)
+
+
+def allocate_fifo(
+    user_codes: np.ndarray, earned: np.ndarray, outflow: np.ndarray
+) -> np.ndarray:
+    """
+    사용자별로 FIFO 순서로 정렬된 적립 배열에 사용자별 총 사용량(outflow)을
+    앞에서부터 배분하고, 각 적립 이벤트에 남은 포인트를 반환합니다.
+
+    user_codes는 outflow의 index이며 같은 사용자의 이벤트가 연속해 있어야 합니다.
+    """
+    if len(user_codes) == 0:
+        return earned.copy()
+    before = np.cumsum(earned) - earned
+    # 전체 누적합에서 각 사용자 구간 시작점의 누적값을 빼 사용자별 누적합으로 바꿉니다.
+    starts = np.flatnonzero(np.r_[True, user_codes[1:] != user_codes[:-1]])
+    lengths = np.diff(np.r_[starts, len(user_codes)])
+    before -= np.repeat(before[starts], lengths)
+    consumed = np.clip(outflow[user_codes] - before, 0, earned)
+    return earned - consumed
+
+
+async def _next_user_chunk(
+    db: AsyncSession, now: datetime, after: Optional[Any], size: int
+) -> List[Any]:
+    # ix_Point_Event_pending_expiry를 user_id 순으로 훑는 keyset 조회입니다.
+    query = (
+        select(PointEvent.user_id)
+        .where(
+            PointEvent.expired_at.is_(None),
+            PointEvent.exp_date.is_not(None),
+            PointEvent.exp_date <= now,
+        )
+        .distinct()
+        .order_by(PointEvent.user_id)
+        .limit(size)
+    )
+    if after is not None:
+        query = query.where(PointEvent.user_id > after)
+    return list((await db.execute(query)).scalars())
+
+
+async def _expire_chunk(
+    db: AsyncSession, user_ids: List[Any], now: datetime
+) -> Dict[str, int]:
+    # 같은 사용자의 포인트 쓰기와 겹치지 않도록 잔액 ledger 행을 먼저 잠급니다.
+    await db.execute(
+        select(PointBalance.user_id)
+        .where(PointBalance.user_id.in_(user_ids))
+        .with_for_update()
+    )
+
+    events = (
+        await db.execute(
+            select(
+                PointEvent.id,
+                PointEvent.user_id,
+                PointEvent.amount,
+                and_(PointEvent.expired_at.is_(None), PointEvent.exp_date <= now).label(
+                    "due"
+                ),
+            )
+            .where(PointEvent.user_id.in_(user_ids))
+            .order_by(
+                PointEvent.user_id,
+                PointEvent.exp_date.asc().nulls_last(),
+                PointEvent.event_date,
+                PointEvent.id,
+            )
+        )
+    ).all()
+    used = await db.execute(
+        select(PointEvent.user_id, func.sum(PointDetail.point))
+        .join(PointEvent, PointEvent.id == PointDetail.event_id)
+        .where(PointEvent.user_id.in_(user_ids))
+        .group_by(PointEvent.user_id)
+    )
+
+    index = {user_id: i for i, user_id in enumerate(user_ids)}
+    ids = np.fromiter((row.id for row in events), dtype=np.int64, count=len(events))
+    codes = np.fromiter(
+        (index[row.user_id] for row in events), dtype=np.int64, count=len(events)
+    )
+    amounts = np.fromiter(
+        (row.amount for row in events), dtype=np.int64, count=len(events)
+    )
+    due = np.fromiter(
+        (row.due is True for row in events), dtype=bool, count=len(events)
+    )
+
+    # 사용 내역(상세 내역)과 음수 금액 이벤트가 적립분을 만료일이 빠른 순서로 소진합니다.
+    outflow = np.zeros(len(user_ids), dtype=np.int64)
+    for user_id, point in used:
+        outflow[index[user_id]] += point
+    np.add.at(outflow, codes, np.maximum(-amounts, 0))
+    remainder = allocate_fifo(codes, np.maximum(amounts, 0), outflow)
+
+    expiring = due & (remainder > 0)
+    expired_ids = ids[due].tolist()
+    if expiring.any():
+        # 만료 상세 내역은 두 배열을 unnest하는 INSERT ... SELECT 한 문장으로 기록합니다.
+        expiry = (
+            func.unnest(
+                bindparam("event_ids", ids[expiring].tolist(), type_=ARRAY(Integer)),
+                bindparam("points", remainder[expiring].tolist(), type_=ARRAY(Integer)),
+            )
+            .table_valued("event_id", "point")
+            .render_derived()
+        )
+        await db.execute(
+            insert(PointDetail).from_select(
+                ["event_id", "related_event_id", "point_date", "point"],
+                select(
+                    expiry.c.event_id,
+                    expiry.c.event_id,
+                    literal(now, TIMESTAMP),
+                    expiry.c.point,
+                ),
+            )
+        )
+    if expired_ids:
+        await db.execute(
+            update(PointEvent)
+            .where(
+                PointEvent.id
+                == any_(bindparam("expired_ids", expired_ids, type_=ARRAY(Integer)))
+            )
+            .values(expired_at=now)
+        )
+
+    per_user = np.bincount(
+        codes[expiring], weights=remainder[expiring], minlength=len(user_ids)
+    )
+    await apply_point_balance_deltas(
+        db,
+        [(user_ids[i], -int(point)) for i, point in enumerate(per_user) if point],
+    )
+    return {
+        "events_scanned": len(events),
+        "events_expired": len(expired_ids),
+        "points_expired": int(remainder[expiring].sum()),
+        "details_written": int(expiring.sum()),
+    }
+
+
+async def expire_points(
+    bind: AsyncEngine, now: Optional[datetime] = None, chunk_size: int = 1000
+) -> PointExpiryReport:
+    """
+    exp_date가 지난 포인트 이벤트의 미사용 잔량을 만료 상세 내역으로 기록합니다.
+
+    사용자를 chunk_size명씩 user_id 순으로 나누어 chunk마다 commit하므로,
+    전체 이벤트 수와 관계없이 메모리와 transaction 크기가 chunk 단위로 제한됩니다.
+    한 번 처리한 이벤트는 expired_at이 기록되어 다시 실행해도 중복 차감되지 않습니다.
+    """
+    now = now or datetime.utcnow()
+    started = time.perf_counter()
+    totals = {
+        "users": 0,
+        "events_scanned": 0,
+        "events_expired": 0,
+        "points_expired": 0,
+        "details_written": 0,
+        "chunks": 0,
+    }
+
+    after = None
+    async with AsyncSession(bind=bind) as db:
+        while user_ids := await _next_user_chunk(db, now, after, chunk_size):
+            stats = await _expire_chunk(db, user_ids, now)
+            await db.commit()
+
+            after = user_ids[-1]
+            totals["users"] += len(user_ids)
+            totals["chunks"] += 1
+            for key, value in stats.items():
+                totals[key] += value
+            logger.info(
+                f"Point expiry chunk {totals['chunks']}: {totals['users']} users, "
+                f"{totals['events_expired']} events expired"
+            )
+
+    elapsed = time.perf_counter() - started
+    return PointExpiryReport(
+        **totals,
+        elapsed_ms=round(elapsed * 1000, 2),
+        events_per_second=(
+            round(totals["events_scanned"] / elapsed, 2) if elapsed else 0.0
+        ),
+    )
+
+
+async def main(chunk_size: int) -> None:
+    from src.db.database import engine
+
+    try:
+        report = await expire_points(engine, chunk_size=chunk_size)
+    finally:
+        await engine.dispose()
+    print(json.dumps(report.model_dump(), indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Expire points past exp_date")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(args.chunk_size))
@@ -0,0 +1,180 @@
+# --------------------------------------------------------------------------
+# 요청 단위 SQL 실행 통계, slow query log, N+1 감지를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import time
+import logging
+import weakref
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("src.sql.slow")
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+REPEATED_QUERY_HEADER = "X-DB-Repeated-Queries"
+
+REDACTED = "<redacted>"
+
+
+class QueryStats:
+    """
+    하나의 요청(또는 작업) 동안 실행된 SQL 문의 개수와 시간을 모읍니다.
+
+    track_shapes가 켜져 있으면 같은 모양(bind parameter를 제외한 SQL 문자열)의 문이
+    몇 번 실행되었는지도 세어 N+1 패턴을 찾을 수 있게 합니다.
+    """
+
+    __slots__ = ("label", "count", "seconds", "shapes")
+
+    def __init__(self, label: str = "", track_shapes: bool = False):
+        self.label = label
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Optional[Dict[str, int]] = {} if track_shapes else None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.seconds += elapsed
+        if self.shapes is not None:
+            self.shapes[statement] = self.shapes.get(statement, 0) + 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        if not self.shapes:
+            return []
+        return sorted(
+            (
+                (statement, count)
+                for statement, count in self.shapes.items()
+                if count > threshold
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(label: str = "", track_shapes: bool = False) -> Iterator[QueryStats]:
+    """with 블록 안에서 실행되는 SQL 문을 반환된 QueryStats에 기록합니다."""
+    stats = QueryStats(label=label, track_shapes=track_shapes)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """bind parameter의 key와 개수만 남기고 값은 모두 가립니다."""
+    if isinstance(parameters, dict):
+        return {key: REDACTED for key in parameters}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return f"<{len(parameters)} parameter sets>"
+        return [REDACTED] * len(parameters)
+    return REDACTED
+
+
+_slow_query_seconds: "weakref.WeakKeyDictionary[Any, float]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def instrument_queries(engine: AsyncEngine, slow_query_seconds: float) -> None:
+    """
+    engine에서 실행되는 SQL 문을 현재 요청의 QueryStats에 기록하고,
+    slow_query_seconds 이상 걸린 문은 값이 가려진 parameter와 함께 slow query log로 남깁니다.
+
+    같은 engine에 다시 호출하면 event는 한 번만 연결된 채로 threshold만 바뀝니다.
+    """
+    sync_engine = engine.sync_engine
+    instrumented = sync_engine in _slow_query_seconds
+    _slow_query_seconds[sync_engine] = slow_query_seconds
+    if instrumented:
+        return
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if context is not None:
+            context._query_stats_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        started = getattr(context, "_query_stats_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+        if elapsed >= _slow_query_seconds[sync_engine]:
+            source = f" in {stats.label}" if stats is not None and stats.label else ""
+            slow_query_logger.warning(
+                f"Slow query {elapsed * 1000:.1f}ms{source}: {statement} "
+                f"parameters={redact_parameters(parameters)}"
+            )
+
+
+class QueryStatsMiddleware:
+    """
+    요청마다 QueryStats를 만들어 SQL 문 개수와 시간을 요청에 귀속시키는 ASGI middleware입니다.
+
+    debug가 켜져 있으면 응답 header에 개수와 시간을 싣고, 같은 모양의 문이
+    n_plus_one_threshold번을 넘게 실행된 요청은 경고 로그를 남깁니다.
+    """
+
+    def __init__(self, app: Any, debug: bool = False, n_plus_one_threshold: int = 5):
+        self.app = app
+        self.debug = debug
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        label = f"{scope['method']} {scope['path']}"
+        if not self.debug:
+            with track_queries(label):
+                await self.app(scope, receive, send)
+            return
+
+        with track_queries(label, track_shapes=True) as stats:
+
+            async def send_with_stats(message: dict) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(QUERY_COUNT_HEADER, str(stats.count))
+                    headers.append(QUERY_TIME_HEADER, f"{stats.seconds * 1000:.3f}")
+                    repeated = stats.repeated(self.n_plus_one_threshold)
+                    if repeated:
+                        headers.append(REPEATED_QUERY_HEADER, str(len(repeated)))
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+        for statement, count in stats.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                f"Possible N+1: {label} ran the same statement {count} times: "
+                f"{statement}"
+            )
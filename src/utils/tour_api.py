@@ -0,0 +1,348 @@
+# --------------------------------------------------------------------------
+# 한국관광공사 영문 관광정보서비스(Tour API) 호출과 캐싱을 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+from __future__ import annotations
+
+import time
+import httpx
+import random
+import asyncio
+
+from collections import deque
+from logging import getLogger
+from typing import Any, Dict, List, Optional, Protocol
+
+from src.core.settings import settings
+from src.db.data.csv_converter import AreaName
+from src.utils.cache import StaleWhileRevalidateCache
+from src.utils.circuit_breaker import CircuitBreaker, CircuitState
+from src.utils.metrics import (
+    metrics,
+    TOUR_API_ERRORS,
+    TOUR_API_RETRIES,
+    TOUR_API_CIRCUIT_OPEN,
+    TOUR_API_CIRCUIT_REJECTED,
+    TOUR_API_REQUEST_DURATION,
+)
+
+
+log = getLogger(__name__)
+
+
+class TourAPIError(Exception):
+    def __init__(self, message: str, status_code: int = 502):
+        self.message = message
+        self.status_code = status_code
+
+
+class TourAPIUpstream(Protocol):
+    async def fetch(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]: ...
+
+
+class HTTPTourAPIUpstream:
+    """
+    worker당 하나의 pooled httpx.AsyncClient로 Tour API를 호출합니다.
+
+    호출마다 deadline 안에서 최대 max_retries번 재시도(full jitter backoff)하며,
+    circuit breaker가 열려 있으면 upstream을 호출하지 않고 즉시 실패합니다.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_key: str,
+        timeout: float = 3.0,
+        deadline: float = 5.0,
+        max_retries: int = 2,
+        backoff: float = 0.2,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.endpoint = endpoint
+        self.service_key = service_key
+        self.timeout = timeout
+        self.deadline = deadline
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.breaker = breaker or CircuitBreaker()
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._latencies: deque[float] = deque(maxlen=1024)
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.timeouts = 0
+
+    async def start(self) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.endpoint,
+                limits=self.limits,
+                timeout=httpx.Timeout(self.timeout),
+                transport=self.transport,
+            )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.breaker.allow_request():
+            TOUR_API_CIRCUIT_REJECTED.inc()
+            TOUR_API_ERRORS.inc(operation, "circuit_open")
+            raise TourAPIError(
+                f"Tour API circuit is open, skipped {operation}", status_code=503
+            )
+        if self._client is None:
+            await self.start()
+
+        request_params = {
+            "serviceKey": self.service_key,
+            "MobileOS": "ETC",
+            "MobileApp": "K-Buddy",
+            "_type": "JSON",
+            **params,
+        }
+        self.calls += 1
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(
+                self._fetch_with_retries(operation, request_params, started),
+                timeout=self.deadline,
+            )
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            self._record_failure(operation, started, "timeout")
+            raise TourAPIError(
+                f"Tour API deadline exceeded for {operation}", status_code=504
+            )
+        except TourAPIError:
+            self._record_failure(operation, started, "upstream")
+            raise
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except Exception as e:
+            self._record_failure(operation, started, "invalid_response")
+            raise TourAPIError(f"Invalid Tour API response for {operation}") from e
+        self.breaker.record_success()
+        self._record_latency(operation, started)
+        return result
+
+    async def _fetch_with_retries(
+        self, operation: str, params: Dict[str, Any], started: float
+    ) -> Dict[str, Any]:
+        attempt = 0
+        while True:
+            try:
+                response = await self._client.get(f"/{operation}", params=params)
+                if response.status_code < 500:
+                    break
+                error = TourAPIError(
+                    f"Failed to fetch {operation}", status_code=response.status_code
+                )
+            except httpx.HTTPError as e:
+                error = TourAPIError(f"Failed to fetch {operation}: {e!r}")
+
+            delay = random.uniform(0, self.backoff * 2**attempt)
+            if attempt >= self.max_retries or (
+                time.monotonic() - started + delay >= self.deadline
+            ):
+                raise error
+            attempt += 1
+            self.retries += 1
+            TOUR_API_RETRIES.inc()
+            await asyncio.sleep(delay)
+
+        if response.status_code != 200:
+            raise TourAPIError(
+                f"Failed to fetch {operation}", status_code=response.status_code
+            )
+        return response.json()
+
+    def _record_latency(self, operation: str, started: float) -> None:
+        elapsed = time.monotonic() - started
+        self._latencies.append(elapsed)
+        TOUR_API_REQUEST_DURATION.observe(elapsed, operation)
+
+    def _record_failure(self, operation: str, started: float, reason: str) -> None:
+        self.errors += 1
+        self.breaker.record_failure()
+        self._record_latency(operation, started)
+        TOUR_API_ERRORS.inc(operation, reason)
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "latency_p50_seconds": _percentile(latencies, 0.5),
+            "latency_p99_seconds": _percentile(latencies, 0.99),
+            "breaker": self.breaker.stats(),
+        }
+
+
+def _percentile(ordered: List[float], q: float) -> Optional[float]:
+    if not ordered:
+        return None
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class StubTourAPIUpstream:
+    """
+    외부 API 대신 고정된 응답을 돌려주는 테스트용 upstream 입니다.
+
+    areaCode1은 서울의 모든 구 이름에 코드를 부여하고,
+    areaBasedList1은 sigunguCode마다 items_per_area개의 관광지를 돌려줍니다.
+    """
+
+    def __init__(self, items_per_area: int = 5):
+        self.items_per_area = items_per_area
+        self.area_codes = {
+            area.value: str(code) for code, area in enumerate(AreaName, start=1)
+        }
+        self.calls: Dict[str, int] = {}
+
+    async def fetch(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+        if operation == "areaCode1":
+            items = [
+                {"code": code, "name": name} for name, code in self.area_codes.items()
+            ]
+        elif operation == "areaBasedList1":
+            sigungu_code = params["sigunguCode"]
+            items = [
+                {
+                    "title": f"Stub place {sigungu_code}-{i}",
+                    "addr1": f"{i} Stub-ro, Seoul",
+                    "tel": "02-000-0000",
+                    "firstimage": f"http://stub.kbuddy/{sigungu_code}/{i}.jpg",
+                }
+                for i in range(self.items_per_area)
+            ]
+        else:
+            raise TourAPIError(f"Unknown operation {operation}", status_code=404)
+        return {"response": {"body": {"items": {"item": items}}}}
+
+
+class TourAPIClient:
+    """
+    Tour API 응답을 stale-while-revalidate 방식으로 캐싱합니다.
+
+    거의 바뀌지 않는 지역 코드표는 area_code_ttl 동안, 구(sigungu)별 관광지 목록은
+    area_list_ttl 동안 fresh로 취급하며, 이후 stale_ttl 동안은 이전 값을 반환하면서
+    백그라운드에서 갱신합니다.
+    """
+
+    def __init__(
+        self,
+        upstream: TourAPIUpstream,
+        area_code_ttl: float,
+        area_list_ttl: float,
+        stale_ttl: float,
+        max_areas: int = 256,
+    ):
+        self.upstream = upstream
+        self._area_codes = StaleWhileRevalidateCache(
+            maxsize=1, fresh_ttl=area_code_ttl, stale_ttl=stale_ttl
+        )
+        self._area_lists = StaleWhileRevalidateCache(
+            maxsize=max_areas, fresh_ttl=area_list_ttl, stale_ttl=stale_ttl
+        )
+
+    async def _fetch_area_codes(self) -> Dict[str, str]:
+        area_codes = await self.upstream.fetch(
+            "areaCode1", {"numOfRows": 30, "pageNo": 1, "areaCode": 1}
+        )
+        return {
+            item["name"]: item["code"]
+            for item in area_codes["response"]["body"]["items"]["item"]
+        }
+
+    async def get_area_codes(self) -> Dict[str, str]:
+        return await self._area_codes.get_or_load("areaCode1", self._fetch_area_codes)
+
+    async def get_area_code(self, area_name: str) -> Optional[str]:
+        return (await self.get_area_codes()).get(area_name)
+
+    async def get_area_based_list(self, sigungu_code: str) -> Dict[str, Any]:
+        async def load() -> Dict[str, Any]:
+            return await self.upstream.fetch(
+                "areaBasedList1",
+                {
+                    "numOfRows": 5,
+                    "pageNo": 1,
+                    "listYN": "Y",
+                    "arrange": "A",
+                    "areaCode": 1,
+                    "sigunguCode": sigungu_code,
+                },
+            )
+
+        return await self._area_lists.get_or_load(sigungu_code, load)
+
+    async def start(self) -> None:
+        start = getattr(self.upstream, "start", None)
+        if start is not None:
+            await start()
+
+    async def close(self) -> None:
+        close = getattr(self.upstream, "close", None)
+        if close is not None:
+            await close()
+
+    def stats(self) -> Dict[str, Any]:
+        upstream_stats = getattr(self.upstream, "stats", None)
+        return {
+            "upstream": upstream_stats() if upstream_stats is not None else {},
+            "cache": {
+                "area_codes": self._area_codes.stats(),
+                "area_lists": self._area_lists.stats(),
+            },
+        }
+
+
+tour_api = TourAPIClient(
+    upstream=HTTPTourAPIUpstream(
+        endpoint=settings.TOUR_API_ENDPOINT,
+        service_key=settings.TOUR_API_KEY_DECODING,
+        timeout=settings.TOUR_API_TIMEOUT_SECONDS,
+        deadline=settings.TOUR_API_DEADLINE_SECONDS,
+        max_retries=settings.TOUR_API_MAX_RETRIES,
+        max_connections=settings.TOUR_API_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.TOUR_API_MAX_KEEPALIVE_CONNECTIONS,
+        breaker=CircuitBreaker(
+            failure_rate=settings.TOUR_API_BREAKER_FAILURE_RATE,
+            min_calls=settings.TOUR_API_BREAKER_MIN_CALLS,
+            reset_timeout=settings.TOUR_API_BREAKER_RESET_SECONDS,
+        ),
+    ),
+    area_code_ttl=settings.TOUR_API_AREA_CODE_TTL_SECONDS,
+    area_list_ttl=settings.TOUR_API_AREA_LIST_TTL_SECONDS,
+    stale_ttl=settings.TOUR_API_STALE_TTL_SECONDS,
+)
+
+
+def _collect_tour_api_metrics() -> None:
+    breaker = getattr(tour_api.upstream, "breaker", None)
+    if breaker is not None:
+        TOUR_API_CIRCUIT_OPEN.set(int(breaker.state is CircuitState.OPEN))
+
+
+metrics.add_collector("tour_api", _collect_tour_api_metrics)
+
+
+# Dependency
+def get_tour_api() -> TourAPIClient:
+    return tour_api
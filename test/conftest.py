@@ -14,14 +14,17 @@ from asgi_lifespan import LifespanManager
 
 from httpx import AsyncClient
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 
 from src.db.database import Base, get_db
 from src.core.settings import AppSettings
+from src.utils.tour_api import TourAPIClient, StubTourAPIUpstream, get_tour_api
+from src.utils.query_stats import instrument_queries
 from src import create_app
 
 
-app_settings = AppSettings(_env_file=".env.test")
+# 테스트 DB는 init_db fixture가 metadata로 매번 새로 만들므로 revision 확인은 생략합니다.
+app_settings = AppSettings(_env_file=".env.test", DATABASE_MIGRATION_CHECK=False)
 
 
 test_engine = create_async_engine(
@@ -52,12 +55,45 @@ def event_loop() -> Iterator[AbstractEventLoop]:
     loop.close()
 
 
+@pytest.fixture
+def db_engine() -> AsyncEngine:
+    return test_engine
+
+
+@pytest.fixture
+def tour_api() -> TourAPIClient:
+    return TourAPIClient(
+        upstream=StubTourAPIUpstream(),
+        area_code_ttl=app_settings.TOUR_API_AREA_CODE_TTL_SECONDS,
+        area_list_ttl=app_settings.TOUR_API_AREA_LIST_TTL_SECONDS,
+        stale_ttl=app_settings.TOUR_API_STALE_TTL_SECONDS,
+    )
+
+
 @pytest_asyncio.fixture
-async def app_client() -> AsyncIterator[AsyncClient]:
+async def app_client(tour_api: TourAPIClient) -> AsyncIterator[AsyncClient]:
     app = create_app(app_settings)
     app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_tour_api] = lambda: tour_api
 
     async with AsyncClient(
         app=app, base_url="http://test"
     ) as app_client, LifespanManager(app):
         yield app_client
+
+
+@pytest_asyncio.fixture
+async def debug_client(tour_api: TourAPIClient) -> AsyncIterator[AsyncClient]:
+    """응답 header(X-DB-Query-Count 등)에 요청이 실행한 SQL 통계를 싣는 client입니다."""
+    debug_settings = app_settings.model_copy(
+        update={"DEBUG_SQL_QUERY_STATS": True, "DEBUG_N_PLUS_ONE_THRESHOLD": 0}
+    )
+    instrument_queries(test_engine, app_settings.SLOW_QUERY_THRESHOLD_MS / 1000)
+    app = create_app(debug_settings)
+    app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_tour_api] = lambda: tour_api
+
+    async with AsyncClient(
+        app=app, base_url="http://test"
+    ) as debug_client, LifespanManager(app):
+        yield debug_client
@@ -3,9 +3,18 @@
 #
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
+import pytest
 import pytest_asyncio
 
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.crud.area import area_content_hash
+from src.db.models import Area
+from src.helper.exceptions import ErrorCode, InternalException
+from src.utils.query_stats import QUERY_COUNT_HEADER
+from src.utils.tour_api import TourAPIClient
 
 
 class TestAreaAPI:
@@ -85,6 +94,54 @@ class TestAreaAPI:
         assert data["name"] == update_data["name"]
         assert data["address"] == update_data["address"]
 
+    async def test_duplicate_area_name_conflicts(self, app_client: AsyncClient):
+        # given
+        response = await app_client.post(
+            "kbuddy/api/v1/area/add", json={**self.area_data, "name": "Other Area"}
+        )
+        other_id = response.json()["id"]
+
+        # when
+        with pytest.raises(InternalException) as created:
+            await app_client.post("kbuddy/api/v1/area/add", json=self.area_data)
+        with pytest.raises(InternalException) as renamed:
+            await app_client.put(
+                f"kbuddy/api/v1/area/{other_id}",
+                json={"name": self.area_data["name"], "address": "456 Other St"},
+            )
+
+        # then
+        assert created.value.error_code is ErrorCode.CONFLICT
+        assert renamed.value.error_code is ErrorCode.CONFLICT
+        response = await app_client.get(f"kbuddy/api/v1/area/{other_id}")
+        assert response.json()["name"] == "Other Area"
+
+    async def test_area_writes_keep_content_hash(
+        self, app_client: AsyncClient, db_engine: AsyncEngine
+    ):
+        # given
+        async def stored_hash() -> str:
+            async with db_engine.connect() as conn:
+                result = await conn.execute(
+                    select(Area.content_hash).where(Area.id == self.area_id)
+                )
+                return result.scalar_one()
+
+        created_hash = await stored_hash()
+
+        # when: website 등 보내지 않은 field는 기존 값을 유지합니다.
+        response = await app_client.put(
+            f"kbuddy/api/v1/area/{self.area_id}",
+            json={"name": "Renamed Area", "address": "789 Renamed St"},
+        )
+
+        # then
+        assert response.status_code == 200
+        assert created_hash == area_content_hash(self.area_data)
+        assert await stored_hash() == area_content_hash(
+            {**self.area_data, "name": "Renamed Area", "address": "789 Renamed St"}
+        )
+
     async def test_delete_area(self, app_client: AsyncClient):
         # given
 
@@ -137,6 +194,41 @@ class TestAreaAPI:
         assert data[0]["area_img"] == "http://test.com/image0.jpg"
         assert data[0]["area_id"] == 1
 
+    async def test_get_all_areas_batch_loads_images(
+        self, app_client: AsyncClient, debug_client: AsyncClient
+    ):
+        # given
+        area_ids = [self.area_id]
+        for i in range(2):
+            area_data = dict(self.area_data, name=f"Image Area {i}")
+            response = await app_client.post("kbuddy/api/v1/area/add", json=area_data)
+            area_ids.append(response.json()["id"])
+        for area_id in area_ids:
+            for i in range(3):
+                image_data = {
+                    "area_img": f"http://test.com/{area_id}/{i}.jpg",
+                    "created_at": "2023-01-01T00:00:00",
+                }
+                await app_client.post(
+                    f"kbuddy/api/v1/area/{area_id}/images", json=image_data
+                )
+
+        # when
+        response = await debug_client.get("kbuddy/api/v1/area/list")
+        limited_response = await debug_client.get(
+            "kbuddy/api/v1/area/list", params={"images_limit": 2}
+        )
+
+        # then
+        assert response.headers[QUERY_COUNT_HEADER] == "2"
+        assert [len(area["images"]) for area in response.json()] == [3, 3, 3]
+
+        assert limited_response.headers[QUERY_COUNT_HEADER] == "2"
+        for area in limited_response.json():
+            assert [image["area_img"] for image in area["images"]] == [
+                f"http://test.com/{area['id']}/{i}.jpg" for i in range(2)
+            ]
+
     async def test_get_area_image(self, app_client: AsyncClient):
         # given
         image_data = {
@@ -200,3 +292,18 @@ class TestAreaAPI:
 
         # then
         assert response.status_code == 204
+
+    async def test_curate_areas(self, app_client: AsyncClient, tour_api: TourAPIClient):
+        # given
+
+        # when
+        first_response = await app_client.get("kbuddy/api/v1/area/curate")
+        second_response = await app_client.get("kbuddy/api/v1/area/curate")
+
+        # then
+        assert first_response.status_code == 200
+        assert second_response.status_code == 200
+        assert len(first_response.json()) == 5
+        assert first_response.json()[0]["name"].startswith("Stub place")
+        assert tour_api.upstream.calls["areaCode1"] == 1
+        assert tour_api.upstream.calls["areaBasedList1"] <= 2
@@ -0,0 +1,122 @@
+# --------------------------------------------------------------------------
+# 지역별 방문자 수 순위(AreaRanking) 갱신의 testcase를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+import os
+import asyncio
+import logging
+
+from pathlib import Path
+from typing import Callable, List
+
+from src.db.data import csv_converter
+from src.db.data.csv_converter import AreaRanking
+
+HEADER = "기초지자체명,기초지자체 방문자 수,기초지자체 방문자 비율\n"
+
+
+def write_visitor_stats(path: Path, rows: List[tuple], mtime_ns: int) -> None:
+    lines = "".join(f"{name},{count},1.0\n" for name, count in rows)
+    path.write_bytes((HEADER + lines).encode("euc-kr"))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def reload_failures(caplog) -> int:
+    return sum(
+        "Failed to reload visitor ranking" in record.message
+        for record in caplog.records
+    )
+
+
+async def wait_until(condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() >= deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+class TestAreaRanking:
+    def count_parses(self, monkeypatch) -> List[bytes]:
+        parsed = []
+        rank_areas = csv_converter.rank_areas
+
+        def counting_rank_areas(content: bytes, size: int = 5):
+            parsed.append(content)
+            return rank_areas(content, size)
+
+        monkeypatch.setattr(csv_converter, "rank_areas", counting_rank_areas)
+        return parsed
+
+    def test_touched_file_with_same_content_is_not_reparsed(
+        self, tmp_path, monkeypatch
+    ):
+        # given
+        parsed = self.count_parses(monkeypatch)
+        path = tmp_path / "visitors.csv"
+        rows = [("강남구", 300), ("강동구", 200), ("강북구", 100)]
+        write_visitor_stats(path, rows, mtime_ns=1_000_000_000)
+        ranking = AreaRanking(str(path), size=2)
+        assert ranking.reload_if_changed() is True
+
+        # when: mtime만 바뀌고 내용은 같음
+        write_visitor_stats(path, rows, mtime_ns=2_000_000_000)
+        touched = ranking.reload_if_changed()
+        unchanged = ranking.reload_if_changed()
+
+        # then
+        assert touched is False
+        assert unchanged is False
+        assert len(parsed) == 1
+        assert ranking.top == ("Gangnam-gu", "Gangdong-gu")
+
+    def test_changed_content_is_reloaded(self, tmp_path, monkeypatch):
+        # given
+        parsed = self.count_parses(monkeypatch)
+        path = tmp_path / "visitors.csv"
+        write_visitor_stats(
+            path, [("강남구", 300), ("강동구", 200)], mtime_ns=1_000_000_000
+        )
+        ranking = AreaRanking(str(path), size=2)
+        ranking.reload_if_changed()
+
+        # when
+        write_visitor_stats(
+            path, [("강남구", 300), ("강서구", 900)], mtime_ns=2_000_000_000
+        )
+        reloaded = ranking.reload_if_changed()
+
+        # then
+        assert reloaded is True
+        assert len(parsed) == 2
+        assert ranking.top == ("Gangseo-gu", "Gangnam-gu")
+        assert ranking.choice() in ranking.top
+
+    async def test_watch_survives_missing_file(self, tmp_path, caplog):
+        # given: 순위를 읽은 뒤 파일이 사라짐
+        path = tmp_path / "visitors.csv"
+        write_visitor_stats(
+            path, [("강남구", 300), ("강동구", 200)], mtime_ns=1_000_000_000
+        )
+        ranking = AreaRanking(str(path), size=2)
+        ranking.reload_if_changed()
+        path.unlink()
+
+        # when
+        with caplog.at_level(logging.ERROR, logger=csv_converter.logger.name):
+            watcher = asyncio.create_task(ranking.watch(0.01))
+            failed = await wait_until(lambda: reload_failures(caplog) >= 2)
+            still_running = not watcher.done()
+            write_visitor_stats(
+                path, [("강북구", 500), ("강동구", 200)], mtime_ns=2_000_000_000
+            )
+            reloaded = await wait_until(lambda: ranking.top[0] == "Gangbuk-gu")
+            watcher.cancel()
+
+        # then: 실패해도 watcher는 계속 돌고, 파일이 돌아오면 다시 읽음
+        assert failed
+        assert still_running
+        assert reloaded
+        assert ranking.top == ("Gangbuk-gu", "Gangdong-gu")
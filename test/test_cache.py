@@ -0,0 +1,161 @@
+# --------------------------------------------------------------------------
+# 프로세스 내 캐시(StaleWhileRevalidateCache)의 testcase를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+import asyncio
+
+import pytest
+
+from typing import Any, Awaitable, Callable, List, Optional
+
+from src.utils import cache as cache_module
+from src.utils.cache import StaleWhileRevalidateCache
+
+KEY = "area-codes"
+
+
+class FakeClock:
+    """cache 모듈의 time 대신 사용하는, 직접 시간을 옮기는 시계입니다."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+def counting_loader(
+    values: List[Any], calls: List[int], gate: Optional[asyncio.Event] = None
+) -> Callable[[], Awaitable[Any]]:
+    async def loader() -> Any:
+        calls.append(1)
+        if gate is not None:
+            await gate.wait()
+        value = values[len(calls) - 1]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    return loader
+
+
+async def drain(cache: StaleWhileRevalidateCache) -> None:
+    while cache._refreshing:
+        await asyncio.gather(*cache._refreshing.values())
+
+
+class TestStaleWhileRevalidateCache:
+    async def test_fresh_hit_does_not_call_loader(self, clock: FakeClock):
+        # given
+        calls: List[int] = []
+        cache = StaleWhileRevalidateCache(maxsize=10, fresh_ttl=60, stale_ttl=300)
+        loader = counting_loader(["v1"], calls)
+        await cache.get_or_load(KEY, loader)
+
+        # when: fresh_ttl이 지나기 직전
+        clock.advance(59)
+        value = await cache.get_or_load(KEY, loader)
+
+        # then
+        assert value == "v1"
+        assert len(calls) == 1
+        assert cache.stats() == {
+            "size": 1,
+            "hits": 1,
+            "stale_hits": 0,
+            "misses": 1,
+            "refreshing": 0,
+        }
+
+    async def test_stale_value_is_served_while_refreshing_once(self, clock: FakeClock):
+        # given: 값이 stale 상태가 되고, 갱신 loader는 gate가 열릴 때까지 대기
+        calls: List[int] = []
+        gate = asyncio.Event()
+        cache = StaleWhileRevalidateCache(maxsize=10, fresh_ttl=60, stale_ttl=300)
+        cache.set(KEY, "v1")
+        clock.advance(61)
+        loader = counting_loader(["v2"], calls, gate)
+
+        # when: 갱신이 끝나기 전에 여러 번 조회
+        served = [await cache.get_or_load(KEY, loader) for _ in range(3)]
+        await asyncio.sleep(0)
+        refreshing = cache.stats()["refreshing"]
+        gate.set()
+        await drain(cache)
+
+        # then: 오래된 값을 즉시 반환하고 갱신은 한 번만 실행
+        assert served == ["v1", "v1", "v1"]
+        assert refreshing == 1
+        assert len(calls) == 1
+        assert cache.stale_hits == 3
+        assert await cache.get_or_load(KEY, loader) == "v2"
+        assert cache.hits == 1
+
+    async def test_concurrent_misses_share_one_loader_call(self, clock: FakeClock):
+        # given
+        calls: List[int] = []
+        gate = asyncio.Event()
+        cache = StaleWhileRevalidateCache(maxsize=10, fresh_ttl=60, stale_ttl=300)
+        loader = counting_loader(["v1"], calls, gate)
+
+        # when
+        waiters = [
+            asyncio.create_task(cache.get_or_load(KEY, loader)) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        values = await asyncio.gather(*waiters)
+
+        # then
+        assert values == ["v1"] * 5
+        assert len(calls) == 1
+        assert cache.misses == 5
+        assert len(cache) == 1
+
+    async def test_failed_refresh_keeps_stale_value(self, clock: FakeClock):
+        # given
+        calls: List[int] = []
+        cache = StaleWhileRevalidateCache(maxsize=10, fresh_ttl=60, stale_ttl=300)
+        cache.set(KEY, "v1")
+        clock.advance(61)
+        loader = counting_loader([RuntimeError("upstream down"), "v2"], calls)
+
+        # when: 백그라운드 갱신이 실패
+        served = await cache.get_or_load(KEY, loader)
+        await drain(cache)
+        after_failure = await cache.get_or_load(KEY, loader)
+        await drain(cache)
+
+        # then: 실패해도 오래된 값을 계속 반환하고, 다음 조회가 다시 갱신
+        assert served == "v1"
+        assert after_failure == "v1"
+        assert len(calls) == 2
+        assert await cache.get_or_load(KEY, loader) == "v2"
+
+    async def test_miss_after_stale_ttl_awaits_loader(self, clock: FakeClock):
+        # given
+        calls: List[int] = []
+        cache = StaleWhileRevalidateCache(maxsize=10, fresh_ttl=60, stale_ttl=300)
+        cache.set(KEY, "v1")
+
+        # when: stale 기간까지 지남
+        clock.advance(60 + 300)
+        value = await cache.get_or_load(KEY, counting_loader(["v2"], calls))
+
+        # then: 오래된 값 대신 loader의 결과를 기다려 반환
+        assert value == "v2"
+        assert len(calls) == 1
+        assert cache.stale_hits == 0
+        assert cache.misses == 1
+        assert cache.stats()["refreshing"] == 0
@@ -0,0 +1,86 @@
+# --------------------------------------------------------------------------
+# 주요 조회 query가 인덱스를 사용하는지 확인하는 testcase를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+import uuid
+
+from datetime import datetime
+
+import pytest
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.db.models import (
+    AreaImage,
+    ItineraryRequest,
+    Order,
+    PlaceContainer,
+    PointDetail,
+    PointEvent,
+    TransportContainer,
+    User,
+)
+
+
+USER_ID = uuid.uuid4()
+
+HOT_QUERIES = {
+    "ix_Point_Event_user_id_created_id": select(PointEvent)
+    .where(PointEvent.user_id == USER_ID)
+    .order_by(PointEvent.created, PointEvent.id)
+    .limit(101),
+    "ix_Point_Detail_event_id": select(PointDetail).where(
+        PointDetail.event_id.in_([1, 2, 3])
+    ),
+    "ix_Itinerary_Request_request_user_id_active": select(ItineraryRequest)
+    .where(ItineraryRequest.is_deleted == False)
+    .where(ItineraryRequest.request_user_id == USER_ID)
+    .order_by(ItineraryRequest.created, ItineraryRequest.id),
+    "ix_Orders_buyer_id": select(Order).where(Order.buyer_id == USER_ID),
+    "ix_Orders_listing_id": select(Order).where(Order.listing_id == USER_ID),
+    "ix_Area_Image_area_id_created_id": select(AreaImage)
+    .where(AreaImage.area_id == 1)
+    .order_by(AreaImage.created, AreaImage.id),
+    "ix_Place_Container_itinerary_id": select(PlaceContainer).where(
+        PlaceContainer.itinerary_id == USER_ID
+    ),
+    "ix_Transport_Container_itinerary_id": select(TransportContainer).where(
+        TransportContainer.itinerary_id == USER_ID
+    ),
+    "ix_Point_Event_pending_expiry": select(PointEvent.user_id)
+    .where(
+        PointEvent.expired_at.is_(None),
+        PointEvent.exp_date.is_not(None),
+        PointEvent.exp_date <= datetime(2024, 1, 1),
+        PointEvent.user_id > USER_ID,
+    )
+    .distinct()
+    .order_by(PointEvent.user_id)
+    .limit(1000),
+    "ix_Users_nickname": select(User).where(
+        (User.email == "testuser") | (User.nickname == "testuser")
+    ),
+}
+
+
+class TestIndexes:
+    @pytest.mark.parametrize("index_name", HOT_QUERIES)
+    async def test_hot_query_uses_index(self, db_engine: AsyncEngine, index_name):
+        # given
+        query = HOT_QUERIES[index_name].compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+
+        # when
+        async with db_engine.begin() as conn:
+            # 빈 테이블에서도 sequential scan 대신 사용 가능한 인덱스를 고르도록 합니다.
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+            plan = await conn.execute(text(f"EXPLAIN {query}"))
+            plan = "\n".join(row[0] for row in plan)
+
+        # then
+        assert "Index" in plan
+        assert index_name in plan
@@ -8,6 +8,10 @@ import pytest_asyncio
 
 from datetime import datetime, timedelta, date
 from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.utils.query_stats import QUERY_COUNT_HEADER
 
 
 class TestItineraryAPI:
@@ -151,3 +155,63 @@ class TestItineraryAPI:
 
         # then
         assert response.status_code == 204
+
+    async def test_itineraries_load_in_constant_queries(
+        self, app_client: AsyncClient, debug_client: AsyncClient, db_engine: AsyncEngine
+    ):
+        # given
+        itinerary_ids = []
+        for _ in range(3):
+            response = await app_client.post(
+                "kbuddy/api/v1/itinerary/",
+                json={"request_id": self.itinerary_request_id},
+            )
+            assert response.status_code == 200
+            itinerary_ids.append(response.json()["id"])
+
+        async with db_engine.begin() as conn:
+            for itinerary_id in itinerary_ids:
+                params = {
+                    "itinerary_id": itinerary_id,
+                    "request_id": self.itinerary_request_id,
+                    "container_date": date(2024, 1, 2),
+                }
+                for i in range(2):
+                    await conn.execute(
+                        text(
+                            'INSERT INTO "Place_Container" (itinerary_id, request_id,'
+                            " name, description, container_date) VALUES"
+                            f" (:itinerary_id, :request_id, 'Place {i}', 'desc',"
+                            " :container_date)"
+                        ),
+                        params,
+                    )
+                    await conn.execute(
+                        text(
+                            'INSERT INTO "Transport_Container" (itinerary_id,'
+                            " request_id, type, description, duration, container_date)"
+                            " VALUES (:itinerary_id, :request_id, 'WALK', 'desc', 10,"
+                            " :container_date)"
+                        ),
+                        params,
+                    )
+
+        await debug_client.post("kbuddy/api/v1/user/login", json=self.login_data)
+
+        # when
+        response = await debug_client.get(f"kbuddy/api/v1/itinerary/{itinerary_ids[0]}")
+        list_response = await debug_client.get("kbuddy/api/v1/itinerary/")
+
+        # then
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["place_containers"]) == 2
+        assert len(data["transport_containers"]) == 2
+        assert response.headers[QUERY_COUNT_HEADER] == "3"
+
+        assert list_response.status_code == 200
+        data = list_response.json()
+        assert len(data) == 3
+        assert all(len(item["place_containers"]) == 2 for item in data)
+        # 로그인 직후라 인증 유저 조회 1번 + 일정/장소/이동 3번
+        assert list_response.headers[QUERY_COUNT_HEADER] == "4"
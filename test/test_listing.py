@@ -4,10 +4,19 @@
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
 import random
+import pytest
 import pytest_asyncio
 
 from datetime import datetime, timedelta
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.crud.listing import create_listing, get_all_listings, update_listing
+from src.helper.exceptions import ErrorCode, InternalException
+from src.schemas.requests import ListingCreate, ListingUpdate
+from src.utils.query_stats import instrument_queries, track_queries
+
+from .conftest import app_settings
 
 
 class TestListingAPI:
@@ -92,6 +101,77 @@ class TestListingAPI:
         assert len(response.json()) > 1
         assert data[1]["detail"] == "New listing 0"
 
+    async def test_get_all_listings_with_cursor(self, app_client: AsyncClient):
+        # given
+        for i in range(4):
+            listing_data = dict(self.listing_data, detail=f"New listing {i}")
+            await app_client.post("kbuddy/api/v1/listing/", json=listing_data)
+
+        # when
+        details = []
+        cursor = None
+        for _ in range(3):
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await app_client.get("kbuddy/api/v1/listing/", params=params)
+            assert response.status_code == 200
+            details += [listing["detail"] for listing in response.json()]
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        # then
+        assert cursor is None
+        assert details == ["Test listing"] + [f"New listing {i}" for i in range(4)]
+
+    async def test_get_all_listings_skips_identity_map(
+        self, app_client: AsyncClient, db_engine: AsyncEngine
+    ):
+        # given
+        for i in range(3):
+            listing_data = dict(self.listing_data, detail=f"New listing {i}")
+            await app_client.post("kbuddy/api/v1/listing/", json=listing_data)
+
+        # when
+        async with AsyncSession(bind=db_engine) as db:
+            page = await get_all_listings(db, limit=2)
+            identity_map_size = len(db.identity_map)
+
+        # then
+        assert identity_map_size == 0
+        assert [listing.detail for listing in page.items] == [
+            "Test listing",
+            "New listing 0",
+        ]
+        assert page.next_cursor is not None
+
+    async def test_create_and_update_listing_in_one_statement_each(
+        self, db_engine: AsyncEngine
+    ):
+        # given
+        instrument_queries(
+            db_engine, slow_query_seconds=app_settings.SLOW_QUERY_THRESHOLD_MS / 1000
+        )
+        listing = ListingCreate(**dict(self.listing_data, detail="Returning listing"))
+
+        # when
+        async with AsyncSession(bind=db_engine) as db:
+            with track_queries() as create_stats:
+                created = await create_listing(db, listing)
+            with track_queries() as update_stats:
+                updated = await update_listing(
+                    db, str(created.id), ListingUpdate.model_construct(amount=999)
+                )
+
+        # then
+        assert create_stats.count == 1
+        assert update_stats.count == 1
+        assert created.detail == "Returning listing"
+        assert updated.id == created.id
+        assert updated.amount == 999
+        assert updated.detail == "Returning listing"
+
     async def test_get_listing(self, app_client: AsyncClient):
         # given
 
@@ -135,3 +215,69 @@ class TestListingAPI:
 
         # then
         assert response.status_code == 204
+
+    async def test_bulk_create_update_delete_listings(self, app_client: AsyncClient):
+        # given
+        listings = [
+            dict(self.listing_data, detail=f"Bulk listing {i}") for i in range(3)
+        ]
+
+        # when
+        response = await app_client.post("kbuddy/api/v1/listing/bulk", json=listings)
+
+        # then
+        assert response.status_code == 200
+        created = response.json()
+        assert [item["index"] for item in created] == [0, 1, 2]
+        assert {item["status"] for item in created} == {"created"}
+        assert [item["item"]["detail"] for item in created] == [
+            listing["detail"] for listing in listings
+        ]
+        ids = [item["id"] for item in created]
+
+        # when
+        missing_id = "00000000-0000-0000-0000-000000000000"
+        updates = [
+            dict(listings[0], id=ids[0], amount=500),
+            dict(listings[1], id=missing_id, amount=600),
+        ]
+        response = await app_client.put("kbuddy/api/v1/listing/bulk", json=updates)
+
+        # then
+        assert response.status_code == 200
+        updated = response.json()
+        assert [item["status"] for item in updated] == ["updated", "not_found"]
+        assert updated[0]["item"]["amount"] == 500
+        assert updated[1]["id"] == missing_id
+        assert updated[1]["item"] is None
+
+        # when
+        response = await app_client.post(
+            "kbuddy/api/v1/listing/bulk/delete", json=[ids[1], missing_id, ids[2]]
+        )
+
+        # then
+        assert response.status_code == 200
+        assert [item["status"] for item in response.json()] == [
+            "deleted",
+            "not_found",
+            "deleted",
+        ]
+        response = await app_client.get(f"kbuddy/api/v1/listing/{ids[0]}")
+        assert response.json()["amount"] == 500
+
+    async def test_update_and_delete_missing_listing(self, app_client: AsyncClient):
+        # given
+        missing_id = "00000000-0000-0000-0000-000000000000"
+        update_data = dict(self.listing_data)
+        del update_data["seller_id"], update_data["created_at"]
+
+        # when / then
+        with pytest.raises(InternalException) as update_error:
+            await app_client.put(
+                f"kbuddy/api/v1/listing/{missing_id}", json=update_data
+            )
+        with pytest.raises(InternalException) as delete_error:
+            await app_client.delete(f"kbuddy/api/v1/listing/{missing_id}")
+        assert update_error.value.error_code == ErrorCode.NOT_FOUND
+        assert delete_error.value.error_code == ErrorCode.NOT_FOUND
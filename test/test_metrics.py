@@ -0,0 +1,135 @@
+# --------------------------------------------------------------------------
+# /metrics endpoint의 testcase를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+import json
+import pytest_asyncio
+
+from typing import AsyncIterator
+
+from asgi_lifespan import LifespanManager
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src import create_app
+from src.db.database import get_db
+from src.utils.tour_api import get_tour_api
+from src.utils.metrics import (
+    HTTP_REQUESTS,
+    HTTP_REQUEST_DURATION,
+    DB_QUERY_DURATION,
+    MetricsRegistry,
+    instrument_engine,
+)
+
+from .conftest import app_settings, get_test_db
+
+LISTING_ROUTE = "/kbuddy/api/v1/listing/"
+METRICS_TOKEN = "test-metrics-token"
+
+
+class TestMetricsAPI:
+    @pytest_asyncio.fixture
+    async def metrics_client(self, tour_api) -> AsyncIterator[AsyncClient]:
+        app = create_app(
+            app_settings.model_copy(update={"METRICS_ACCESS_TOKEN": METRICS_TOKEN})
+        )
+        app.dependency_overrides[get_db] = get_test_db
+        app.dependency_overrides[get_tour_api] = lambda: tour_api
+
+        async with AsyncClient(
+            app=app, base_url="http://test"
+        ) as client, LifespanManager(app):
+            yield client
+
+    async def test_metrics_exposes_route_and_db_metrics(
+        self, metrics_client: AsyncClient, db_engine: AsyncEngine
+    ):
+        # given
+        instrument_engine(db_engine, name="test")
+        requests_before = HTTP_REQUESTS.get("GET", LISTING_ROUTE, "200")
+        latency_before = HTTP_REQUEST_DURATION.count("GET", LISTING_ROUTE)
+        queries_before = DB_QUERY_DURATION.count("test", "SELECT")
+
+        # when
+        for _ in range(3):
+            response = await metrics_client.get("kbuddy/api/v1/listing/")
+            assert response.status_code == 200
+        response = await metrics_client.get(
+            "metrics", headers={"Authorization": f"Bearer {METRICS_TOKEN}"}
+        )
+
+        # then
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert HTTP_REQUESTS.get("GET", LISTING_ROUTE, "200") == requests_before + 3
+        assert HTTP_REQUEST_DURATION.count("GET", LISTING_ROUTE) == latency_before + 3
+        assert DB_QUERY_DURATION.count("test", "SELECT") >= queries_before + 3
+
+        body = response.text
+        assert "# TYPE kbuddy_http_request_duration_seconds histogram" in body
+        assert (
+            'kbuddy_http_requests_total{method="GET",'
+            f'route="{LISTING_ROUTE}",status="200"}}' in body
+        )
+        assert (
+            'kbuddy_http_request_duration_seconds_bucket{method="GET",'
+            f'route="{LISTING_ROUTE}",le="+Inf"}}' in body
+        )
+        assert 'kbuddy_db_query_duration_seconds_count{pool="test",' in body
+        assert "kbuddy_password_hasher_queue_depth " in body
+        assert "kbuddy_tour_api_circuit_open " in body
+        assert "# TYPE kbuddy_tour_api_retries_total counter" in body
+        assert "# TYPE kbuddy_tour_api_circuit_rejected_total counter" in body
+
+    async def test_metrics_requires_access_token(
+        self, app_client: AsyncClient, metrics_client: AsyncClient
+    ):
+        # when
+        unconfigured = await app_client.get("metrics")
+        missing = await metrics_client.get("metrics")
+        wrong = await metrics_client.get(
+            "metrics", headers={"Authorization": "Bearer wrong-token"}
+        )
+
+        # then
+        assert unconfigured.status_code == 404
+        assert missing.status_code == 401
+        assert wrong.status_code == 401
+        assert wrong.headers["www-authenticate"] == "Bearer"
+
+    async def test_multiprocess_snapshots_are_merged(self, tmp_path):
+        # given: 같은 디렉터리를 쓰는 다른 worker가 이미 종료된 상태
+        registry = MetricsRegistry()
+        requests = registry.counter("t_requests_total", "Requests.", ("route",))
+        in_progress = registry.gauge("t_in_progress", "In progress.")
+        latency = registry.histogram(
+            "t_latency_seconds", "Latency.", buckets=(0.1, 1.0)
+        )
+        registry.enable_multiprocess(str(tmp_path))
+        (tmp_path / "1.json").write_text(
+            json.dumps(
+                {
+                    "live": False,
+                    "metrics": {
+                        "t_requests_total": [[["/a"], 5.0]],
+                        "t_in_progress": [[[], 4.0]],
+                        "t_latency_seconds": [[[], [1, 0, 0, 0.05]]],
+                    },
+                }
+            )
+        )
+
+        # when
+        requests.inc("/a", amount=2)
+        in_progress.set(1)
+        latency.observe(0.5)
+        body = registry.render()
+
+        # then
+        assert 't_requests_total{route="/a"} 7.0' in body
+        assert "t_in_progress 1.0" in body
+        assert 't_latency_seconds_bucket{le="0.1"} 1' in body
+        assert "t_latency_seconds_count 2" in body
+        assert len(list(tmp_path.glob("*.json"))) == 2
@@ -0,0 +1,103 @@
+# --------------------------------------------------------------------------
+# DB schema migration의 testcase를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+import pytest
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.db._base import Base
+from src.db.migration import (
+    SchemaRevisionError,
+    check_schema_revision,
+    get_alembic_config,
+    get_head_revision,
+)
+
+
+def upgrade_to(connection, revision: str = "head"):
+    config = get_alembic_config()
+    config.attributes["connection"] = connection
+    command.upgrade(config, revision)
+
+
+def upgrade_to_head(connection):
+    upgrade_to(connection, "head")
+
+
+def compare_with_models(sync_conn):
+    return compare_metadata(MigrationContext.configure(sync_conn), Base.metadata)
+
+
+async def drop_schema(db_engine: AsyncEngine):
+    async with db_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.execute(text("DROP TYPE IF EXISTS transportenum"))
+        await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+
+
+class TestMigration:
+    async def test_upgrade_matches_models(self, db_engine: AsyncEngine):
+        # given
+        await drop_schema(db_engine)
+
+        async with db_engine.connect() as conn:
+            with pytest.raises(SchemaRevisionError):
+                await check_schema_revision(conn)
+
+        # when
+        async with db_engine.begin() as conn:
+            await conn.run_sync(upgrade_to_head)
+
+        # then
+        async with db_engine.connect() as conn:
+            assert await check_schema_revision(conn) == get_head_revision()
+            diff = await conn.run_sync(compare_with_models)
+        assert diff == []
+
+        async with db_engine.begin() as conn:
+            await conn.execute(text("DROP TABLE alembic_version"))
+
+    async def test_upgrade_from_create_all_database(self, db_engine: AsyncEngine):
+        # given: migration 도입 이전 create_all schema에 같은 이름의 Area가 두 개 있는 DB
+        await drop_schema(db_engine)
+        async with db_engine.begin() as conn:
+            await conn.run_sync(upgrade_to, "0001")
+            await conn.execute(
+                text(
+                    'INSERT INTO "Area" (id, name, address) VALUES '
+                    "(1, '경복궁', '서울'), (2, '경복궁', '서울 종로구'), (3, '남산', '서울')"
+                )
+            )
+            await conn.execute(
+                text(
+                    'INSERT INTO "Area_Image" (area_id, area_img, created_at) '
+                    "VALUES (2, 'https://example.com/a.png', now())"
+                )
+            )
+
+        # when
+        async with db_engine.begin() as conn:
+            await conn.run_sync(upgrade_to_head)
+
+        # then
+        async with db_engine.connect() as conn:
+            assert await check_schema_revision(conn) == get_head_revision()
+            areas = (
+                await conn.execute(text('SELECT id FROM "Area" ORDER BY id'))
+            ).all()
+            image_area_ids = (
+                await conn.execute(text('SELECT area_id FROM "Area_Image"'))
+            ).all()
+            diff = await conn.run_sync(compare_with_models)
+        assert [row.id for row in areas] == [1, 3]
+        assert [row.area_id for row in image_area_ids] == [1]
+        assert diff == []
+
+        async with db_engine.begin() as conn:
+            await conn.execute(text("DROP TABLE alembic_version"))
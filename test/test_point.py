@@ -7,6 +7,16 @@ import pytest_asyncio
 
 from datetime import datetime, timedelta
 from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.crud.point import delete_point_event, update_point_event
+from src.schemas.requests import PointEventUpdate
+from src.utils.point_balance import repair_point_balances
+from src.utils.point_expiry import expire_points
+from src.utils.query_stats import instrument_queries, track_queries
+
+from .conftest import app_settings
 
 
 class TestPointAPI:
@@ -248,3 +258,174 @@ class TestPointAPI:
         data = response.json()
         assert data["user_id"] == self.user_id
         assert "balance" in data
+
+    async def test_user_point_balance_follows_writes(
+        self, app_client: AsyncClient, db_engine: AsyncEngine
+    ):
+        # given
+        event_data = dict(self.event_data, amount=300)
+        response = await app_client.post("kbuddy/api/v1/point/events", json=event_data)
+        event_id = response.json()["id"]
+
+        detail_data = {
+            "event_id": event_id,
+            "related_event_id": event_id,
+            "point_date": datetime.utcnow().isoformat(),
+            "point": 50,
+        }
+        response = await app_client.post(
+            "kbuddy/api/v1/point/details", json=detail_data
+        )
+        detail_id = response.json()["id"]
+
+        # when
+        await app_client.put(
+            f"kbuddy/api/v1/point/events/{self.event_id}",
+            json=dict(self.event_data, amount=150),
+        )
+        await app_client.put(
+            f"kbuddy/api/v1/point/details/{detail_id}",
+            json=dict(detail_data, point=80),
+        )
+        response = await app_client.get(
+            f"kbuddy/api/v1/point/user/{self.user_id}/balance"
+        )
+
+        # then
+        assert response.json()["balance"] == 150 + 300 - 80
+
+        async with db_engine.begin() as conn:
+            await conn.execute(text('UPDATE "Point_Balance" SET balance = 0'))
+        response = await app_client.get(
+            f"kbuddy/api/v1/point/user/{self.user_id}/balance",
+            params={"verify": True},
+        )
+        assert response.json() == {
+            "user_id": self.user_id,
+            "balance": 0,
+            "verified_balance": 150 + 300 - 80,
+            "consistent": False,
+        }
+        # 검증 조회는 ledger를 고치지 않고, 보정은 배치 작업이 합니다.
+        response = await app_client.get(
+            f"kbuddy/api/v1/point/user/{self.user_id}/balance"
+        )
+        assert response.json()["balance"] == 0
+        report = await repair_point_balances(db_engine)
+        assert (report.users, report.repaired) == (1, 1)
+        assert report.points_adjusted == 150 + 300 - 80
+        response = await app_client.get(
+            f"kbuddy/api/v1/point/user/{self.user_id}/balance"
+        )
+        assert response.json()["balance"] == 150 + 300 - 80
+        assert (await repair_point_balances(db_engine)).repaired == 0
+
+        await app_client.delete(f"kbuddy/api/v1/point/details/{detail_id}")
+        response = await app_client.get(
+            f"kbuddy/api/v1/point/user/{self.user_id}/balance"
+        )
+        assert response.json()["balance"] == 150 + 300
+
+    async def test_bulk_point_events_follow_balance(self, app_client: AsyncClient):
+        # given
+        events = [dict(self.event_data, amount=amount) for amount in (10, 20, 30)]
+
+        # when
+        response = await app_client.post("kbuddy/api/v1/point/events/bulk", json=events)
+        created = response.json()
+        ids = [item["id"] for item in created]
+        await app_client.put(
+            "kbuddy/api/v1/point/events/bulk",
+            json=[dict(events[0], id=ids[0], amount=15), dict(events[1], id=-1)],
+        )
+        response = await app_client.post(
+            "kbuddy/api/v1/point/events/bulk/delete", json=[ids[2]]
+        )
+        balance = await app_client.get(
+            f"kbuddy/api/v1/point/user/{self.user_id}/balance",
+            params={"verify": True},
+        )
+
+        # then
+        assert [item["status"] for item in created] == ["created"] * 3
+        assert response.json()[0]["status"] == "deleted"
+        assert balance.json()["balance"] == 100 + 15 + 20
+        assert balance.json()["consistent"] is True
+
+    async def test_point_event_writes_skip_separate_lookups(
+        self, app_client: AsyncClient, db_engine: AsyncEngine
+    ):
+        # given
+        instrument_queries(
+            db_engine, slow_query_seconds=app_settings.SLOW_QUERY_THRESHOLD_MS / 1000
+        )
+        event = PointEventUpdate(**dict(self.event_data, amount=40))
+
+        # when
+        async with AsyncSession(bind=db_engine) as db:
+            with track_queries() as update_stats:
+                updated = await update_point_event(db, self.event_id, event)
+            with track_queries() as delete_stats:
+                deleted_id = await delete_point_event(db, self.event_id)
+            missing_id = await delete_point_event(db, self.event_id)
+        balance = await app_client.get(
+            f"kbuddy/api/v1/point/user/{self.user_id}/balance",
+            params={"verify": True},
+        )
+
+        # then
+        # 수정/삭제 한 문장 + 잔액 upsert 한 문장
+        assert update_stats.count == 2
+        assert delete_stats.count == 2
+        assert updated.amount == 40
+        assert deleted_id == self.event_id
+        assert missing_id is None
+        assert balance.json()["balance"] == 0
+        assert balance.json()["consistent"] is True
+
+    async def test_expire_points_fifo(
+        self, app_client: AsyncClient, db_engine: AsyncEngine
+    ):
+        # given
+        now = datetime.utcnow()
+        event_ids = []
+        for days_ago in (3, 2):
+            event_data = dict(
+                self.event_data,
+                event_date=(now - timedelta(days=10 + days_ago)).isoformat(),
+                exp_date=(now - timedelta(days=days_ago)).isoformat(),
+            )
+            response = await app_client.post(
+                "kbuddy/api/v1/point/events", json=event_data
+            )
+            event_ids.append(response.json()["id"])
+        await app_client.post(
+            "kbuddy/api/v1/point/details",
+            json={
+                "event_id": event_ids[0],
+                "related_event_id": event_ids[0],
+                "point_date": now.isoformat(),
+                "point": 150,
+            },
+        )
+
+        # when
+        report = await expire_points(db_engine, now=now)
+        second_report = await expire_points(db_engine, now=now)
+
+        # then
+        assert report.users == 1
+        assert report.events_expired == 2
+        assert report.points_expired == 50
+        assert report.details_written == 1
+        assert second_report.events_expired == 0
+
+        response = await app_client.get(
+            f"kbuddy/api/v1/point/user/{self.user_id}/balance",
+            params={"verify": True},
+        )
+        assert response.json()["balance"] == 300 - 150 - 50
+        assert response.json()["consistent"] is True
+
+        response = await app_client.get(f"kbuddy/api/v1/point/events/{self.event_id}")
+        assert response.json()["expired_at"] is None
@@ -0,0 +1,46 @@
+# --------------------------------------------------------------------------
+# 요청 단위 SQL 통계와 slow query log의 testcase를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+import logging
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.utils.query_stats import instrument_queries
+
+from .conftest import app_settings
+
+
+class TestQueryStatsAPI:
+    async def test_debug_headers_and_slow_query_log(
+        self, debug_client: AsyncClient, db_engine: AsyncEngine, caplog
+    ):
+        # given
+        instrument_queries(db_engine, slow_query_seconds=0.0)
+        caplog.set_level(logging.WARNING)
+
+        # when
+        try:
+            response = await debug_client.get(
+                "kbuddy/api/v1/listing/", params={"limit": 7}
+            )
+        finally:
+            instrument_queries(
+                db_engine,
+                slow_query_seconds=app_settings.SLOW_QUERY_THRESHOLD_MS / 1000,
+            )
+
+        # then
+        assert response.status_code == 200
+        assert response.headers["X-DB-Query-Count"] == "1"
+        assert float(response.headers["X-DB-Query-Time-Ms"]) > 0
+        assert response.headers["X-DB-Repeated-Queries"] == "1"
+
+        slow_logs = [r.getMessage() for r in caplog.records if r.name == "src.sql.slow"]
+        assert len(slow_logs) == 1
+        assert "in GET /kbuddy/api/v1/listing/" in slow_logs[0]
+        assert "<redacted>" in slow_logs[0]
+        assert "8" not in slow_logs[0].split("parameters=")[1]
+        assert any("Possible N+1" in r.getMessage() for r in caplog.records)
@@ -0,0 +1,108 @@
+# --------------------------------------------------------------------------
+# Read replica routing의 testcase를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+import pytest_asyncio
+
+from datetime import datetime, timedelta
+from typing import AsyncIterator
+
+from asgi_lifespan import LifespanManager
+from fastapi import Request
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src import create_app
+from src.db.database import PRIMARY_HEADER, get_db, open_session
+from src.utils.metrics import DB_QUERY_DURATION, instrument_engine
+from src.utils.tour_api import get_tour_api
+
+from .conftest import app_settings, test_engine
+
+# 같은 테스트 DB를 가리키는 별도의 pool을 replica로 사용합니다.
+replica_test_engine = create_async_engine(
+    str(app_settings.DATABASE_URI), **app_settings.DATABASE_OPTIONS
+)
+
+
+async def get_routing_test_db(request: Request):
+    db = open_session(request, test_engine, replica_test_engine)
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+class TestReplicaRoutingAPI:
+    @pytest_asyncio.fixture
+    async def routing_client(self, tour_api) -> AsyncIterator[AsyncClient]:
+        app = create_app(app_settings)
+        app.dependency_overrides[get_db] = get_routing_test_db
+        app.dependency_overrides[get_tour_api] = lambda: tour_api
+
+        async with AsyncClient(
+            app=app, base_url="http://test"
+        ) as client, LifespanManager(app):
+            yield client
+
+    def query_counts(self):
+        return (
+            DB_QUERY_DURATION.count("test", "SELECT"),
+            DB_QUERY_DURATION.count("test-replica", "SELECT"),
+        )
+
+    async def test_reads_go_to_replica_and_writes_to_primary(
+        self, routing_client: AsyncClient
+    ):
+        # given
+        instrument_engine(test_engine, name="test")
+        instrument_engine(replica_test_engine, name="test-replica")
+        response = await routing_client.post(
+            "kbuddy/api/v1/user/signup",
+            json={
+                "email": "replica@example.com",
+                "password": "password123",
+                "nickname": "replica",
+                "bio": "Test bio",
+                "first_name": "Test",
+                "last_name": "User",
+            },
+        )
+        assert response.status_code == 200
+        now = datetime.utcnow()
+        listing_data = {
+            "seller_id": response.json()["id"],
+            "created_at": now.isoformat(),
+            "is_closed": False,
+            "detail": "Replica listing",
+            "seller_info": "Test seller",
+            "promotion_start": now.isoformat(),
+            "promotion_end": (now + timedelta(days=30)).isoformat(),
+            "amount": 100,
+        }
+        replica_before = self.query_counts()[1]
+        response = await routing_client.post(
+            "kbuddy/api/v1/listing/", json=listing_data
+        )
+        assert response.status_code == 200
+        listing_id = response.json()["id"]
+
+        # when
+        after_write = self.query_counts()
+        response = await routing_client.get(f"kbuddy/api/v1/listing/{listing_id}")
+        after_read = self.query_counts()
+        forced = await routing_client.get(
+            f"kbuddy/api/v1/listing/{listing_id}", headers={PRIMARY_HEADER: "1"}
+        )
+        after_forced = self.query_counts()
+
+        # then
+        assert after_write[1] == replica_before
+        assert response.status_code == 200
+        assert response.json()["detail"] == "Replica listing"
+        assert after_read[0] == after_write[0]
+        assert after_read[1] > after_write[1]
+        assert forced.status_code == 200
+        assert after_forced[0] > after_read[0]
+        assert after_forced[1] == after_read[1]
@@ -0,0 +1,43 @@
+# --------------------------------------------------------------------------
+# schema 객체 JSON 응답 직렬화(schema_response)의 testcase를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+import json
+
+from datetime import datetime, timedelta, timezone
+from typing import List
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+from src.router._response import schema_response
+from src.schemas.responses import ListingSchema
+
+
+class TestSchemaResponse:
+    def test_matches_fastapi_default_encoding(self):
+        # given: UTC, 다른 offset, naive datetime과 마이크로초를 함께 사용
+        listing = ListingSchema(
+            id=uuid4(),
+            seller_id=uuid4(),
+            created_at=datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+            is_closed=False,
+            detail="Test listing",
+            seller_info="Test seller",
+            promotion_start=datetime(
+                2024, 1, 2, 12, 0, tzinfo=timezone(timedelta(hours=9))
+            ),
+            promotion_end=datetime(2024, 2, 1, 0, 0, 0, 500),
+            amount=100,
+        )
+
+        # when
+        response = schema_response([listing], List[ListingSchema])
+
+        # then: response_model을 거친 FastAPI 기본 응답과 같은 형식
+        (data,) = json.loads(response.body)
+        assert [data] == jsonable_encoder([listing])
+        assert data["created_at"] == "2024-01-02T03:04:05.123456Z"
+        assert data["promotion_start"] == "2024-01-02T12:00:00+09:00"
+        assert data["promotion_end"] == "2024-02-01T00:00:00.000500"
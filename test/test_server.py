@@ -0,0 +1,191 @@
+# --------------------------------------------------------------------------
+# server runner(gunicorn/uvicorn) 설정의 testcase를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+import json
+import asyncio
+
+import pytest
+
+from gunicorn.util import load_class
+from pydantic import ValidationError
+from uvicorn import Config
+
+from src.core import server
+from src.core.server import (
+    KBuddyServer,
+    KBuddyUvicornServer,
+    KBuddyUvicornWorker,
+    default_workers,
+    gunicorn_options,
+    serve,
+)
+from src.core.settings import AppSettings
+from src.utils.jobs import job_registry
+from src.utils.metrics import metrics
+
+from .conftest import app_settings
+
+
+class FakeWorker:
+    def __init__(self, pid: int):
+        self.pid = pid
+
+
+class TestServer:
+    def test_gunicorn_options_follow_settings(self):
+        # given
+        tuned = app_settings.model_copy(
+            update={
+                "SERVER_WORKERS": 3,
+                "SERVER_BACKLOG": 512,
+                "SERVER_KEEPALIVE_SECONDS": 7,
+                "SERVER_GRACEFUL_TIMEOUT_SECONDS": 25,
+                "SERVER_MAX_REQUESTS": 500,
+                "SERVER_MAX_REQUESTS_JITTER": 50,
+            }
+        )
+
+        # when
+        options = gunicorn_options(tuned)
+        defaults = gunicorn_options(
+            app_settings.model_copy(update={"SERVER_WORKERS": None})
+        )
+
+        # then
+        assert options["workers"] == 3
+        assert options["backlog"] == 512
+        assert options["keepalive"] == 7
+        assert options["graceful_timeout"] == 25
+        assert options["max_requests"] == 500
+        assert options["max_requests_jitter"] == 50
+        assert "post_fork" not in options
+        assert defaults["workers"] == default_workers() >= 1
+        assert load_class(options["worker_class"]) is KBuddyUvicornWorker
+        assert KBuddyUvicornWorker.CONFIG_KWARGS["loop"] == "uvloop"
+        assert KBuddyUvicornWorker.CONFIG_KWARGS["http"] == "httptools"
+
+    def test_auth_cache_ttl_is_capped_with_multiple_workers(self):
+        # given
+        base = app_settings.model_copy(
+            update={
+                "SERVER_RELOAD": False,
+                "AUTH_CACHE_TTL_SECONDS": 60,
+                "AUTH_CACHE_MULTI_WORKER_TTL_SECONDS": 5,
+            }
+        )
+
+        # when
+        multi = base.model_copy(update={"SERVER_WORKERS": 4})
+        single = base.model_copy(update={"SERVER_WORKERS": 1})
+        reload = base.model_copy(update={"SERVER_WORKERS": 4, "SERVER_RELOAD": True})
+
+        # then
+        assert multi.AUTH_CACHE_EFFECTIVE_TTL_SECONDS == 5
+        assert single.AUTH_CACHE_EFFECTIVE_TTL_SECONDS == 60
+        assert reload.AUTH_CACHE_EFFECTIVE_TTL_SECONDS == 60
+
+    def test_job_drain_fits_in_graceful_timeout(self):
+        # given
+        tuned = app_settings.model_copy(
+            update={
+                "SERVER_GRACEFUL_TIMEOUT_SECONDS": 30,
+                "JOB_SHUTDOWN_TIMEOUT_SECONDS": 15,
+            }
+        )
+
+        # then: 요청 drain + job drain + 정리 여유가 graceful timeout을 넘지 않음
+        assert tuned.SERVER_REQUEST_DRAIN_SECONDS == 10
+        assert (
+            tuned.SERVER_REQUEST_DRAIN_SECONDS + tuned.JOB_SHUTDOWN_TIMEOUT_SECONDS
+            < tuned.SERVER_GRACEFUL_TIMEOUT_SECONDS
+        )
+
+        # when / then: job drain이 graceful timeout을 다 써 버리는 설정은 거부
+        with pytest.raises(ValidationError):
+            AppSettings(
+                _env_file=".env.test",
+                DATABASE_MIGRATION_CHECK=False,
+                SERVER_GRACEFUL_TIMEOUT_SECONDS=20,
+                JOB_SHUTDOWN_TIMEOUT_SECONDS=20,
+            )
+        with pytest.raises(ValidationError):
+            AppSettings(
+                _env_file=".env.test",
+                DATABASE_MIGRATION_CHECK=False,
+                JOB_HEARTBEAT_INTERVAL_SECONDS=60,
+                JOB_STALE_AFTER_SECONDS=30,
+            )
+
+    async def test_max_requests_waits_for_running_jobs(self, monkeypatch):
+        # given: SERVER_MAX_REQUESTS에 도달한 worker
+        uvicorn_server = KBuddyUvicornServer(Config(app=None, limit_max_requests=1))
+        uvicorn_server.server_state.total_requests = 1
+        job = asyncio.create_task(asyncio.sleep(60))
+        monkeypatch.setattr(job_registry, "_tasks", {job})
+
+        # when
+        deferred = await uvicorn_server.on_tick(1)
+        job.cancel()
+        monkeypatch.setattr(job_registry, "_tasks", set())
+        recycled = await uvicorn_server.on_tick(2)
+
+        # then: 실행 중인 작업이 있으면 교체를 미루고, 끝나면 교체
+        assert deferred is False
+        assert recycled is True
+
+    def test_serve_runs_gunicorn_with_shared_metrics_dir(self, monkeypatch, tmp_path):
+        # given
+        started = []
+        monkeypatch.setattr(KBuddyServer, "run", lambda self: started.append(self))
+        (tmp_path / "4242.json").write_text(json.dumps({"live": True, "metrics": {}}))
+        serve_settings = app_settings.model_copy(
+            update={
+                "SERVER_RELOAD": False,
+                "SERVER_WORKERS": 2,
+                "METRICS_MULTIPROCESS_DIR": str(tmp_path),
+            }
+        )
+
+        # when
+        serve(serve_settings)
+
+        # then
+        (app,) = started
+        assert app.cfg.workers == 2
+        assert app.cfg.worker_class is KBuddyUvicornWorker
+        assert app.load() == "main:app"
+
+        app.cfg.on_starting(None)
+        assert list(tmp_path.glob("*.json")) == []
+
+        try:
+            app.cfg.post_fork(None, FakeWorker(4242))
+            assert metrics.multiprocess
+            metrics.write_snapshot()
+        finally:
+            metrics._multiprocess_dir = None
+        (snapshot_path,) = tmp_path.glob("*.json")
+        snapshot = json.loads(snapshot_path.read_text())
+        assert snapshot["live"] is True
+
+        app.cfg.child_exit(None, FakeWorker(int(snapshot_path.stem)))
+        assert json.loads(snapshot_path.read_text())["live"] is False
+
+    def test_serve_reload_runs_single_uvicorn_process(self, monkeypatch):
+        # given
+        calls = []
+        monkeypatch.setattr(
+            server.uvicorn, "run", lambda app, **kwargs: calls.append((app, kwargs))
+        )
+
+        # when
+        serve(app_settings.model_copy(update={"SERVER_RELOAD": True}))
+
+        # then
+        ((app, kwargs),) = calls
+        assert app == "main:app"
+        assert kwargs["reload"] is True
+        assert kwargs["loop"] == "uvloop"
+        assert kwargs["http"] == "httptools"
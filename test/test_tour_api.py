@@ -0,0 +1,263 @@
+# --------------------------------------------------------------------------
+# Tour API upstream(HTTPTourAPIUpstream)의 testcase를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+import asyncio
+
+import httpx
+import pytest
+
+from typing import Callable, List
+
+from src.utils import tour_api as tour_api_module
+from src.utils.circuit_breaker import CircuitBreaker, CircuitState
+from src.utils.metrics import TOUR_API_CIRCUIT_REJECTED, TOUR_API_RETRIES
+from src.utils.tour_api import HTTPTourAPIUpstream, TourAPIError
+
+OPERATION = "areaCode1"
+BODY = {"response": {"body": {"items": {"item": []}}}}
+
+
+def make_upstream(
+    handler: Callable[[httpx.Request], httpx.Response], **kwargs
+) -> HTTPTourAPIUpstream:
+    return HTTPTourAPIUpstream(
+        endpoint="http://tour-api.test",
+        service_key="test-key",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+class TestHTTPTourAPIUpstream:
+    async def test_retries_with_exponential_backoff(self, monkeypatch):
+        # given: 처음 두 번은 5xx와 연결 오류, 세 번째에 성공
+        requests: List[httpx.Request] = []
+        delays: List[float] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) == 1:
+                return httpx.Response(503)
+            if len(requests) == 2:
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(200, json=BODY)
+
+        def uniform(low: float, high: float) -> float:
+            delays.append(high)
+            return 0.0
+
+        monkeypatch.setattr(tour_api_module.random, "uniform", uniform)
+        upstream = make_upstream(handler, max_retries=2, backoff=0.2)
+        retries_before = TOUR_API_RETRIES.get()
+
+        # when
+        result = await upstream.fetch(OPERATION, {"numOfRows": 10})
+        await upstream.close()
+
+        # then
+        assert result == BODY
+        assert len(requests) == 3
+        assert delays == [0.2, 0.4]
+        assert upstream.retries == 2
+        assert TOUR_API_RETRIES.get() == retries_before + 2
+        assert requests[0].url.path == f"/{OPERATION}"
+        assert requests[0].url.params["serviceKey"] == "test-key"
+        assert requests[0].url.params["numOfRows"] == "10"
+
+    async def test_gives_up_after_max_retries(self):
+        # given
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(502)
+
+        upstream = make_upstream(handler, max_retries=2, backoff=0.001)
+
+        # when
+        with pytest.raises(TourAPIError) as error:
+            await upstream.fetch(OPERATION, {})
+        await upstream.close()
+
+        # then
+        assert error.value.status_code == 502
+        assert len(requests) == 3
+        assert upstream.errors == 1
+
+    async def test_client_error_is_not_retried(self):
+        # given
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(404)
+
+        upstream = make_upstream(handler, max_retries=2)
+
+        # when
+        with pytest.raises(TourAPIError) as error:
+            await upstream.fetch(OPERATION, {})
+        await upstream.close()
+
+        # then
+        assert error.value.status_code == 404
+        assert len(requests) == 1
+        assert upstream.retries == 0
+
+    async def test_overall_deadline_stops_slow_calls(self):
+        # given: 응답이 deadline보다 늦는 upstream
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(1.0)
+            return httpx.Response(200, json=BODY)
+
+        upstream = make_upstream(handler, deadline=0.05, max_retries=2)
+
+        # when
+        with pytest.raises(TourAPIError) as error:
+            await upstream.fetch(OPERATION, {})
+        await upstream.close()
+
+        # then
+        assert error.value.status_code == 504
+        assert upstream.timeouts == 1
+        assert upstream.retries == 0
+        assert upstream.stats()["latency_p99_seconds"] < 1.0
+
+    async def test_backoff_that_would_pass_deadline_is_not_slept(self, monkeypatch):
+        # given: 다음 재시도까지 기다리면 deadline을 넘기는 경우
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(500)
+
+        monkeypatch.setattr(tour_api_module.random, "uniform", lambda low, high: 10.0)
+        upstream = make_upstream(handler, deadline=1.0, max_retries=5)
+
+        # when
+        with pytest.raises(TourAPIError) as error:
+            await upstream.fetch(OPERATION, {})
+        await upstream.close()
+
+        # then
+        assert error.value.status_code == 500
+        assert len(requests) == 1
+        assert upstream.timeouts == 0
+
+    async def test_breaker_opens_rejects_and_recovers(self):
+        # given
+        healthy = False
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if healthy:
+                return httpx.Response(200, json=BODY)
+            return httpx.Response(500)
+
+        breaker = CircuitBreaker(
+            failure_rate=0.5, window_size=2, min_calls=2, reset_timeout=0.05
+        )
+        upstream = make_upstream(handler, max_retries=0, breaker=breaker)
+        rejected_before = TOUR_API_CIRCUIT_REJECTED.get()
+
+        # when: 연속 실패로 circuit이 열림
+        for _ in range(2):
+            with pytest.raises(TourAPIError):
+                await upstream.fetch(OPERATION, {})
+
+        # then
+        assert breaker.state is CircuitState.OPEN
+        assert len(requests) == 2
+
+        # when: 열려 있는 동안에는 upstream을 호출하지 않고 거절
+        with pytest.raises(TourAPIError) as error:
+            await upstream.fetch(OPERATION, {})
+
+        # then
+        assert error.value.status_code == 503
+        assert len(requests) == 2
+        assert breaker.rejected_count == 1
+        assert TOUR_API_CIRCUIT_REJECTED.get() == rejected_before + 1
+
+        # when: reset_timeout이 지나 half-open이 되고 시험 호출이 실패
+        await asyncio.sleep(0.06)
+        assert breaker.state is CircuitState.HALF_OPEN
+        with pytest.raises(TourAPIError):
+            await upstream.fetch(OPERATION, {})
+
+        # then: 다시 열림
+        assert breaker.state is CircuitState.OPEN
+        assert len(requests) == 3
+
+        # when: 다시 half-open이 된 뒤 시험 호출이 성공
+        await asyncio.sleep(0.06)
+        healthy = True
+        result = await upstream.fetch(OPERATION, {})
+        await upstream.close()
+
+        # then: 닫힘
+        assert result == BODY
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.opened_count == 2
+        assert len(requests) == 4
+
+    async def test_half_open_allows_single_probe(self):
+        # given: half-open 상태에서 시험 호출이 진행 중
+        probe_started = asyncio.Event()
+        release_probe = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            probe_started.set()
+            await release_probe.wait()
+            return httpx.Response(200, json=BODY)
+
+        breaker = CircuitBreaker(window_size=1, min_calls=1, reset_timeout=0.0)
+        breaker.record_failure()
+        upstream = make_upstream(handler, breaker=breaker)
+        probe = asyncio.create_task(upstream.fetch(OPERATION, {}))
+        await probe_started.wait()
+
+        # when
+        with pytest.raises(TourAPIError) as error:
+            await upstream.fetch(OPERATION, {})
+        release_probe.set()
+        result = await probe
+        await upstream.close()
+
+        # then
+        assert error.value.status_code == 503
+        assert result == BODY
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_client_start_and_close(self):
+        # given
+        upstream = make_upstream(lambda request: httpx.Response(200, json=BODY))
+
+        # when
+        await upstream.start()
+        client = upstream._client
+        await upstream.start()
+
+        # then: start는 한 번만 client를 만듦
+        assert client is not None
+        assert upstream._client is client
+
+        # when
+        await upstream.close()
+
+        # then
+        assert client.is_closed
+        assert upstream._client is None
+        await upstream.close()
+
+        # when: close 이후 호출하면 새 client를 만듦
+        result = await upstream.fetch(OPERATION, {})
+
+        # then
+        assert result == BODY
+        assert upstream._client is not None
+        assert upstream._client is not client
+        await upstream.close()
@@ -0,0 +1,288 @@
+# --------------------------------------------------------------------------
+# CSV 업로드의 testcase를 정의한 모듈입니다.
+#
+# @author bnbong bbbong9@gmail.com
+# --------------------------------------------------------------------------
+import asyncio
+import tempfile
+
+import pytest
+
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.settings import settings
+from src.utils.jobs import (
+    ABANDONED_ERROR,
+    INTERRUPTED_ERROR,
+    JobRegistry,
+    JobStatus,
+    job_registry,
+)
+
+
+CSV_HEADER = "대분류,영문명,상세주소,홈페이지,연락처"
+
+
+async def upload_and_wait(app_client: AsyncClient, rows) -> dict:
+    content = "\n".join([CSV_HEADER, *rows]).encode("cp949")
+    response = await app_client.post(
+        "kbuddy/api/v1/upload-csv/file",
+        files={"file": ("areas.csv", content, "text/csv")},
+    )
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    for _ in range(300):
+        response = await app_client.get(f"kbuddy/api/v1/upload-csv/jobs/{job_id}")
+        if response.json()["status"] in ("succeeded", "failed"):
+            break
+        await asyncio.sleep(0.1)
+    return response.json()
+
+
+class TestUploadAPI:
+    async def test_reupload_is_idempotent(self, app_client: AsyncClient):
+        # given
+        rows = [
+            "자연관광지,Test Mountain,강원도 테스트시 1,http://mountain.test,033-000-0000",
+            "자연관광지,Test Beach,강원도 테스트시 2,,",
+        ]
+        first = await upload_and_wait(app_client, rows)
+
+        # when
+        same = await upload_and_wait(app_client, rows)
+        changed = await upload_and_wait(
+            app_client, [rows[0], "자연관광지,Test Beach,강원도 테스트시 3,,"]
+        )
+
+        # then
+        assert first["result"]["inserted"] == 2
+        assert (same["result"]["inserted"], same["result"]["updated"]) == (0, 0)
+        assert same["result"]["skipped"] == 2
+        assert changed["result"]["updated"] == 1
+        assert changed["result"]["skipped"] == 1
+
+        response = await app_client.get("kbuddy/api/v1/area/list")
+        addresses = {area["name"]: area["address"] for area in response.json()}
+        assert addresses == {
+            "Test Mountain": "강원도 테스트시 1",
+            "Test Beach": "강원도 테스트시 3",
+        }
+
+    async def test_reupload_keeps_open_time_set_through_api(
+        self, app_client: AsyncClient
+    ):
+        # given: CSV로 적재한 지역에 API로 open_time을 입력
+        rows = [
+            "자연관광지,Test Mountain,강원도 테스트시 1,http://mountain.test,033-000-0000"
+        ]
+        await upload_and_wait(app_client, rows)
+        response = await app_client.get("kbuddy/api/v1/area/list")
+        (area,) = response.json()
+        response = await app_client.put(
+            f"kbuddy/api/v1/area/{area['id']}",
+            json={
+                "name": area["name"],
+                "address": area["address"],
+                "website": area["website"],
+                "contact_num": area["contact_num"],
+                "open_time": "9:00 AM - 6:00 PM",
+            },
+        )
+        assert response.status_code == 200
+
+        # when
+        same = await upload_and_wait(app_client, rows)
+        changed = await upload_and_wait(
+            app_client,
+            [
+                "자연관광지,Test Mountain,강원도 테스트시 9,http://mountain.test,033-000-0000"
+            ],
+        )
+
+        # then
+        assert same["result"]["skipped"] == 1
+        assert changed["result"]["updated"] == 1
+        response = await app_client.get(f"kbuddy/api/v1/area/{area['id']}")
+        data = response.json()
+        assert data["address"] == "강원도 테스트시 9"
+        assert data["open_time"] == "9:00 AM - 6:00 PM"
+
+    async def test_upload_tourism_csv(self, app_client: AsyncClient):
+        # given
+        rows = [
+            "대분류,영문명,상세주소,홈페이지,연락처",
+            "자연관광지,Test Mountain,강원도 테스트시 1,http://mountain.test,033-000-0000",
+            "자연관광지,Test Beach,강원도 테스트시 2,,",
+            "자연관광지,Test Mountain,강원도 테스트시 1,http://mountain.test,033-000-0000",
+            f"자연관광지,{'A' * 101},강원도 테스트시 3,,",
+        ]
+        content = "\n".join(rows).encode("cp949")
+
+        # when
+        response = await app_client.post(
+            "kbuddy/api/v1/upload-csv/file",
+            files={"file": ("areas.csv", content, "text/csv")},
+        )
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+
+        for _ in range(300):
+            response = await app_client.get(f"kbuddy/api/v1/upload-csv/jobs/{job_id}")
+            if response.json()["status"] in ("succeeded", "failed"):
+                break
+            await asyncio.sleep(0.1)
+
+        # then
+        data = response.json()
+        assert data["status"] == "succeeded"
+        assert data["progress"] == 1.0
+        assert data["result"]["inserted"] == 2
+        assert data["result"]["rejected"] == 2
+
+        response = await app_client.get("kbuddy/api/v1/area/list")
+        assert len(response.json()) == 2
+
+    async def test_upload_over_size_limit_is_rejected(
+        self, app_client: AsyncClient, monkeypatch, tmp_path
+    ):
+        # given
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        monkeypatch.setattr(settings, "MAX_UPLOAD_BYTES", 64)
+        content = "\n".join(
+            [CSV_HEADER, "자연관광지,Test Mountain,강원도 테스트시 1,,"]
+        )
+
+        # when
+        response = await app_client.post(
+            "kbuddy/api/v1/upload-csv/file",
+            files={"file": ("areas.csv", content.encode("cp949") * 4, "text/csv")},
+        )
+
+        # then: 작업을 만들지 않고 받은 만큼의 임시 파일도 남기지 않음
+        assert response.status_code == 413
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_failed_submit_removes_temp_file(
+        self, app_client: AsyncClient, monkeypatch, tmp_path
+    ):
+        # given: 작업 등록(DB 기록)이 실패하는 상황
+        async def failing_submit(*args, **kwargs):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        monkeypatch.setattr(job_registry, "submit", failing_submit)
+        content = "\n".join(
+            [CSV_HEADER, "자연관광지,Test Mountain,강원도 테스트시 1,,"]
+        )
+
+        # when
+        with pytest.raises(RuntimeError):
+            await app_client.post(
+                "kbuddy/api/v1/upload-csv/file",
+                files={"file": ("areas.csv", content.encode("cp949"), "text/csv")},
+            )
+
+        # then
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_job_status_is_shared_between_workers(self, db_engine: AsyncEngine):
+        # given: 작업을 실행하는 worker와 조회만 하는 다른 worker
+        running, other_worker = JobRegistry(progress_interval=0.01), JobRegistry()
+        release = asyncio.Event()
+
+        async def runner(job):
+            job.advance("writing", processed=1, total=4)
+            await release.wait()
+            return {"inserted": 4}
+
+        # when
+        job = await running.submit(db_engine, "test", runner)
+        await asyncio.sleep(0.1)
+        in_progress = await other_worker.get(db_engine, job.id)
+        release.set()
+        await running.shutdown(timeout=5)
+        finished = await other_worker.get(db_engine, job.id)
+
+        # then
+        assert in_progress.status is JobStatus.RUNNING
+        assert in_progress.progress == 0.25
+        assert finished.status is JobStatus.SUCCEEDED
+        assert finished.result == {"inserted": 4}
+        assert finished.finished_at is not None
+        assert await other_worker.get(db_engine, "not-a-job-id") is None
+
+    async def test_shutdown_interrupts_unfinished_jobs(self, db_engine: AsyncEngine):
+        # given
+        registry = JobRegistry()
+
+        async def runner(job):
+            await asyncio.sleep(60)
+
+        job = await registry.submit(db_engine, "test", runner)
+        await asyncio.sleep(0.05)
+
+        # when
+        await registry.shutdown(timeout=0.1)
+
+        # then
+        interrupted = await registry.get(db_engine, job.id)
+        assert interrupted.status is JobStatus.FAILED
+        assert interrupted.error == INTERRUPTED_ERROR
+
+    async def test_abandoned_jobs_are_marked_failed(self, db_engine: AsyncEngine):
+        # given: heartbeat가 끊긴 작업(강제 종료된 worker)과 실행 중인 작업
+        registry = JobRegistry(stale_after=60)
+        release = asyncio.Event()
+
+        async def runner(job):
+            await release.wait()
+
+        abandoned = await registry.submit(db_engine, "test", runner)
+        alive = await registry.submit(db_engine, "test", runner)
+        await asyncio.sleep(0.05)
+        async with db_engine.begin() as conn:
+            await conn.execute(
+                text(
+                    'UPDATE "Background_Job" '
+                    "SET updated = now() - interval '2 minutes' WHERE id = :id"
+                ),
+                {"id": abandoned.id},
+            )
+
+        # when
+        swept = await registry.fail_stale(db_engine)
+
+        # then
+        assert swept == 1
+        failed = await registry.get(db_engine, abandoned.id)
+        assert failed.status is JobStatus.FAILED
+        assert failed.error == ABANDONED_ERROR
+        assert failed.finished_at is not None
+        assert (await registry.get(db_engine, alive.id)).status is JobStatus.RUNNING
+        release.set()
+        await registry.shutdown(timeout=5)
+
+    async def test_heartbeat_keeps_idle_job_alive(self, db_engine: AsyncEngine):
+        # given: 진행 상황이 바뀌지 않는 오래 걸리는 작업
+        registry = JobRegistry(
+            progress_interval=0.01, heartbeat_interval=0.05, stale_after=0.3
+        )
+        release = asyncio.Event()
+
+        async def runner(job):
+            await release.wait()
+
+        job = await registry.submit(db_engine, "test", runner)
+
+        # when: stale_after보다 오래 실행됨
+        await asyncio.sleep(0.6)
+        swept = await registry.fail_stale(db_engine)
+
+        # then
+        assert swept == 0
+        assert (await registry.get(db_engine, job.id)).status is JobStatus.RUNNING
+        release.set()
+        await registry.shutdown(timeout=5)
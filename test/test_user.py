@@ -4,10 +4,20 @@
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
 import json
+import pytest
 import pytest_asyncio
 
+from types import SimpleNamespace
+from uuid import uuid4
+
 from httpx import AsyncClient
 
+from src.helper.exceptions import ErrorCode, InternalException
+from src.utils import authentication
+from src.utils import cache as cache_module
+from src.utils.authentication import PrincipalCache
+from src.utils.query_stats import QUERY_COUNT_HEADER
+
 
 class TestUserAPI:
     @pytest_asyncio.fixture(autouse=True)
@@ -121,6 +131,70 @@ class TestUserAPI:
         assert data["bio"] == update_data["bio"]
         assert data["profile_img"] == update_data["profile_img"]
 
+    async def login(self, client: AsyncClient):
+        login_data = {"identifier": "bnbong@hanyang.ac.kr", "password": "password123"}
+        response = await client.post("kbuddy/api/v1/user/login", json=login_data)
+        assert response.status_code == 200
+        return response.cookies
+
+    async def count_authenticated_queries(self, client: AsyncClient, cookies) -> int:
+        response = await client.get("kbuddy/api/v1/itinerary/request/", cookies=cookies)
+        assert response.status_code == 200
+        return int(response.headers[QUERY_COUNT_HEADER])
+
+    async def test_cached_principal_skips_user_lookup(self, debug_client: AsyncClient):
+        # given
+        cookies = await self.login(debug_client)
+
+        # when
+        first = await self.count_authenticated_queries(debug_client, cookies)
+        second = await self.count_authenticated_queries(debug_client, cookies)
+
+        # then: 두 번째 요청은 캐시된 principal을 사용해 유저 조회 query를 건너뜀
+        assert second == first - 1
+
+    async def test_edit_user_invalidates_cached_principal(
+        self, debug_client: AsyncClient
+    ):
+        # given: 인증된 요청으로 principal이 캐시된 상태
+        cookies = await self.login(debug_client)
+        uncached = await self.count_authenticated_queries(debug_client, cookies)
+        cached = await self.count_authenticated_queries(debug_client, cookies)
+
+        # when
+        response = await debug_client.put(
+            f"kbuddy/api/v1/user/{self.user_id}",
+            json={"bio": "Updated bio"},
+            cookies=cookies,
+        )
+
+        # then: 다음 요청은 유저를 다시 조회함
+        assert response.status_code == 200
+        assert cached == uncached - 1
+        assert await self.count_authenticated_queries(debug_client, cookies) == uncached
+
+    async def test_delete_user_invalidates_cached_principal(
+        self, debug_client: AsyncClient
+    ):
+        # given: 인증된 요청으로 principal이 캐시된 상태
+        cookies = await self.login(debug_client)
+        await self.count_authenticated_queries(debug_client, cookies)
+
+        # when
+        response = await debug_client.post(
+            f"kbuddy/api/v1/user/{self.user_id}/withdraw", cookies=cookies
+        )
+
+        # then: 캐시된 principal로 탈퇴한 유저가 다시 인증되지 않음
+        assert response.status_code == 204
+        with pytest.raises(InternalException) as error:
+            await debug_client.put(
+                f"kbuddy/api/v1/user/{self.user_id}",
+                json={"bio": "Updated bio"},
+                cookies=cookies,
+            )
+        assert error.value.error_code == ErrorCode.NOT_FOUND
+
     async def test_delete_user(self, app_client: AsyncClient):
         # given
         login_data = {"identifier": "bnbong@hanyang.ac.kr", "password": "password123"}
@@ -136,3 +210,60 @@ class TestUserAPI:
 
         # then
         assert response.status_code == 204
+
+
+class TestPrincipalCache:
+    def principal(self):
+        return SimpleNamespace(id=uuid4())
+
+    def test_lru_eviction_prunes_user_index(self):
+        # given
+        cache = PrincipalCache(maxsize=2, ttl=60)
+        principals = [self.principal() for _ in range(3)]
+
+        # when
+        for number, principal in enumerate(principals):
+            cache.set(f"token-{number}", principal)
+
+        # then: 밀려난 첫 번째 유저는 인덱스에서도 사라짐
+        assert cache.get("token-0") is None
+        assert set(cache._tokens_by_user) == {str(p.id) for p in principals[1:]}
+
+    def test_expiry_prunes_user_index(self, monkeypatch):
+        # given: 캐시 TTL과 토큰 만료 시각의 기준이 되는 시계
+        now = [1000.0]
+        clock = SimpleNamespace(monotonic=lambda: now[0], time=lambda: 1_700_000_000.0)
+        monkeypatch.setattr(cache_module, "time", clock)
+        monkeypatch.setattr(authentication, "time", clock)
+        cache = PrincipalCache(maxsize=10, ttl=60)
+        principal = self.principal()
+        cache.set("live-token", principal)
+        cache.set("expiring-token", principal, expires_at=int(clock.time()) + 10)
+
+        # when: 토큰 만료 시각이 지남
+        now[0] += 11
+        expired = cache.get("expiring-token")
+        cache.set("already-expired", self.principal(), expires_at=int(clock.time()))
+
+        # then
+        assert expired is None
+        assert cache.get("live-token") is principal
+        assert cache._tokens_by_user == {str(principal.id): {"live-token"}}
+
+    def test_invalidate_user_drops_all_tokens(self):
+        # given
+        cache = PrincipalCache(maxsize=10, ttl=60)
+        principal, other = self.principal(), self.principal()
+        cache.set("token-a", principal)
+        cache.set("token-b", principal)
+        cache.set("token-c", other)
+
+        # when
+        cache.invalidate_user(principal.id)
+        cache.invalidate_token("token-c")
+
+        # then
+        assert cache.get("token-a") is None
+        assert cache.get("token-b") is None
+        assert cache.get("token-c") is None
+        assert cache._tokens_by_user == {}